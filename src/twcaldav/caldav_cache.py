@@ -0,0 +1,175 @@
+"""On-disk cache of CalDAV calendar contents and sync state."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from twcaldav.logger import get_logger
+
+
+def default_cache_path(config_path: Path | None = None) -> Path:
+    """Get the default cache file location.
+
+    Each configuration file gets its own cache, so that syncs using different
+    configurations never share cached state.
+
+    Args:
+        config_path: Path to the configuration file in use. If None, the
+            default configuration is assumed.
+
+    Returns:
+        Path to the cache file, honouring ``XDG_CACHE_HOME`` when set.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    if config_path is None:
+        return base / "twcaldav" / "caldav.json"
+    digest = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    return base / "twcaldav" / f"caldav-{digest}.json"
+
+
+class CalDAVCache:
+    """Persistent cache of raw VTODO data per calendar collection.
+
+    Each calendar entry stores the collection ctag and WebDAV sync token seen
+    when it was last fetched, together with the raw iCalendar data of every
+    object in it keyed by href. When the server reports the same ctag again,
+    the cached data can be reused as is; when only the sync token is usable,
+    the cached objects serve as the base that incremental changes are applied
+    to.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache, loading any existing cache file.
+
+        Args:
+            path: Path to the cache file. If None, uses the default location.
+        """
+        self.path = path or default_cache_path()
+        self.logger = get_logger()
+        self._lock = threading.Lock()
+        self._calendars: dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load the cache file, starting empty if it is missing or unreadable."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            calendars = data.get("calendars", {})
+            if isinstance(calendars, dict):
+                # Entries without an href-keyed object map are from an older
+                # cache format and are refetched
+                self._calendars = {
+                    url: entry
+                    for url, entry in calendars.items()
+                    if isinstance(entry, dict)
+                    and isinstance(entry.get("objects"), dict)
+                }
+            self.logger.debug(
+                f"Loaded CalDAV cache with {len(self._calendars)} calendars "
+                f"from {self.path}"
+            )
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.warning(f"Ignoring unreadable CalDAV cache {self.path}: {e}")
+            self._calendars = {}
+
+    def get(self, calendar_url: str, ctag: str | None) -> list[str] | None:
+        """Get cached objects for a calendar if its ctag is unchanged.
+
+        Args:
+            calendar_url: URL of the calendar collection.
+            ctag: Current ctag reported by the server.
+
+        Returns:
+            List of raw iCalendar strings, or None on a cache miss.
+        """
+        if not ctag:
+            return None
+        with self._lock:
+            entry = self._calendars.get(calendar_url)
+            if entry is None or entry.get("ctag") != ctag:
+                return None
+            return list(entry["objects"].values())
+
+    def get_sync_base(self, calendar_url: str) -> tuple[str, dict[str, str]] | None:
+        """Get the state that incremental changes to a calendar apply to.
+
+        Args:
+            calendar_url: URL of the calendar collection.
+
+        Returns:
+            Tuple of the sync token of the last fetch and a copy of the cached
+            objects keyed by href, or None if no sync token was recorded.
+        """
+        with self._lock:
+            entry = self._calendars.get(calendar_url)
+            if entry is None or not entry.get("sync_token"):
+                return None
+            return entry["sync_token"], dict(entry["objects"])
+
+    def put(
+        self,
+        calendar_url: str,
+        ctag: str | None,
+        objects: dict[str, str],
+        sync_token: str | None = None,
+    ) -> None:
+        """Store the objects of a calendar under its current ctag and sync token.
+
+        Args:
+            calendar_url: URL of the calendar collection.
+            ctag: Ctag reported by the server before the objects were fetched.
+            objects: Raw iCalendar strings of all objects in the calendar,
+                keyed by href.
+            sync_token: Sync token reported by the server before the objects
+                were fetched, if the server supports WebDAV sync.
+        """
+        with self._lock:
+            self._calendars[calendar_url] = {
+                "ctag": ctag,
+                "sync_token": sync_token,
+                "objects": objects,
+            }
+            self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all cached calendars."""
+        with self._lock:
+            if self._calendars:
+                self._calendars = {}
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk atomically if it changed.
+
+        Failures are logged and otherwise ignored, since the cache is only an
+        optimization.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.path.parent, prefix=".caldav-", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump({"calendars": self._calendars}, f)
+                    os.replace(tmp_name, self.path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+                self._dirty = False
+                self.logger.debug(f"Saved CalDAV cache to {self.path}")
+            except OSError as e:
+                self.logger.warning(f"Failed to save CalDAV cache {self.path}: {e}")
@@ -1,18 +1,29 @@
 """CalDAV client integration module."""
 
 import contextlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
 import caldav
+from caldav.elements import dav
+from caldav.elements.base import ValuedBaseElement
 from caldav.objects import Calendar as CalDAVCalendar
 from icalendar import Calendar, Todo
 from icalendar.cal import Component as ICalComponent
 
+from twcaldav.caldav_cache import CalDAVCache
 from twcaldav.logger import get_logger
 
 
-@dataclass
+class GetCTag(ValuedBaseElement):
+    """CalendarServer ``getctag`` property of a calendar collection."""
+
+    tag = "{http://calendarserver.org/ns/}getctag"
+
+
+@dataclass(slots=True)
 class VTodo:
     """Represents a CalDAV VTODO (task)."""
 
@@ -43,7 +54,8 @@ class VTodo:
         summary = str(todo.get("SUMMARY", ""))
 
         # Optional fields
-        status = str(todo.get("STATUS")) if todo.get("STATUS") else None
+        # Interned so status checks against literals compare by identity
+        status = sys.intern(str(todo.get("STATUS"))) if todo.get("STATUS") else None
         description = str(todo.get("DESCRIPTION")) if todo.get("DESCRIPTION") else None
 
         # Parse datetime fields
@@ -205,19 +217,28 @@ class CalDAVError(Exception):
 class CalDAVClient:
     """Interface to CalDAV server."""
 
-    def __init__(self, url: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        cache: CalDAVCache | None = None,
+    ) -> None:
         """Initialize CalDAV client.
 
         Args:
             url: CalDAV server URL.
             username: Username for authentication.
             password: Password for authentication.
+            cache: Optional ctag cache used to skip re-downloading unchanged
+                calendars.
 
         Raises:
             CalDAVError: If connection fails.
         """
         self.url = url
         self.username = username
+        self.cache = cache
         self.logger = get_logger()
 
         try:
@@ -230,6 +251,15 @@ class CalDAVClient:
         except Exception as e:
             raise CalDAVError(f"Failed to connect to CalDAV server: {e}") from e
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections to the CalDAV server.
+
+        All requests made through this client share the connection pool of
+        the underlying DAV session, so connections are set up once per sync
+        rather than once per request.
+        """
+        self.client.close()
+
     def list_calendars(self) -> list[str]:
         """List all available calendars.
 
@@ -296,25 +326,7 @@ class CalDAVClient:
         """
         try:
             calendar = self.get_calendar(calendar_id)
-            todos = calendar.todos(include_completed=True)
-
-            vtodos = []
-            for todo in todos:
-                try:
-                    # Parse the icalendar data
-                    cal = Calendar.from_ical(todo.data)
-                    for component in cal.walk():
-                        if component.name == "VTODO":
-                            vtodo = VTodo.from_icalendar(component)
-                            vtodos.append(vtodo)
-                except Exception as e:
-                    self.logger.warning(f"Failed to parse todo: {e}")
-                    continue
-
-            self.logger.debug(
-                f"Retrieved {len(vtodos)} todos from calendar ID '{calendar_id}'"
-            )
-            return vtodos
+            return self._fetch_todos(calendar, calendar_id)
         except CalDAVError:
             raise
         except Exception as e:
@@ -322,6 +334,212 @@ class CalDAVClient:
                 f"Failed to get todos from calendar ID '{calendar_id}': {e}"
             ) from e
 
+    def get_todos_multi(
+        self, calendar_ids: list[str], max_workers: int | None = None
+    ) -> dict[str, list[VTodo]]:
+        """Get all todos from several calendars, including completed ones.
+
+        Calendars are resolved with a single listing request and then queried
+        concurrently over the client's shared HTTP session.
+
+        Args:
+            calendar_ids: IDs of calendars to query. Calendars listed more than
+                once are only queried once.
+            max_workers: Maximum number of calendars queried at once. If None,
+                all calendars are queried at once.
+
+        Returns:
+            Dictionary mapping each calendar ID to its list of VTodo objects.
+
+        Raises:
+            CalDAVError: If a calendar is not found or a query fails.
+        """
+        if not calendar_ids:
+            return {}
+        calendar_ids = list(dict.fromkeys(calendar_ids))
+
+        try:
+            calendars_by_id = {cal.id: cal for cal in self.principal.calendars()}
+        except Exception as e:
+            raise CalDAVError(f"Failed to list calendars: {e}") from e
+
+        for calendar_id in calendar_ids:
+            if calendar_id not in calendars_by_id:
+                raise CalDAVError(f"Calendar not found with ID: {calendar_id}")
+
+        def fetch(calendar_id: str) -> list[VTodo]:
+            try:
+                return self._fetch_todos(calendars_by_id[calendar_id], calendar_id)
+            except Exception as e:
+                raise CalDAVError(
+                    f"Failed to get todos from calendar ID '{calendar_id}': {e}"
+                ) from e
+
+        workers = len(calendar_ids)
+        if max_workers is not None:
+            workers = max(1, min(workers, max_workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(fetch, calendar_ids)
+            return dict(zip(calendar_ids, results, strict=True))
+
+    def _fetch_todos(self, calendar: CalDAVCalendar, calendar_id: str) -> list[VTodo]:
+        """Query a calendar for all its todos and parse them.
+
+        When a cache is configured, the calendar's ctag and WebDAV sync token
+        are checked first. If the ctag is unchanged since the last fetch, the
+        cached data is used as is. Otherwise, if the server supports WebDAV
+        sync (RFC 6578), only the objects changed since the last fetch are
+        downloaded and merged into the cached data. The whole calendar is only
+        downloaded when neither is possible.
+
+        Args:
+            calendar: Calendar object to query.
+            calendar_id: ID of the calendar (for logging).
+
+        Returns:
+            List of VTodo objects (including completed todos).
+        """
+        raw_todos = None
+        if self.cache:
+            calendar_url = str(calendar.url)
+            ctag, sync_token = self._get_collection_tags(calendar)
+
+            raw_todos = self.cache.get(calendar_url, ctag)
+            if raw_todos is not None:
+                self.logger.debug(
+                    f"Calendar ID '{calendar_id}' unchanged (ctag {ctag}), "
+                    "using cached todos"
+                )
+            elif sync_token:
+                objects = self._fetch_changes(calendar, calendar_url)
+                if objects is None:
+                    objects = self._fetch_all_objects(calendar)
+                else:
+                    self.logger.debug(
+                        f"Applied incremental changes to calendar ID '{calendar_id}'"
+                    )
+                self.cache.put(calendar_url, ctag, objects, sync_token)
+                raw_todos = list(objects.values())
+            elif ctag:
+                objects = self._fetch_all_objects(calendar)
+                self.cache.put(calendar_url, ctag, objects)
+                raw_todos = list(objects.values())
+
+        if raw_todos is None:
+            raw_todos = list(self._fetch_all_objects(calendar).values())
+
+        vtodos = []
+        for data in raw_todos:
+            try:
+                # Parse the icalendar data
+                cal = Calendar.from_ical(data)
+                for component in cal.walk():
+                    if component.name == "VTODO":
+                        vtodo = VTodo.from_icalendar(component)
+                        vtodos.append(vtodo)
+            except Exception as e:
+                self.logger.warning(f"Failed to parse todo: {e}")
+                continue
+
+        self.logger.debug(
+            f"Retrieved {len(vtodos)} todos from calendar ID '{calendar_id}'"
+        )
+        return vtodos
+
+    def _fetch_all_objects(self, calendar: CalDAVCalendar) -> dict[str, str]:
+        """Download all todos of a calendar.
+
+        Args:
+            calendar: Calendar object to query.
+
+        Returns:
+            Dictionary mapping object hrefs to raw iCalendar strings.
+        """
+        objects = {}
+        for todo in calendar.todos(include_completed=True):
+            data = todo.data
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            objects[str(todo.url)] = data
+        return objects
+
+    def _fetch_changes(
+        self, calendar: CalDAVCalendar, calendar_url: str
+    ) -> dict[str, str] | None:
+        """Apply the changes since the last fetch to the cached objects.
+
+        Issues a WebDAV sync-collection REPORT with the sync token recorded by
+        the last fetch and downloads only the objects it reports as changed.
+
+        Args:
+            calendar: Calendar object to query.
+            calendar_url: URL of the calendar collection.
+
+        Returns:
+            Dictionary mapping object hrefs to raw iCalendar strings, or None
+            if there is no usable base state or the server rejected the sync
+            token, in which case the whole calendar must be downloaded.
+        """
+        assert self.cache is not None
+        base = self.cache.get_sync_base(calendar_url)
+        if base is None:
+            return None
+        sync_token, objects = base
+
+        try:
+            changes = calendar.objects_by_sync_token(
+                sync_token=sync_token, load_objects=True
+            )
+        except Exception as e:
+            self.logger.debug(f"Sync-collection report failed for {calendar_url}: {e}")
+            return None
+
+        # caldav emulates sync tokens on servers without WebDAV sync by
+        # returning every object, which does not report deletions
+        new_token = getattr(changes, "sync_token", None)
+        if not isinstance(new_token, str) or new_token.startswith("fake-"):
+            return None
+
+        for obj in changes:
+            href = str(obj.url)
+            data = obj.data
+            if not data:
+                # Objects that could not be loaded were deleted
+                objects.pop(href, None)
+                continue
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            objects[href] = data
+        return objects
+
+    def _get_collection_tags(
+        self, calendar: CalDAVCalendar
+    ) -> tuple[str | None, str | None]:
+        """Get the ctag and WebDAV sync token of a calendar collection.
+
+        Both properties are requested with a single PROPFIND.
+
+        Args:
+            calendar: Calendar object to query.
+
+        Returns:
+            Tuple of the ctag and sync token, each None if the server does not
+            provide it.
+        """
+        try:
+            props = calendar.get_properties([GetCTag(), dav.SyncToken()])
+        except Exception as e:
+            self.logger.debug(
+                f"Failed to get collection tags for calendar {calendar.url}: {e}"
+            )
+            return None, None
+        ctag = props.get(GetCTag.tag)
+        sync_token = props.get(dav.SyncToken.tag)
+        return (
+            str(ctag) if ctag else None,
+            str(sync_token) if sync_token else None,
+        )
+
     def create_todo(self, calendar_id: str, vtodo: VTodo) -> None:
         """Create a new todo in a calendar.
 
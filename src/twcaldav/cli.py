@@ -69,6 +69,11 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Disable deletion of tasks (overrides config setting)",
     )
+    sync_parser.add_argument(
+        "--force-full",
+        action="store_true",
+        help="Ignore the CalDAV cache and re-download all calendars",
+    )
 
     # Unlink subcommand
     unlink_parser = subparsers.add_parser(
@@ -158,6 +163,7 @@ def cmd_sync(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for failure).
     """
+    from .caldav_cache import CalDAVCache, default_cache_path
     from .caldav_client import CalDAVClient
     from .config import Config
     from .logger import setup_logger
@@ -221,11 +227,17 @@ def cmd_sync(args: argparse.Namespace) -> int:
             )
             return 1
 
+        cache = CalDAVCache(default_cache_path(args.config))
+        if args.force_full:
+            logger.info("Full fetch requested, ignoring CalDAV cache")
+            cache.clear()
+
         logger.debug("Connecting to CalDAV server")
         caldav_client = CalDAVClient(
             url=config.caldav.url,
             username=config.caldav.username,
             password=config.caldav.password,
+            cache=cache,
         )
     except Exception as e:
         logger.error(f"Failed to initialize clients: {e}")
@@ -244,6 +256,7 @@ def cmd_sync(args: argparse.Namespace) -> int:
     try:
         logger.info("Starting synchronization")
         stats = sync_engine.sync()
+        cache.save()
 
         # Display results
         logger.info("Synchronization completed")
@@ -261,6 +274,9 @@ def cmd_sync(args: argparse.Namespace) -> int:
         logger.debug("Exception details:", exc_info=True)
         return 1
 
+    finally:
+        caldav_client.close()
+
 
 def cmd_unlink(args: argparse.Namespace) -> int:
     """Execute the unlink command.
@@ -342,13 +358,15 @@ def cmd_unlink(args: argparse.Namespace) -> int:
                 logger.info("Unlink cancelled by user")
                 return 0
 
-        # Remove caldav_uid from each task
+        # Remove caldav_uid from all tasks in one batch
         if not args.dry_run:
-            for task in tasks:
-                task_id = task.uuid
-                logger.debug(f"Removing caldav_uid from task {task_id}")
-                tw.modify_task(task_id, {"caldav_uid": ""})
-            logger.info(f"Successfully unlinked {len(tasks)} task(s)")
+            missing = tw.modify_tasks(
+                {task.uuid: {"caldav_uid": None} for task in tasks}
+            )
+            logger.info(f"Successfully unlinked {len(tasks) - len(missing)} task(s)")
+            if missing:
+                logger.error(f"Failed to unlink {len(missing)} task(s): not found")
+                return 1
         else:
             logger.info(f"Would unlink {len(tasks)} task(s)")
 
@@ -28,6 +28,7 @@ class SyncConfig:
     """Synchronization behavior configuration."""
 
     delete_tasks: bool = False
+    concurrency: int = 8
 
 
 @dataclass
@@ -119,7 +120,18 @@ class Config:
 
         # Parse sync config (optional)
         sync_data = data.get("sync", {})
-        sync = SyncConfig(delete_tasks=sync_data.get("delete_tasks", False))
+        concurrency = sync_data.get("concurrency", SyncConfig.concurrency)
+        if (
+            not isinstance(concurrency, int)
+            or isinstance(concurrency, bool)
+            or concurrency < 1
+        ):
+            raise ValueError("'concurrency' in [sync] must be a positive integer")
+
+        sync = SyncConfig(
+            delete_tasks=sync_data.get("delete_tasks", False),
+            concurrency=concurrency,
+        )
 
         return cls(caldav=caldav, mappings=mappings, sync=sync)
 
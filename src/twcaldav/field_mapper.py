@@ -6,6 +6,9 @@ from uuid import uuid4
 from twcaldav.caldav_client import VTodo
 from twcaldav.taskwarrior import Task
 
+# Separates the user description from annotations in a CalDAV DESCRIPTION
+ANNOTATIONS_MARKER = "--- TaskWarrior Annotations ---"
+
 
 def _annotation_fingerprint(annotation: dict) -> str:
     """Create unique fingerprint for annotation deduplication.
@@ -204,7 +207,7 @@ def _format_description_with_annotations(task: Task) -> str | None:
     if not task.annotations:
         return None
 
-    lines = ["--- TaskWarrior Annotations ---"]
+    lines = [ANNOTATIONS_MARKER]
 
     for annotation in task.annotations:
         entry = annotation.get("entry", "")
@@ -257,13 +260,12 @@ def _parse_description_for_annotations(
         return "", None
 
     # Check for annotation marker
-    marker = "--- TaskWarrior Annotations ---"
-    if marker not in description:
+    if ANNOTATIONS_MARKER not in description:
         # No annotations, return as-is
         return description, None
 
     # Split on marker
-    parts = description.split(marker)
+    parts = description.split(ANNOTATIONS_MARKER)
     user_desc = parts[0].strip()
 
     # Parse annotations
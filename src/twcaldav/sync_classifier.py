@@ -1,5 +1,8 @@
 """Task classification logic for synchronization."""
 
+import logging
+from functools import partial
+
 from twcaldav.caldav_client import VTodo
 from twcaldav.config import Config
 from twcaldav.logger import get_logger
@@ -33,13 +36,7 @@ class SyncClassifier:
         """
         # Both missing - should not happen
         if tw_task is None and caldav_todo is None:
-            return TaskPair(
-                tw_task=None,
-                caldav_todo=None,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="Both tasks missing",
-            )
+            return TaskPair(None, None, SyncAction.SKIP, None, "Both tasks missing")
 
         # Only TaskWarrior task exists
         if tw_task and not caldav_todo:
@@ -54,104 +51,77 @@ class SyncClassifier:
         return self._handle_both_exist(tw_task, caldav_todo)
 
     def _handle_tw_only(self, tw_task: Task) -> TaskPair:
+        make = partial(TaskPair, tw_task, None)
         if tw_task.status == "deleted":
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=None,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="TaskWarrior task deleted, no CalDAV todo to remove",
+            return make(
+                SyncAction.SKIP,
+                None,
+                "TaskWarrior task deleted, no CalDAV todo to remove",
             )
 
         # Check if TW task has caldav_uid - if so, CalDAV todo was deleted
         if tw_task.caldav_uid:
             if self.config.sync.delete_tasks:
-                return TaskPair(
-                    tw_task=tw_task,
-                    caldav_todo=None,
-                    action=SyncAction.DELETE,
-                    direction=SyncDirection.CALDAV_TO_TW,
-                    reason="CalDAV todo deleted externally",
+                return make(
+                    SyncAction.DELETE,
+                    SyncDirection.CALDAV_TO_TW,
+                    "CalDAV todo deleted externally",
                 )
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=None,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="CalDAV todo deleted externally, but deletion disabled",
+            return make(
+                SyncAction.SKIP,
+                None,
+                "CalDAV todo deleted externally, but deletion disabled",
             )
 
         # New TaskWarrior task without caldav_uid
-        return TaskPair(
-            tw_task=tw_task,
-            caldav_todo=None,
-            action=SyncAction.CREATE,
-            direction=SyncDirection.TW_TO_CALDAV,
-            reason="New TaskWarrior task",
+        return make(
+            SyncAction.CREATE, SyncDirection.TW_TO_CALDAV, "New TaskWarrior task"
         )
 
     def _handle_caldav_only(self, caldav_todo: VTodo) -> TaskPair:
+        make = partial(TaskPair, None, caldav_todo)
         if caldav_todo.status == "CANCELLED":
-            return TaskPair(
-                tw_task=None,
-                caldav_todo=caldav_todo,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="CalDAV todo cancelled, no TaskWarrior task to remove",
+            return make(
+                SyncAction.SKIP,
+                None,
+                "CalDAV todo cancelled, no TaskWarrior task to remove",
             )
-        return TaskPair(
-            tw_task=None,
-            caldav_todo=caldav_todo,
-            action=SyncAction.CREATE,
-            direction=SyncDirection.CALDAV_TO_TW,
-            reason="New CalDAV todo",
-        )
+        return make(SyncAction.CREATE, SyncDirection.CALDAV_TO_TW, "New CalDAV todo")
 
     def _handle_both_exist(self, tw_task: Task, caldav_todo: VTodo) -> TaskPair:
-        # Handle deletion
-        if tw_task.status == "deleted" and caldav_todo.status != "CANCELLED":
-            if self.config.sync.delete_tasks:
-                return TaskPair(
-                    tw_task=tw_task,
-                    caldav_todo=caldav_todo,
-                    action=SyncAction.DELETE,
-                    direction=SyncDirection.TW_TO_CALDAV,
-                    reason="TaskWarrior task deleted",
+        make = partial(TaskPair, tw_task, caldav_todo)
+
+        # Handle deletion: dispatch once on both sides' deletion state
+        tw_deleted = tw_task.status == "deleted"
+        caldav_cancelled = caldav_todo.status == "CANCELLED"
+        delete_tasks = bool(self.config.sync.delete_tasks)
+        match (tw_deleted, caldav_cancelled, delete_tasks):
+            case (True, True, _):
+                return make(SyncAction.SKIP, None, "Both deleted")
+            case (True, False, True):
+                return make(
+                    SyncAction.DELETE,
+                    SyncDirection.TW_TO_CALDAV,
+                    "TaskWarrior task deleted",
                 )
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.UPDATE,
-                direction=SyncDirection.TW_TO_CALDAV,
-                reason="TaskWarrior task deleted, setting CalDAV to CANCELLED",
-            )
-
-        if caldav_todo.status == "CANCELLED" and tw_task.status != "deleted":
-            if self.config.sync.delete_tasks:
-                return TaskPair(
-                    tw_task=tw_task,
-                    caldav_todo=caldav_todo,
-                    action=SyncAction.DELETE,
-                    direction=SyncDirection.CALDAV_TO_TW,
-                    reason="CalDAV todo cancelled",
+            case (True, False, False):
+                return make(
+                    SyncAction.UPDATE,
+                    SyncDirection.TW_TO_CALDAV,
+                    "TaskWarrior task deleted, setting CalDAV to CANCELLED",
+                )
+            case (False, True, True):
+                return make(
+                    SyncAction.DELETE,
+                    SyncDirection.CALDAV_TO_TW,
+                    "CalDAV todo cancelled",
+                )
+            case (False, True, False):
+                return make(
+                    SyncAction.SKIP,
+                    None,
+                    "CalDAV todo cancelled, but deletion disabled",
                 )
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="CalDAV todo cancelled, but deletion disabled",
-            )
-
-        # Both deleted/cancelled - skip
-        if tw_task.status == "deleted" and caldav_todo.status == "CANCELLED":
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="Both deleted",
-            )
 
         # Check content first, then use timestamps for conflict resolution
         # Step 1: Compare actual content (not timestamps)
@@ -160,86 +130,67 @@ class SyncClassifier:
         if content_equal:
             # Content is identical - no update needed regardless of timestamps
             # This prevents spurious updates due to TW's import behavior
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.SKIP,
-                direction=None,
-                reason="No changes (content identical)",
-            )
+            return make(SyncAction.SKIP, None, "No changes (content identical)")
 
         # Step 2: Content differs - use Last Write Wins for conflict resolution
-        self.logger.debug(
-            f"Content differs between TW:{tw_task.uuid} and CD:{caldav_todo.uid}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"Content differs between TW:{tw_task.uuid} and CD:{caldav_todo.uid}"
+            )
 
         return self._resolve_conflict(tw_task, caldav_todo)
 
     def _resolve_conflict(self, tw_task: Task, caldav_todo: VTodo) -> TaskPair:
+        make = partial(TaskPair, tw_task, caldav_todo)
         tw_modified = tw_task.modified or tw_task.entry
         caldav_modified = caldav_todo.last_modified or caldav_todo.created
 
         if tw_modified is None and caldav_modified is None:
             # No timestamps but content differs - prefer TaskWarrior
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.UPDATE,
-                direction=SyncDirection.TW_TO_CALDAV,
-                reason="Content differs, no timestamps (preferring TW)",
+            return make(
+                SyncAction.UPDATE,
+                SyncDirection.TW_TO_CALDAV,
+                "Content differs, no timestamps (preferring TW)",
             )
 
         if tw_modified is None:
             # Only CalDAV has timestamp - update TaskWarrior
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.UPDATE,
-                direction=SyncDirection.CALDAV_TO_TW,
-                reason="Content differs, CalDAV more recent (TW has no timestamp)",
+            return make(
+                SyncAction.UPDATE,
+                SyncDirection.CALDAV_TO_TW,
+                "Content differs, CalDAV more recent (TW has no timestamp)",
             )
 
         if caldav_modified is None:
             # Only TaskWarrior has timestamp - update CalDAV
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.UPDATE,
-                direction=SyncDirection.TW_TO_CALDAV,
-                reason="Content differs, TaskWarrior more recent (CD has no timestamp)",
+            return make(
+                SyncAction.UPDATE,
+                SyncDirection.TW_TO_CALDAV,
+                "Content differs, TaskWarrior more recent (CD has no timestamp)",
             )
 
         # Both have timestamps - compare (Last Write Wins)
-        # Make timezone-naive for comparison
-        tw_timestamp = (
-            tw_modified.replace(tzinfo=None) if tw_modified.tzinfo else tw_modified
-        )
-        caldav_timestamp = (
-            caldav_modified.replace(tzinfo=None)
-            if caldav_modified.tzinfo
-            else caldav_modified
-        )
+        # Make timezone-naive for comparison (a no-op for naive datetimes)
+        tw_timestamp = tw_modified.replace(tzinfo=None)
+        caldav_timestamp = caldav_modified.replace(tzinfo=None)
 
         # Log timestamp comparisons for debugging
-        time_diff = abs((tw_timestamp - caldav_timestamp).total_seconds())
-        self.logger.debug(
-            f"Timestamp comparison - TW:{tw_timestamp.isoformat()} "
-            f"CD:{caldav_timestamp.isoformat()} "
-            f"diff:{time_diff}s"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            time_diff = abs((tw_timestamp - caldav_timestamp).total_seconds())
+            self.logger.debug(
+                f"Timestamp comparison - TW:{tw_timestamp.isoformat()} "
+                f"CD:{caldav_timestamp.isoformat()} "
+                f"diff:{time_diff}s"
+            )
 
         if tw_timestamp > caldav_timestamp:
-            return TaskPair(
-                tw_task=tw_task,
-                caldav_todo=caldav_todo,
-                action=SyncAction.UPDATE,
-                direction=SyncDirection.TW_TO_CALDAV,
-                reason="Content differs, TaskWarrior more recent",
+            return make(
+                SyncAction.UPDATE,
+                SyncDirection.TW_TO_CALDAV,
+                "Content differs, TaskWarrior more recent",
             )
-        return TaskPair(
-            tw_task=tw_task,
-            caldav_todo=caldav_todo,
-            action=SyncAction.UPDATE,
-            direction=SyncDirection.CALDAV_TO_TW,
-            reason="Content differs, CalDAV more recent",
+        return make(
+            SyncAction.UPDATE,
+            SyncDirection.CALDAV_TO_TW,
+            "Content differs, CalDAV more recent",
         )
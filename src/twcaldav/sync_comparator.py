@@ -1,5 +1,7 @@
 """Task comparison logic for synchronization."""
 
+import logging
+
 from twcaldav.caldav_client import VTodo
 from twcaldav.logger import get_logger
 from twcaldav.taskwarrior import Task
@@ -95,7 +97,7 @@ class TaskComparator:
                     )
                     return False
             # If only one side has the timestamp, log but don't treat as difference
-            elif tw_end != cd_completed:
+            elif tw_end != cd_completed and self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     f"Ignoring end/completed mismatch (missing timestamp): "
                     f"TW:{tw_end} vs CD:{cd_completed}"
@@ -1,5 +1,9 @@
 """Synchronization engine for TaskWarrior and CalDAV."""
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from twcaldav.caldav_client import CalDAVClient, VTodo
 from twcaldav.config import Config
 from twcaldav.field_mapper import caldav_to_taskwarrior, taskwarrior_to_caldav
@@ -9,6 +13,10 @@ from twcaldav.sync_comparator import TaskComparator
 from twcaldav.sync_types import SyncAction, SyncDirection, SyncStats, TaskPair
 from twcaldav.taskwarrior import Task, TaskWarrior
 
+# TaskWarrior filter selecting tasks relevant to sync: everything except
+# deleted tasks that were never linked to a CalDAV todo
+EXPORT_FILTER = ["(", "status.not:deleted", "or", "caldav_uid.any:", ")"]
+
 
 class SyncEngine:
     """Synchronization engine for TaskWarrior and CalDAV."""
@@ -37,6 +45,32 @@ class SyncEngine:
         self.caldav_uid_to_calendar: dict[
             str, str
         ] = {}  # Maps CalDAV UID to calendar ID
+        self._tw_lock = threading.Lock()  # Serializes TaskWarrior subprocess calls
+        self._stats_lock = threading.Lock()  # Guards stats updates from workers
+        self._pending_lock = threading.Lock()  # Guards the batches queued below
+        # caldav_uid writebacks (TW UUID -> CalDAV UID) applied in one batch
+        self._pending_caldav_uids: dict[str, str] = {}
+        # Tasks created or updated from CalDAV, imported in one batch, with
+        # the stats counter to increment once each is imported
+        self._pending_imports: list[tuple[Task, str]] = []
+        # UUIDs of tasks deleted because of CalDAV, deleted in one batch
+        self._pending_deletes: list[str] = []
+
+        # Precompute project <-> calendar lookups used once per task pair.
+        # Built in reverse so the first matching mapping wins, as in Config.
+        self._project_to_calendar = {
+            m.taskwarrior_project: m.caldav_calendar for m in reversed(config.mappings)
+        }
+        self._calendar_to_project = {
+            m.caldav_calendar: m.taskwarrior_project for m in reversed(config.mappings)
+        }
+
+        # Handlers for the non-SKIP actions, looked up once per task pair
+        self._action_handlers = {
+            SyncAction.CREATE: self._execute_create,
+            SyncAction.UPDATE: self._execute_update,
+            SyncAction.DELETE: self._execute_delete,
+        }
 
         # Initialize helpers
         self.comparator = TaskComparator()
@@ -55,13 +89,13 @@ class SyncEngine:
         try:
             # Discovery phase
             task_pairs = self._discover_and_correlate()
+            pairs_by_action = self._partition_by_action(task_pairs)
 
             # Log sync plan summary
-            self._log_sync_plan(task_pairs)
+            self._log_sync_plan(pairs_by_action)
 
-            # Classify and execute sync actions
-            for pair in task_pairs:
-                self._execute_sync_action(pair)
+            # Execute sync actions
+            self._execute_sync_actions(pairs_by_action)
 
             self.logger.info("Synchronization complete")
             self.logger.info(str(self.stats))
@@ -81,54 +115,44 @@ class SyncEngine:
         """
         self.logger.debug("Discovering tasks...")
 
-        # Collect all tasks from TaskWarrior in mapped projects
-        tw_tasks: dict[str, Task] = {}
-        caldav_uid_to_tw_task: dict[str, Task] = {}  # Map CalDAV UID to TW task
-
-        for mapping in self.config.mappings:
-            project = mapping.taskwarrior_project
-            self.logger.debug(f"Loading TaskWarrior tasks from project: {project}")
-
-            # Export all tasks for this project (all statuses including deleted)
-            # We need deleted tasks to detect deletions and sync them to CalDAV
-            tasks = self.tw.export_tasks(project=project)
-            for task in tasks:
-                tw_tasks[task.uuid] = task
-                # Build mapping from CalDAV UID to TW task (including deleted ones)
-                if task.caldav_uid:
-                    caldav_uid_to_tw_task[task.caldav_uid] = task
-
-        # Count tasks by status for clearer logging
-        deleted_without_caldav = sum(
-            1 for t in tw_tasks.values() if t.status == "deleted" and not t.caldav_uid
-        )
-        active_count = len(tw_tasks) - deleted_without_caldav
-
-        if deleted_without_caldav > 0:
-            self.logger.info(
-                f"Found {len(tw_tasks)} TaskWarrior tasks in mapped projects "
-                f"({active_count} active, {deleted_without_caldav} deleted "
-                f"without CalDAV link)"
+        mappings = self.config.mappings
+        concurrency = self.config.sync.concurrency
+        # A calendar shared by several mappings is only fetched once
+        calendar_ids = list(dict.fromkeys(m.caldav_calendar for m in mappings))
+
+        # Fetch from TaskWarrior and CalDAV concurrently; both are I/O-bound.
+        # All mapped projects are exported with one TaskWarrior invocation,
+        # while the CalDAV calendars are fetched in parallel.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tw_future = executor.submit(
+                self._export_mapped_tasks,
+                list(dict.fromkeys(m.taskwarrior_project for m in mappings)),
             )
-        else:
-            self.logger.info(
-                f"Found {len(tw_tasks)} TaskWarrior tasks in mapped projects"
+            caldav_future = executor.submit(
+                self.caldav.get_todos_multi,
+                calendar_ids,
+                max_workers=concurrency,
             )
+            tw_results = tw_future.result()
+            caldav_results = caldav_future.result()
+
+        # Collect all tasks from TaskWarrior in mapped projects
+        tw_tasks: dict[str, Task] = {task.uuid: task for task in tw_results}
+
+        self.logger.info(f"Found {len(tw_tasks)} TaskWarrior tasks in mapped projects")
 
         # Collect all VTODOs from CalDAV in mapped calendars
-        caldav_todos: dict[str, VTodo] = {}
-        caldav_uid_to_calendar: dict[str, str] = {}  # Map CalDAV UID to calendar ID
-
-        for mapping in self.config.mappings:
-            calendar_id = mapping.caldav_calendar
-            self.logger.debug(f"Loading CalDAV todos from calendar ID: {calendar_id}")
-            todos = self.caldav.get_todos(calendar_id)
-
-            for todo in todos:
-                caldav_todos[todo.uid] = todo
-                caldav_uid_to_calendar[todo.uid] = (
-                    calendar_id  # Store which calendar this todo is from
-                )
+        caldav_todos: dict[str, VTodo] = {
+            todo.uid: todo
+            for calendar_id in calendar_ids
+            for todo in caldav_results[calendar_id]
+        }
+        # Map CalDAV UID to the calendar ID the todo is from
+        caldav_uid_to_calendar: dict[str, str] = {
+            todo.uid: calendar_id
+            for calendar_id in calendar_ids
+            for todo in caldav_results[calendar_id]
+        }
 
         self.logger.info(f"Found {len(caldav_todos)} CalDAV todos in mapped calendars")
 
@@ -138,107 +162,333 @@ class SyncEngine:
         # Correlate tasks and classify actions
         task_pairs = []
 
-        # Process TaskWarrior tasks
-        processed_caldav_uids: set[str] = set()
-        for _tw_uuid, tw_task in tw_tasks.items():
+        # Process TaskWarrior tasks. Paired todos are removed from an
+        # insertion-ordered copy, which leaves exactly the uncorrelated ones.
+        unmatched_caldav_todos = dict(caldav_todos)
+        for tw_task in tw_tasks.values():
             # Look for corresponding CalDAV todo via UDA
-            caldav_todo = None
-            if tw_task.caldav_uid:
-                caldav_todo = caldav_todos.get(tw_task.caldav_uid)
-                if caldav_todo:
-                    processed_caldav_uids.add(caldav_todo.uid)
-
-            pair = self.classifier.classify(tw_task, caldav_todo)
-            task_pairs.append(pair)
-
-        # Process CalDAV todos that don't have TaskWarrior counterparts
-        for caldav_uid, caldav_todo in caldav_todos.items():
-            # Skip if already processed via TaskWarrior UDA
-            if caldav_uid in processed_caldav_uids:
-                continue
-
-            # Check if there's a TaskWarrior task that references this CalDAV UID
-            # This handles the case where CalDAV todo exists but wasn't found in the
-            # first loop
-            tw_task = caldav_uid_to_tw_task.get(caldav_uid)
-            if tw_task:
-                # Found correlation - this CalDAV todo belongs to a TaskWarrior task
-                pair = self.classifier.classify(tw_task, caldav_todo)
-            else:
-                # No TaskWarrior task references this CalDAV todo
-                pair = self.classifier.classify(None, caldav_todo)
-            task_pairs.append(pair)
+            caldav_todo = (
+                caldav_todos.get(tw_task.caldav_uid) if tw_task.caldav_uid else None
+            )
+            if caldav_todo is not None:
+                unmatched_caldav_todos.pop(caldav_todo.uid, None)
+            task_pairs.append(self.classifier.classify(tw_task, caldav_todo))
+
+        # Process CalDAV todos that don't have TaskWarrior counterparts. Every
+        # TaskWarrior task referencing a known CalDAV UID was paired above, so
+        # the remaining todos are uncorrelated by construction.
+        task_pairs.extend(
+            self.classifier.classify(None, caldav_todo)
+            for caldav_todo in unmatched_caldav_todos.values()
+        )
 
         return task_pairs
 
-    def _log_sync_plan(self, task_pairs: list[TaskPair]) -> None:
-        """Log a summary of planned sync actions.
+    def _export_mapped_tasks(self, projects: list[str]) -> list[Task]:
+        """Export all tasks of the mapped TaskWarrior projects.
+
+        Args:
+            projects: TaskWarrior project names.
+
+        Returns:
+            List of tasks in the projects, including deleted tasks that are
+            linked to a CalDAV todo.
+        """
+        if not projects:
+            return []
+
+        self.logger.debug(f"Loading TaskWarrior tasks from projects: {projects}")
+
+        # We need deleted tasks to detect deletions and sync them to CalDAV, but
+        # only those linked to a CalDAV todo; let TaskWarrior drop the rest.
+        # The task binary works on shared data files, so never run it concurrently.
+        with self._tw_lock:
+            return self.tw.export_tasks(projects=projects, filter_args=EXPORT_FILTER)
+
+    @staticmethod
+    def _partition_by_action(
+        task_pairs: list[TaskPair],
+    ) -> dict[SyncAction, list[TaskPair]]:
+        """Group classified task pairs by their sync action.
 
         Args:
             task_pairs: List of classified task pairs.
+
+        Returns:
+            Dictionary mapping every sync action to its task pairs.
         """
-        # Count actions by type
-        create_count = sum(1 for p in task_pairs if p.action == SyncAction.CREATE)
-        update_count = sum(1 for p in task_pairs if p.action == SyncAction.UPDATE)
-        delete_count = sum(1 for p in task_pairs if p.action == SyncAction.DELETE)
-        skip_count = sum(1 for p in task_pairs if p.action == SyncAction.SKIP)
+        pairs_by_action: dict[SyncAction, list[TaskPair]] = {
+            action: [] for action in SyncAction
+        }
+        for pair in task_pairs:
+            pairs_by_action[pair.action].append(pair)
+        return pairs_by_action
+
+    def _log_sync_plan(self, pairs_by_action: dict[SyncAction, list[TaskPair]]) -> None:
+        """Log a summary of planned sync actions.
 
+        Args:
+            pairs_by_action: Classified task pairs grouped by sync action.
+        """
         # Count skip reasons for more detail
         skip_reasons: dict[str, int] = {}
-        for pair in task_pairs:
-            if pair.action == SyncAction.SKIP:
-                reason = pair.reason
-                skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+        for pair in pairs_by_action[SyncAction.SKIP]:
+            skip_reasons[pair.reason] = skip_reasons.get(pair.reason, 0) + 1
 
         # Build sync plan message
-        plan_parts = []
-        if create_count > 0:
-            plan_parts.append(f"{create_count} create")
-        if update_count > 0:
-            plan_parts.append(f"{update_count} update")
-        if delete_count > 0:
-            plan_parts.append(f"{delete_count} delete")
-        if skip_count > 0:
-            plan_parts.append(f"{skip_count} skip")
+        plan_parts = [
+            f"{len(pairs_by_action[action])} {action.value}"
+            for action in (
+                SyncAction.CREATE,
+                SyncAction.UPDATE,
+                SyncAction.DELETE,
+                SyncAction.SKIP,
+            )
+            if pairs_by_action[action]
+        ]
 
         if plan_parts:
             self.logger.info(f"Sync plan: {', '.join(plan_parts)}")
 
         # Log skip reason breakdown at debug level
-        if skip_reasons:
-            for reason, count in sorted(skip_reasons.items()):
-                self.logger.debug(f"  Skip reason: {reason} ({count})")
+        for reason, count in sorted(skip_reasons.items()):
+            self.logger.debug(f"  Skip reason: {reason} ({count})")
+
+    def _execute_sync_actions(
+        self, pairs_by_action: dict[SyncAction, list[TaskPair]]
+    ) -> None:
+        """Execute the sync actions for all task pairs.
+
+        Skipped pairs are only counted. TaskWarrior changes caused by CalDAV
+        (imports of created or updated tasks, deletions) and the CalDAV UIDs
+        of newly created todos are applied in batches afterwards, even if
+        executing the actions was interrupted.
+
+        Args:
+            pairs_by_action: Classified task pairs grouped by sync action.
+        """
+        skipped = pairs_by_action[SyncAction.SKIP]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for pair in skipped:
+                self.logger.debug(f"Skipping: {pair.reason} - {self._describe(pair)}")
+        self.stats.skipped += len(skipped)
+
+        try:
+            self._run_sync_actions(
+                pairs_by_action[SyncAction.CREATE]
+                + pairs_by_action[SyncAction.UPDATE]
+                + pairs_by_action[SyncAction.DELETE]
+            )
+        finally:
+            # Each flush handles its own errors, so all of them always run
+            self._flush_task_imports()
+            self._flush_task_deletes()
+            self._flush_caldav_uid_writebacks()
+
+    def _run_sync_actions(self, task_pairs: list[TaskPair]) -> None:
+        """Run the sync actions for all task pairs.
+
+        Pairs are independent once classified, so their actions run on a
+        bounded thread pool. Pairs touching the same CalDAV todo are executed
+        in order by a single worker. Dry runs make no requests and stay
+        sequential.
+
+        Args:
+            task_pairs: List of classified task pairs.
+        """
+        concurrency = self.config.sync.concurrency
+        if self.dry_run or concurrency <= 1:
+            for pair in task_pairs:
+                self._execute_sync_action(pair)
+            return
+
+        groups: dict[str, list[TaskPair]] = {}
+        for pair in task_pairs:
+            groups.setdefault(self._pair_key(pair), []).append(pair)
+
+        if not groups:
+            return
+
+        def execute_group(pairs: list[TaskPair]) -> None:
+            for pair in pairs:
+                self._execute_sync_action(pair)
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(groups))) as executor:
+            # Consume the results so unexpected worker exceptions propagate
+            list(executor.map(execute_group, groups.values()))
+
+    def _flush_task_imports(self) -> None:
+        """Import the tasks created or updated from CalDAV into TaskWarrior.
+
+        All pending tasks are imported with a single TaskWarrior invocation
+        instead of one per task. If the batch fails, the tasks are imported one
+        at a time, so a single bad task only fails its own import. Tasks are
+        counted once they are imported.
+        """
+        pending = self._pending_imports
+        if not pending:
+            return
+        self._pending_imports = []
+
+        try:
+            with self._tw_lock:
+                self.tw.import_tasks([task for task, _ in pending])
+            imported = pending
+        except Exception as e:
+            if len(pending) == 1:
+                self.logger.error(f"Failed to import task into TaskWarrior: {e}")
+                self.stats.errors += 1
+                return
+            self.logger.warning(
+                f"Failed to import {len(pending)} tasks into TaskWarrior, "
+                f"retrying one at a time: {e}"
+            )
+            imported = []
+            for task, stat in pending:
+                try:
+                    with self._tw_lock:
+                        self.tw.import_tasks([task])
+                    imported.append((task, stat))
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to import task {task.uuid} into TaskWarrior: {e}"
+                    )
+                    self.stats.errors += 1
+
+        for _, stat in imported:
+            self._count(stat)
+
+    def _flush_task_deletes(self) -> None:
+        """Delete the tasks whose CalDAV todos were deleted from TaskWarrior.
+
+        All pending deletions are applied with a single TaskWarrior invocation
+        instead of one per task. If the batch fails, for instance because one
+        of the tasks is already gone, the tasks are deleted one at a time.
+        Tasks are counted once they are deleted.
+        """
+        pending = self._pending_deletes
+        if not pending:
+            return
+        self._pending_deletes = []
+
+        try:
+            with self._tw_lock:
+                self.tw.delete_tasks(pending)
+            deleted = len(pending)
+        except Exception as e:
+            if len(pending) == 1:
+                self.logger.error(f"Failed to delete TaskWarrior task: {e}")
+                self.stats.errors += 1
+                return
+            self.logger.warning(
+                f"Failed to delete {len(pending)} TaskWarrior tasks, "
+                f"retrying one at a time: {e}"
+            )
+            deleted = 0
+            for uuid in pending:
+                try:
+                    with self._tw_lock:
+                        self.tw.delete_tasks([uuid])
+                    deleted += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to delete TaskWarrior task {uuid}: {e}")
+                    self.stats.errors += 1
+
+        self.stats.tw_deleted += deleted
+
+    def _flush_caldav_uid_writebacks(self) -> None:
+        """Store the CalDAV UIDs of newly created todos in TaskWarrior.
+
+        All pending writebacks are applied with a single batch modification
+        instead of one TaskWarrior invocation per created todo. A created todo
+        is counted once its UID is stored; todos whose task could not be
+        updated are counted as errors instead.
+        """
+        pending = self._pending_caldav_uids
+        if not pending:
+            return
+        self._pending_caldav_uids = {}
+
+        try:
+            with self._tw_lock:
+                missing = self.tw.modify_tasks(
+                    {uuid: {"caldav_uid": uid} for uuid, uid in pending.items()}
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to set caldav_uid on {len(pending)} TaskWarrior tasks: {e}"
+            )
+            self.stats.errors += len(pending)
+            return
+
+        for uuid in missing:
+            self.logger.error(
+                f"Failed to set caldav_uid {pending[uuid]} on TaskWarrior task "
+                f"{uuid}: task not found"
+            )
+        self.logger.debug(f"Set caldav_uid UDA on {len(pending) - len(missing)} tasks")
+        self.stats.caldav_created += len(pending) - len(missing)
+        self.stats.errors += len(missing)
+
+    @staticmethod
+    def _pair_key(pair: TaskPair) -> str:
+        """Get the key identifying the CalDAV todo a task pair operates on.
+
+        Args:
+            pair: Task pair.
+
+        Returns:
+            CalDAV UID of the pair, or the TaskWarrior UUID for unlinked tasks.
+        """
+        if pair.caldav_todo:
+            return pair.caldav_todo.uid
+        assert pair.tw_task is not None
+        return pair.tw_task.caldav_uid or pair.tw_task.uuid
+
+    @staticmethod
+    def _describe(pair: TaskPair) -> str:
+        """Describe the tasks of a pair for log messages.
+
+        Args:
+            pair: Task pair.
+
+        Returns:
+            String identifying the TaskWarrior task and CalDAV todo.
+        """
+        return (
+            f"TW:{pair.tw_task.uuid if pair.tw_task else 'None'} / "
+            f"CD:{pair.caldav_todo.uid if pair.caldav_todo else 'None'}"
+        )
+
+    def _count(self, stat: str) -> None:
+        """Increment a sync statistic.
+
+        Args:
+            stat: Name of the SyncStats counter to increment.
+        """
+        with self._stats_lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
 
     def _execute_sync_action(self, pair: TaskPair) -> None:
         """Execute the sync action for a task pair.
 
+        Skipped pairs never get here; ``_execute_sync_actions`` counts them.
+
         Args:
             pair: Task pair with classified action.
         """
-        if pair.action == SyncAction.SKIP:
-            self.logger.debug(
-                f"Skipping: {pair.reason} - "
-                f"TW:{pair.tw_task.uuid if pair.tw_task else 'None'} / "
-                f"CD:{pair.caldav_todo.uid if pair.caldav_todo else 'None'}"
-            )
-            self.stats.skipped += 1
+        action = pair.action
+        handler = self._action_handlers.get(action)
+        if handler is None:
             return
 
         try:
-            if pair.action == SyncAction.CREATE:
-                self._execute_create(pair)
-            elif pair.action == SyncAction.UPDATE:
-                self._execute_update(pair)
-            elif pair.action == SyncAction.DELETE:
-                self._execute_delete(pair)
-
+            handler(pair)
         except Exception as e:
             self.logger.error(
-                f"Error executing {pair.action.value} for "
-                f"TW:{pair.tw_task.uuid if pair.tw_task else 'None'} / "
-                f"CD:{pair.caldav_todo.uid if pair.caldav_todo else 'None'}: {e}"
+                f"Error executing {action.value} for {self._describe(pair)}: {e}"
             )
-            self.stats.errors += 1
+            self._count("errors")
 
     def _execute_create(self, pair: TaskPair) -> None:
         """Execute create action.
@@ -247,56 +497,63 @@ class SyncEngine:
             pair: Task pair with CREATE action.
         """
         if pair.direction == SyncDirection.TW_TO_CALDAV:
-            assert pair.tw_task is not None
+            tw_task = pair.tw_task
+            assert tw_task is not None
             self.logger.info(
-                f"Creating CalDAV todo from TaskWarrior task: {pair.tw_task.uuid}"
+                f"Creating CalDAV todo from TaskWarrior task: {tw_task.uuid}"
             )
 
             if not self.dry_run:
-                # Convert TaskWarrior task to CalDAV todo
-                vtodo = taskwarrior_to_caldav(pair.tw_task)
-
                 # Get the calendar for this task's project
-                calendar_name = self.config.get_calendar_for_project(
-                    pair.tw_task.project or ""
-                )
+                calendar_name = self._project_to_calendar.get(tw_task.project or "")
                 if not calendar_name:
                     self.logger.warning(
-                        f"No calendar mapping for project: {pair.tw_task.project}"
+                        f"No calendar mapping for project: {tw_task.project}"
                     )
-                    self.stats.skipped += 1
+                    self._count("skipped")
                     return
 
+                # Convert TaskWarrior task to CalDAV todo
+                vtodo = pair.converted_vtodo
+                if vtodo is None:
+                    vtodo = pair.converted_vtodo = taskwarrior_to_caldav(tw_task)
+
                 self.caldav.create_todo(calendar_name, vtodo)
 
-                # Update TaskWarrior task with CalDAV UID
-                self.tw.modify_task(pair.tw_task.uuid, {"caldav_uid": vtodo.uid})
-                self.logger.debug(
-                    f"Set caldav_uid UDA to {vtodo.uid} on task {pair.tw_task.uuid}"
-                )
+                # Queue the CalDAV UID for the TaskWarrior task; all writebacks
+                # are applied and counted together once every action has run
+                with self._pending_lock:
+                    self._pending_caldav_uids[tw_task.uuid] = vtodo.uid
+                return
 
-            self.stats.caldav_created += 1
+            self._count("caldav_created")
 
         elif pair.direction == SyncDirection.CALDAV_TO_TW:
-            assert pair.caldav_todo is not None
+            caldav_todo = pair.caldav_todo
+            assert caldav_todo is not None
             self.logger.info(
-                f"Creating TaskWarrior task from CalDAV todo: {pair.caldav_todo.uid}"
+                f"Creating TaskWarrior task from CalDAV todo: {caldav_todo.uid}"
             )
 
             if not self.dry_run:
                 # Convert CalDAV todo to TaskWarrior task
-                task = caldav_to_taskwarrior(pair.caldav_todo)
+                task = pair.converted_task
+                if task is None:
+                    task = pair.converted_task = caldav_to_taskwarrior(caldav_todo)
 
                 # Set the project based on which calendar this todo came from
-                calendar_id = self.caldav_uid_to_calendar.get(pair.caldav_todo.uid)
+                calendar_id = self.caldav_uid_to_calendar.get(caldav_todo.uid)
                 if calendar_id:
-                    project = self.config.get_project_for_calendar(calendar_id)
+                    project = self._calendar_to_project.get(calendar_id)
                     if project:
                         task.project = project
 
-                self.tw.create_task(task)
+                # Queued, imported and counted together once every action has run
+                with self._pending_lock:
+                    self._pending_imports.append((task, "tw_created"))
+                return
 
-            self.stats.tw_created += 1
+            self._count("tw_created")
 
     def _execute_update(self, pair: TaskPair) -> None:
         """Execute update action.
@@ -304,68 +561,71 @@ class SyncEngine:
         Args:
             pair: Task pair with UPDATE action.
         """
-        assert pair.tw_task is not None and pair.caldav_todo is not None
+        tw_task, caldav_todo = pair.tw_task, pair.caldav_todo
+        assert tw_task is not None and caldav_todo is not None
 
         if pair.direction == SyncDirection.TW_TO_CALDAV:
             # Check if this is a "set CANCELLED" update (TW deleted, delete_tasks=false)
-            if pair.tw_task.status == "deleted":
+            if tw_task.status == "deleted":
                 self._execute_cancel_caldav(pair)
                 return
 
-            self.logger.info(
-                f"Updating CalDAV todo from TaskWarrior: {pair.tw_task.uuid}"
-            )
+            self.logger.info(f"Updating CalDAV todo from TaskWarrior: {tw_task.uuid}")
 
             if not self.dry_run:
-                # Convert TaskWarrior task to CalDAV todo (preserving UID)
-                vtodo = taskwarrior_to_caldav(pair.tw_task)
-                vtodo.uid = pair.caldav_todo.uid  # Preserve CalDAV UID
-
                 # Get the calendar
-                calendar_name = self.config.get_calendar_for_project(
-                    pair.tw_task.project or ""
-                )
+                calendar_name = self._project_to_calendar.get(tw_task.project or "")
                 if not calendar_name:
                     self.logger.warning(
-                        f"No calendar mapping for project: {pair.tw_task.project}"
+                        f"No calendar mapping for project: {tw_task.project}"
                     )
-                    self.stats.skipped += 1
+                    self._count("skipped")
                     return
 
+                # Convert TaskWarrior task to CalDAV todo (preserving UID)
+                vtodo = pair.converted_vtodo
+                if vtodo is None:
+                    vtodo = pair.converted_vtodo = taskwarrior_to_caldav(tw_task)
+                vtodo.uid = caldav_todo.uid  # Preserve CalDAV UID
+
                 self.caldav.update_todo(calendar_name, vtodo)
 
-            self.stats.caldav_updated += 1
+            self._count("caldav_updated")
 
         elif pair.direction == SyncDirection.CALDAV_TO_TW:
             self.logger.info(
-                f"Updating TaskWarrior task from CalDAV: {pair.caldav_todo.uid}"
+                f"Updating TaskWarrior task from CalDAV: {caldav_todo.uid}"
             )
 
             if not self.dry_run:
                 # Convert CalDAV todo to TaskWarrior task (preserving UUID)
                 # Pass existing task to enable annotation deduplication
-                task = caldav_to_taskwarrior(
-                    pair.caldav_todo, existing_task=pair.tw_task
-                )
-                task.uuid = pair.tw_task.uuid  # Preserve TaskWarrior UUID
-                task.entry = pair.tw_task.entry  # Preserve entry timestamp
+                task = pair.converted_task
+                if task is None:
+                    task = pair.converted_task = caldav_to_taskwarrior(
+                        caldav_todo, existing_task=tw_task
+                    )
+                task.uuid = tw_task.uuid  # Preserve TaskWarrior UUID
+                task.entry = tw_task.entry  # Preserve entry timestamp
 
                 # Set the project based on which calendar this todo came from
-                calendar_id = self.caldav_uid_to_calendar.get(pair.caldav_todo.uid)
+                calendar_id = self.caldav_uid_to_calendar.get(caldav_todo.uid)
                 if calendar_id:
-                    project = self.config.get_project_for_calendar(calendar_id)
+                    project = self._calendar_to_project.get(calendar_id)
                     if project:
                         task.project = project
 
                 # Ensure caldav_uid is set
                 if not task.caldav_uid:
-                    task.caldav_uid = pair.caldav_todo.uid
+                    task.caldav_uid = caldav_todo.uid
 
-                # Use import_tasks to update - this properly handles all fields
+                # Queue for import_tasks - this properly handles all fields
                 # including annotations, unlike modify_task
-                self.tw.import_tasks([task])
+                with self._pending_lock:
+                    self._pending_imports.append((task, "tw_updated"))
+                return
 
-            self.stats.tw_updated += 1
+            self._count("tw_updated")
 
     def _execute_cancel_caldav(self, pair: TaskPair) -> None:
         """Execute cancel action on CalDAV todo (soft delete).
@@ -376,27 +636,26 @@ class SyncEngine:
         Args:
             pair: Task pair with UPDATE action (TW deleted → CalDAV CANCELLED).
         """
-        assert pair.tw_task is not None and pair.caldav_todo is not None
+        tw_task, caldav_todo = pair.tw_task, pair.caldav_todo
+        assert tw_task is not None and caldav_todo is not None
 
         self.logger.info(
-            f"Cancelling CalDAV todo (TaskWarrior task deleted): {pair.caldav_todo.uid}"
+            f"Cancelling CalDAV todo (TaskWarrior task deleted): {caldav_todo.uid}"
         )
 
         if not self.dry_run:
             # Get the calendar
-            calendar_name = self.config.get_calendar_for_project(
-                pair.tw_task.project or ""
-            )
+            calendar_name = self._project_to_calendar.get(tw_task.project or "")
             if not calendar_name:
                 self.logger.warning(
-                    f"No calendar mapping for project: {pair.tw_task.project}"
+                    f"No calendar mapping for project: {tw_task.project}"
                 )
-                self.stats.skipped += 1
+                self._count("skipped")
                 return
 
-            self.caldav.cancel_todo(calendar_name, pair.caldav_todo.uid)
+            self.caldav.cancel_todo(calendar_name, caldav_todo.uid)
 
-        self.stats.caldav_updated += 1
+        self._count("caldav_updated")
 
     def _execute_delete(self, pair: TaskPair) -> None:
         """Execute delete action.
@@ -404,46 +663,44 @@ class SyncEngine:
         Args:
             pair: Task pair with DELETE action.
         """
-        assert pair.tw_task is not None  # TW task must always exist for DELETE
+        tw_task, caldav_todo = pair.tw_task, pair.caldav_todo
+        assert tw_task is not None  # TW task must always exist for DELETE
 
         if pair.direction == SyncDirection.TW_TO_CALDAV:
-            assert (
-                pair.caldav_todo is not None
-            )  # CalDAV todo must exist for TW→CalDAV delete
+            # CalDAV todo must exist for TW→CalDAV delete
+            assert caldav_todo is not None
             self.logger.info(
-                f"Deleting CalDAV todo (TaskWarrior task deleted): "
-                f"{pair.caldav_todo.uid}"
+                f"Deleting CalDAV todo (TaskWarrior task deleted): {caldav_todo.uid}"
             )
 
             if not self.dry_run:
                 # Get the calendar
-                calendar_name = self.config.get_calendar_for_project(
-                    pair.tw_task.project or ""
-                )
+                calendar_name = self._project_to_calendar.get(tw_task.project or "")
                 if not calendar_name:
                     self.logger.warning(
-                        f"No calendar mapping for project: {pair.tw_task.project}"
+                        f"No calendar mapping for project: {tw_task.project}"
                     )
-                    self.stats.skipped += 1
+                    self._count("skipped")
                     return
 
-                self.caldav.delete_todo(calendar_name, pair.caldav_todo.uid)
+                self.caldav.delete_todo(calendar_name, caldav_todo.uid)
 
-            self.stats.caldav_deleted += 1
+            self._count("caldav_deleted")
 
         elif pair.direction == SyncDirection.CALDAV_TO_TW:
             # CalDAV todo may be None if it was deleted externally (not just cancelled)
             caldav_info = (
-                f" (caldav_uid: {pair.tw_task.caldav_uid})"
-                if pair.tw_task.caldav_uid
-                else ""
+                f" (caldav_uid: {tw_task.caldav_uid})" if tw_task.caldav_uid else ""
             )
             self.logger.info(
                 f"Deleting TaskWarrior task (CalDAV todo deleted){caldav_info}: "
-                f"{pair.tw_task.uuid}"
+                f"{tw_task.uuid}"
             )
 
             if not self.dry_run:
-                self.tw.delete_task(pair.tw_task.uuid)
+                # Queued, deleted and counted together once every action has run
+                with self._pending_lock:
+                    self._pending_deletes.append(tw_task.uuid)
+                return
 
-            self.stats.tw_deleted += 1
+            self._count("tw_deleted")
@@ -23,7 +23,7 @@ class SyncDirection(Enum):
     CALDAV_TO_TW = "caldav_to_tw"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskPair:
     """Represents a pair of related tasks from TaskWarrior and CalDAV."""
 
@@ -32,9 +32,13 @@ class TaskPair:
     action: SyncAction
     direction: SyncDirection | None
     reason: str
+    # Conversion results, kept so re-executing a pair reuses them (and the UID
+    # generated for a new CalDAV todo)
+    converted_vtodo: VTodo | None = None
+    converted_task: Task | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncStats:
     """Statistics for a sync operation."""
 
@@ -49,17 +53,12 @@ class SyncStats:
 
     def __str__(self) -> str:
         """Format sync statistics for display."""
-        lines = [
-            "Sync Statistics:",
-            (
-                f"  TaskWarrior: {self.tw_created} created, "
-                f"{self.tw_updated} updated, {self.tw_deleted} deleted"
-            ),
-            (
-                f"  CalDAV: {self.caldav_created} created, "
-                f"{self.caldav_updated} updated, {self.caldav_deleted} deleted"
-            ),
-            f"  Skipped: {self.skipped}",
-            f"  Errors: {self.errors}",
-        ]
-        return "\n".join(lines)
+        return (
+            "Sync Statistics:\n"
+            f"  TaskWarrior: {self.tw_created} created, "
+            f"{self.tw_updated} updated, {self.tw_deleted} deleted\n"
+            f"  CalDAV: {self.caldav_created} created, "
+            f"{self.caldav_updated} updated, {self.caldav_deleted} deleted\n"
+            f"  Skipped: {self.skipped}\n"
+            f"  Errors: {self.errors}"
+        )
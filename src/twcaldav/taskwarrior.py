@@ -1,16 +1,64 @@
 """TaskWarrior integration module."""
 
+import codecs
 import json
+import logging
+import os
 import subprocess
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from twcaldav.logger import get_logger
 
+# Compact separators for JSON piped to ``task import``
+_JSON_SEPARATORS = (",", ":")
 
-@dataclass
+# Size of the chunks read from streamed command output
+_READ_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime(value: str) -> datetime:
+    """Parse a TaskWarrior timestamp.
+
+    Timestamps repeat a lot across an export (tasks added or modified
+    together share them), and datetimes are immutable, so parsed values are
+    cached.
+
+    Args:
+        value: Timestamp in TaskWarrior's ISO 8601 format.
+
+    Returns:
+        Parsed datetime.
+    """
+    return datetime.fromisoformat(value)
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime as a TaskWarrior timestamp.
+
+    Equivalent to ``strftime("%Y%m%dT%H%M%SZ")``, but avoids the locale-aware
+    formatting machinery, which is measurably slower for bulk imports.
+
+    Args:
+        value: Datetime to format.
+
+    Returns:
+        Timestamp in TaskWarrior's compact ISO 8601 format.
+    """
+    return (
+        f"{value.year:04d}{value.month:02d}{value.day:02d}"
+        f"T{value.hour:02d}{value.minute:02d}{value.second:02d}Z"
+    )
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a TaskWarrior task."""
 
@@ -40,27 +88,28 @@ class Task:
             Task instance.
         """
         # Parse timestamps
-        entry = datetime.fromisoformat(data["entry"])
+        entry = _parse_datetime(data["entry"])
         modified = None
         if "modified" in data:
-            modified = datetime.fromisoformat(data["modified"])
+            modified = _parse_datetime(data["modified"])
         due = None
         if "due" in data:
-            due = datetime.fromisoformat(data["due"])
+            due = _parse_datetime(data["due"])
         scheduled = None
         if "scheduled" in data:
-            scheduled = datetime.fromisoformat(data["scheduled"])
+            scheduled = _parse_datetime(data["scheduled"])
         wait = None
         if "wait" in data:
-            wait = datetime.fromisoformat(data["wait"])
+            wait = _parse_datetime(data["wait"])
         end = None
         if "end" in data:
-            end = datetime.fromisoformat(data["end"])
+            end = _parse_datetime(data["end"])
 
         return cls(
             uuid=data["uuid"],
             description=data["description"],
-            status=data["status"],
+            # Interned so status checks against literals compare by identity
+            status=sys.intern(data["status"]),
             entry=entry,
             modified=modified,
             project=data.get("project"),
@@ -84,21 +133,21 @@ class Task:
             "uuid": self.uuid,
             "description": self.description,
             "status": self.status,
-            "entry": self.entry.strftime("%Y%m%dT%H%M%SZ"),
+            "entry": _format_datetime(self.entry),
         }
 
         if self.modified:
-            data["modified"] = self.modified.strftime("%Y%m%dT%H%M%SZ")
+            data["modified"] = _format_datetime(self.modified)
         if self.project:
             data["project"] = self.project
         if self.due:
-            data["due"] = self.due.strftime("%Y%m%dT%H%M%SZ")
+            data["due"] = _format_datetime(self.due)
         if self.scheduled:
-            data["scheduled"] = self.scheduled.strftime("%Y%m%dT%H%M%SZ")
+            data["scheduled"] = _format_datetime(self.scheduled)
         if self.wait:
-            data["wait"] = self.wait.strftime("%Y%m%dT%H%M%SZ")
+            data["wait"] = _format_datetime(self.wait)
         if self.end:
-            data["end"] = self.end.strftime("%Y%m%dT%H%M%SZ")
+            data["end"] = _format_datetime(self.end)
         if self.priority:
             data["priority"] = self.priority
         if self.tags:
@@ -111,6 +160,112 @@ class Task:
         return data
 
 
+def _iter_json_objects(text: str) -> Iterator[Any]:
+    """Decode the elements of a JSON array one at a time.
+
+    Also accepts a bare sequence of objects, as produced by ``task export``
+    with ``rc.json.array=off``.
+
+    Args:
+        text: JSON text to decode.
+
+    Yields:
+        Decoded array elements.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON.
+    """
+    return _iter_json_stream([text])
+
+
+def _iter_json_stream(chunks: Iterable[str]) -> Iterator[Any]:
+    """Decode the elements of a JSON array arriving in chunks of text.
+
+    Only the undecoded tail of the input is buffered, so elements can be
+    consumed while the rest of the array is still being read. Like
+    ``_iter_json_objects``, a bare sequence of objects is also accepted.
+    The chunks are always read to the end, or closed if decoding stops
+    early, so errors raised by their producer are never lost.
+
+    Args:
+        chunks: Consecutive pieces of the JSON text.
+
+    Yields:
+        Decoded array elements.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    chunk_iter = iter(chunks)
+    buf = ""
+    idx = 0
+    eof = False
+    in_array: bool | None = None
+
+    try:
+        while True:
+            end = len(buf)
+            while idx < end and buf[idx] in " \t\r\n,":
+                idx += 1
+
+            if idx < end:
+                if in_array is None:
+                    in_array = buf[idx] == "["
+                    if in_array:
+                        idx += 1
+                    continue
+                if in_array and buf[idx] == "]":
+                    # Read the rest of the input, so a streamed command runs
+                    # to completion and can report its exit status
+                    for _ in chunk_iter:
+                        pass
+                    return
+                try:
+                    obj, next_idx = decoder.raw_decode(buf, idx)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A scalar ending at the buffer end may continue in the next
+                    # chunk; objects, arrays and strings are self-delimiting
+                    if next_idx < end or eof or buf[next_idx - 1] in '}]"':
+                        idx = next_idx
+                        yield obj
+                        continue
+            elif eof:
+                if in_array:
+                    raise json.JSONDecodeError("Unterminated array", buf, idx)
+                return
+
+            # Nothing more can be decoded from the buffer; read the next chunk
+            chunk = next(chunk_iter, None)
+            if chunk is None:
+                eof = True
+            else:
+                buf = buf[idx:] + chunk
+                idx = 0
+    finally:
+        # Stop a command whose output is abandoned early, e.g. on a parse error
+        close = getattr(chunk_iter, "close", None)
+        if close is not None:
+            close()
+
+
+def _decode_output(data: bytes | None) -> str:
+    """Decode output captured from a TaskWarrior command.
+
+    Args:
+        data: Captured output.
+
+    Returns:
+        Output as text; TaskWarrior always writes UTF-8.
+    """
+    if not data:
+        return ""
+    return data.decode("utf-8", errors="replace")
+
+
 class TaskWarriorError(Exception):
     """Exception raised for TaskWarrior-related errors."""
 
@@ -157,8 +312,107 @@ class TaskWarrior:
         Raises:
             TaskWarriorError: If command fails.
         """
-        import os
+        cmd, env = self._prepare_command(args, check_binary)
 
+        # Pipe raw bytes and decode the output once: text mode would decode
+        # with the locale encoding and then make extra passes over the whole
+        # output to translate newlines, which matters for large exports.
+        # Without input, stdin is closed so that an unexpected confirmation
+        # prompt fails instead of waiting on a terminal the user cannot see.
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                input=input_data.encode("utf-8") if input_data is not None else None,
+                stdin=subprocess.DEVNULL if input_data is None else None,
+                env=env,
+                check=True,
+            )
+            return _decode_output(result.stdout)
+        except subprocess.CalledProcessError as e:
+            stderr = _decode_output(e.stderr)
+            stdout = _decode_output(e.stdout)
+            if not check_binary:
+                error_msg = f"TaskWarrior command failed with exit code {e.returncode}"
+                if stderr:
+                    error_msg += f"\nSTDERR: {stderr}"
+                if stdout:
+                    error_msg += f"\nSTDOUT: {stdout}"
+                if input_data:
+                    error_msg += (
+                        f"\nINPUT DATA: {input_data[:500]}..."  # First 500 chars
+                    )
+                self.logger.error(error_msg)
+            raise TaskWarriorError(
+                f"TaskWarrior command failed: {stderr or stdout}"
+            ) from e
+        except FileNotFoundError as e:
+            raise TaskWarriorError(
+                f"TaskWarrior binary not found: {self.task_bin}"
+            ) from e
+
+    def _stream_command(self, args: list[str]) -> Iterator[str]:
+        """Run a TaskWarrior command, yielding its output as it is produced.
+
+        Unlike ``_run_command``, the output is never held in memory at once.
+
+        Args:
+            args: Command arguments (without 'task' prefix).
+
+        Yields:
+            Consecutive chunks of the command output (stdout).
+
+        Raises:
+            TaskWarriorError: If command fails.
+        """
+        cmd, env = self._prepare_command(args, check_binary=False)
+
+        # stderr goes to a file so a chatty command cannot block on a full
+        # pipe while stdout is being read
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=stderr_file, env=env
+                )
+            except FileNotFoundError as e:
+                raise TaskWarriorError(
+                    f"TaskWarrior binary not found: {self.task_bin}"
+                ) from e
+
+            with proc:
+                assert proc.stdout is not None
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                while chunk := proc.stdout.read(_READ_SIZE):
+                    yield decoder.decode(chunk)
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+                returncode = proc.wait()
+
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = _decode_output(stderr_file.read())
+                error_msg = f"TaskWarrior command failed with exit code {returncode}"
+                if stderr:
+                    error_msg += f"\nSTDERR: {stderr}"
+                self.logger.error(error_msg)
+                raise TaskWarriorError(
+                    f"TaskWarrior command failed: {stderr or f'exit code {returncode}'}"
+                )
+
+    def _prepare_command(
+        self, args: list[str], check_binary: bool = False
+    ) -> tuple[list[str], dict[str, str] | None]:
+        """Build the command line and environment for a TaskWarrior command.
+
+        Args:
+            args: Command arguments (without 'task' prefix).
+            check_binary: Whether this is being called to check binary existence.
+
+        Returns:
+            Tuple of the full command and the environment to run it with (None
+            to inherit the current one).
+        """
         # Determine taskdata location from self.taskdata or TASKDATA env var
         taskdata_path = None
         if self.taskdata:
@@ -180,44 +434,17 @@ class TaskWarrior:
             env = os.environ.copy()
             env["TASKDATA"] = taskdata_path
 
-        if not check_binary:
+        if not check_binary and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Running TaskWarrior command: {' '.join(cmd)}")
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                input=input_data,
-                env=env,
-                check=True,
-            )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            if not check_binary:
-                error_msg = f"TaskWarrior command failed with exit code {e.returncode}"
-                if e.stderr:
-                    error_msg += f"\nSTDERR: {e.stderr}"
-                if e.stdout:
-                    error_msg += f"\nSTDOUT: {e.stdout}"
-                if input_data:
-                    error_msg += (
-                        f"\nINPUT DATA: {input_data[:500]}..."  # First 500 chars
-                    )
-                self.logger.error(error_msg)
-            raise TaskWarriorError(
-                f"TaskWarrior command failed: {e.stderr or e.stdout}"
-            ) from e
-        except FileNotFoundError as e:
-            raise TaskWarriorError(
-                f"TaskWarrior binary not found: {self.task_bin}"
-            ) from e
+        return cmd, env
 
     def export_tasks(
         self,
         filter_args: list[str] | None = None,
         status: str | None = None,
         project: str | None = None,
+        projects: list[str] | None = None,
     ) -> list[Task]:
         """Export tasks from TaskWarrior.
 
@@ -225,10 +452,42 @@ class TaskWarrior:
             filter_args: Additional filter arguments for task command.
             status: Filter by status (pending, completed, deleted, etc.).
             project: Filter by project name.
+            projects: Filter by any of several project names, with a single
+                export.
 
         Returns:
             List of Task objects.
 
+        Raises:
+            TaskWarriorError: If export fails.
+        """
+        tasks = list(self.iter_export_tasks(filter_args, status, project, projects))
+        self.logger.debug(f"Exported {len(tasks)} tasks")
+        return tasks
+
+    def iter_export_tasks(
+        self,
+        filter_args: list[str] | None = None,
+        status: str | None = None,
+        project: str | None = None,
+        projects: list[str] | None = None,
+    ) -> Iterator[Task]:
+        """Export tasks from TaskWarrior one at a time.
+
+        The export output is read and decoded element by element while the
+        command runs, so neither the whole output nor the whole decoded array
+        is ever held in memory.
+
+        Args:
+            filter_args: Additional filter arguments for task command.
+            status: Filter by status (pending, completed, deleted, etc.).
+            project: Filter by project name.
+            projects: Filter by any of several project names, with a single
+                export.
+
+        Yields:
+            Task objects.
+
         Raises:
             TaskWarriorError: If export fails.
         """
@@ -238,6 +497,16 @@ class TaskWarrior:
             cmd_args.append(f"status:{status}")
         if project:
             cmd_args.append(f"project:{project}")
+        if projects:
+            if len(projects) == 1:
+                cmd_args.append(f"project:{projects[0]}")
+            else:
+                cmd_args.append("(")
+                for i, name in enumerate(projects):
+                    if i:
+                        cmd_args.append("or")
+                    cmd_args.append(f"project:{name}")
+                cmd_args.append(")")
         if filter_args:
             cmd_args.extend(filter_args)
 
@@ -245,17 +514,9 @@ class TaskWarrior:
 
         self.logger.debug(f"Exporting tasks with filters: {cmd_args}")
 
-        output = self._run_command(cmd_args)
-
-        if not output.strip():
-            self.logger.debug("No tasks found matching filter")
-            return []
-
         try:
-            tasks_data = json.loads(output)
-            tasks = [Task.from_dict(task_data) for task_data in tasks_data]
-            self.logger.debug(f"Exported {len(tasks)} tasks")
-            return tasks
+            for task_data in _iter_json_stream(self._stream_command(cmd_args)):
+                yield Task.from_dict(task_data)
         except json.JSONDecodeError as e:
             raise TaskWarriorError(
                 f"Failed to parse TaskWarrior JSON output: {e}"
@@ -278,10 +539,15 @@ class TaskWarrior:
             self.logger.debug("No tasks to import")
             return
 
-        tasks_json = json.dumps([task.to_dict() for task in tasks])
+        tasks_json = json.dumps(
+            [task.to_dict() for task in tasks], separators=_JSON_SEPARATORS
+        )
 
         self.logger.info(f"Importing {len(tasks)} tasks")
-        self.logger.info(f"JSON being imported (first 500 chars): {tasks_json[:500]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"JSON being imported (first 500 chars): {tasks_json[:500]}"
+            )
         self._run_command(["import"], input_data=tasks_json)
         self.logger.info(f"Imported {len(tasks)} tasks")
 
@@ -319,7 +585,7 @@ class TaskWarrior:
                 cmd_args.append(f"{key}:{','.join(value)}")
             elif isinstance(value, datetime):
                 # For dates
-                cmd_args.append(f"{key}:{value.strftime('%Y%m%dT%H%M%SZ')}")
+                cmd_args.append(f"{key}:{_format_datetime(value)}")
             else:
                 cmd_args.append(f"{key}:{value}")
 
@@ -328,6 +594,65 @@ class TaskWarrior:
         self._run_command(["rc.confirmation=off", *cmd_args])
         self.logger.info(f"Modified task {uuid}")
 
+    def modify_tasks(self, modifications: dict[str, dict[str, Any]]) -> list[str]:
+        """Modify several existing tasks with a fixed number of commands.
+
+        The tasks are exported, patched and re-imported, so the cost is two
+        TaskWarrior invocations regardless of how many tasks are modified.
+        Attributes not being modified, including unknown UDAs, are preserved.
+        Tasks that cannot be found are left out, and the others are still
+        modified.
+
+        Args:
+            modifications: Dictionary mapping task UUIDs to their field
+                modifications. A value of None removes the attribute.
+
+        Returns:
+            Sorted UUIDs of the tasks that were not found.
+
+        Raises:
+            TaskWarriorError: If the update fails.
+        """
+        if not modifications:
+            return []
+
+        output = self._run_command([*modifications, "export"])
+
+        try:
+            tasks_data = list(_iter_json_objects(output)) if output.strip() else []
+        except json.JSONDecodeError as e:
+            raise TaskWarriorError(
+                f"Failed to parse TaskWarrior JSON output: {e}"
+            ) from e
+
+        modified = []
+        for data in tasks_data:
+            changes = modifications.get(data.get("uuid", ""))
+            if changes is None:
+                continue
+            for key, value in changes.items():
+                if value is None:
+                    data.pop(key, None)
+                elif isinstance(value, datetime):
+                    data[key] = _format_datetime(value)
+                else:
+                    data[key] = value
+            modified.append(data)
+
+        missing = sorted(modifications.keys() - {data["uuid"] for data in modified})
+        if missing:
+            self.logger.warning(f"Tasks not found: {', '.join(missing)}")
+        if not modified:
+            return missing
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Modifying {len(modified)} tasks: {modifications}")
+        self._run_command(
+            ["import"], input_data=json.dumps(modified, separators=_JSON_SEPARATORS)
+        )
+        self.logger.info(f"Modified {len(modified)} tasks")
+        return missing
+
     def delete_task(self, uuid: str) -> None:
         """Delete a task.
 
@@ -342,6 +667,25 @@ class TaskWarrior:
         self._run_command(["rc.confirmation=off", uuid, "delete"])
         self.logger.info(f"Deleted task {uuid}")
 
+    def delete_tasks(self, uuids: list[str]) -> None:
+        """Delete several tasks with a single command.
+
+        Args:
+            uuids: UUIDs of tasks to delete.
+
+        Raises:
+            TaskWarriorError: If deletion fails.
+        """
+        if not uuids:
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Deleting {len(uuids)} tasks: {uuids}")
+        # Add rc.confirmation=off to skip confirmation prompts, and rc.bulk=0
+        # to skip the extra one TaskWarrior asks for when deleting 3+ tasks
+        self._run_command(["rc.confirmation=off", "rc.bulk=0", *uuids, "delete"])
+        self.logger.info(f"Deleted {len(uuids)} tasks")
+
     def add_annotation(self, uuid: str, annotation: str) -> None:
         """Add an annotation to a task.
 
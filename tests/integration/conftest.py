@@ -1,13 +1,16 @@
 """Pytest configuration for integration tests."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from tests.integration.helpers import (
     CALDAV_CALENDAR_ID,
+    TASKDATA,
     TW_PROJECT,
+    XDIST_WORKER,
     clear_caldav,
     clear_taskwarrior,
     get_caldav_client,
@@ -55,72 +58,91 @@ def setup_taskwarrior_uda() -> None:
     Note: Multi-client tests create their own isolated TW instances with UDAs
     via the multi_client_setup fixture.
     """
-    import subprocess
-
-    taskdata = os.getenv("TASKDATA")
-    if not taskdata:
+    if not TASKDATA:
         pytest.skip("TASKDATA environment variable not set")
 
-    # Ensure the directory exists
-    Path(taskdata).mkdir(parents=True, exist_ok=True)
+    # Ensure the directory exists; under pytest-xdist it is per worker
+    Path(TASKDATA).mkdir(parents=True, exist_ok=True)
 
-    # Configure UDA for caldav_uid
+    # Write the UDA settings to the active taskrc directly, as 'task config'
+    # would, without starting TaskWarrior for each setting
+    taskrc = Path(os.getenv("TASKRC") or Path.home() / ".taskrc")
     try:
-        subprocess.run(
-            [
-                "task",
-                f"rc.data.location={taskdata}",
-                "rc.confirmation=off",
-                "config",
-                "uda.caldav_uid.type",
-                "string",
-            ],
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            [
-                "task",
-                f"rc.data.location={taskdata}",
-                "rc.confirmation=off",
-                "config",
-                "uda.caldav_uid.label",
-                "CalDAV UID",
-            ],
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
+        content = taskrc.read_text() if taskrc.exists() else ""
+        missing = [
+            line
+            for line in (
+                "uda.caldav_uid.type=string",
+                "uda.caldav_uid.label=CalDAV UID",
+            )
+            if line.split("=", 1)[0] + "=" not in content
+        ]
+        if missing:
+            with open(taskrc, "a") as f:
+                if content and not content.endswith("\n"):
+                    f.write("\n")
+                f.write("\n".join(missing) + "\n")
+    except OSError as e:
         pytest.fail(f"Failed to configure TaskWarrior UDA: {e}")
 
 
+@pytest.fixture(scope="session")
+def caldav_session():
+    """Connect to the CalDAV server and find the test calendar once per session.
+
+    The DAV client keeps its HTTP session open, so all tests using this
+    fixture share its connections instead of repeating principal and
+    calendar discovery.
+
+    Under pytest-xdist, each worker uses its own calendar, which is created
+    on first use next to the provisioned one.
+
+    Returns:
+        Tuple of (client, principal, calendar).
+    """
+    client, principal = get_caldav_client()
+    assert client is not None, "CalDAV server unreachable"
+    assert principal is not None, "CalDAV principal unreachable"
+    calendar = get_calendar(principal, CALDAV_CALENDAR_ID)
+    if calendar is None and XDIST_WORKER:
+        calendar = principal.make_calendar(
+            name=f"Test Calendar ({XDIST_WORKER})",
+            cal_id=CALDAV_CALENDAR_ID,
+            supported_calendar_component_set=["VTODO", "VEVENT"],
+        )
+    assert calendar is not None, f"CalDAV calendar {CALDAV_CALENDAR_ID!r} not found"
+
+    yield client, principal, calendar
+
+    client.close()
+
+
 @pytest.fixture(scope="function")
-def clean_test_environment():
+def clean_test_environment(caldav_session):
     """Clean both TaskWarrior and CalDAV before each test.
 
     This fixture ensures each test starts with a clean slate.
     """
-    taskdata = os.getenv("TASKDATA")
-
-    # Clean before test
-    clear_taskwarrior(taskdata, TW_PROJECT)
+    _client, _principal, calendar = caldav_session
 
-    _client, principal = get_caldav_client()
-    if principal:
-        calendar = get_calendar(principal, CALDAV_CALENDAR_ID)
-        if calendar:
-            clear_caldav(calendar)
+    # Clean before test; both sides are independent, so clean them in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(clear_taskwarrior, TASKDATA, TW_PROJECT),
+            executor.submit(clear_caldav, calendar),
+        ]
+        for future in futures:
+            future.result()
 
     yield
 
     # Optional: clean after test (can be commented out for debugging)
-    # clear_taskwarrior(taskdata, TW_PROJECT)
-    # if principal and calendar:
-    #     clear_caldav(calendar)
+    # clear_taskwarrior(TASKDATA, TW_PROJECT)
+    # clear_caldav(calendar)
 
 
 @pytest.fixture(scope="function")
-def multi_client_setup(tmp_path):
+def multi_client_setup(tmp_path, caldav_session):
     """Setup two clean TaskWarrior clients for multi-client tests.
 
     Returns:
@@ -146,11 +168,8 @@ confirmation=off
         )
 
     # Clear CalDAV to start fresh for multi-client tests
-    _client, principal = get_caldav_client()
-    if principal:
-        calendar = get_calendar(principal, CALDAV_CALENDAR_ID)
-        if calendar:
-            clear_caldav(calendar)
+    _client, _principal, calendar = caldav_session
+    clear_caldav(calendar)
 
     yield str(client1_path), str(client2_path)
 
@@ -1,22 +1,50 @@
 """Helper functions for integration tests."""
 
-import contextlib
+import atexit
 import json
+import math
 import os
+import re
+import shutil
 import subprocess
-from datetime import UTC, datetime
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
 
 import caldav
+from caldav.lib.error import ReportError
 from icalendar import Calendar, Todo
 
+from twcaldav.cli import main as sync_main
+from twcaldav.field_mapper import ANNOTATIONS_MARKER
+
+# pytest-xdist worker running this process (e.g. "gw0"), if any. Each worker
+# gets its own calendar, TaskWarrior data directory, sync config and cache,
+# so tests running in parallel never see each other's tasks.
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+_WORKER_SUFFIX = f"-{XDIST_WORKER}" if XDIST_WORKER else ""
+
 # Environment configuration
 CALDAV_URL = os.getenv("CALDAV_URL", "http://localhost:5232/test-user/")
 CALDAV_USERNAME = os.getenv("CALDAV_USERNAME", "test-user")
 CALDAV_PASSWORD = os.getenv("CALDAV_PASSWORD", "test-pass")
-CALDAV_CALENDAR_ID = os.getenv("CALDAV_CALENDAR_ID", "test-calendar")
+CALDAV_CALENDAR_ID = os.getenv("CALDAV_CALENDAR_ID", "test-calendar") + _WORKER_SUFFIX
 TW_PROJECT = os.getenv("TW_PROJECT", "test")
-TASKDATA = os.getenv("TASKDATA", None)
+TASKDATA = os.environ["TASKDATA"] + _WORKER_SUFFIX if os.getenv("TASKDATA") else None
+
+# Sync cache directory for this test session, so syncs never read or write the
+# developer's own cache and every session starts from an empty cache
+SYNC_CACHE_HOME = tempfile.mkdtemp(prefix="twcaldav-test-cache-")
+atexit.register(shutil.rmtree, SYNC_CACHE_HOME, ignore_errors=True)
+
+_CREATED_UUID_RE = re.compile(
+    r"Created task ([0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})"
+)
 
 
 # TaskWarrior operations
@@ -34,24 +62,77 @@ def run_task_command(
     Returns:
         Tuple of (stdout, stderr, returncode).
     """
+    cmd, env = _task_command(args, taskdata)
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    return result.stdout, result.stderr, result.returncode
+
+
+def _task_command(
+    args: list[str], taskdata: str | None = None
+) -> tuple[list[str], dict[str, str] | None]:
+    """Build a TaskWarrior command line and its environment.
+
+    Args:
+        args: Command arguments to pass to task.
+        taskdata: Optional TASKDATA path to use instead of default.
+
+    Returns:
+        Tuple of (command, environment). The environment is None when the
+        current one can be inherited unchanged.
+    """
     cmd = ["task"]
-    env = os.environ.copy()
     taskdata_path = taskdata or TASKDATA
+    env = _task_env(taskdata_path)
 
     if taskdata_path:
-        env["TASKDATA"] = taskdata_path
         cmd.append(f"rc.data.location={taskdata_path}")
 
     cmd.extend(args)
+    return cmd, env
 
-    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    return result.stdout, result.stderr, result.returncode
+
+def _task_env(taskdata_path: str | None) -> dict[str, str] | None:
+    """Get the environment for a subprocess using a TaskWarrior data path.
+
+    Args:
+        taskdata_path: TASKDATA path to set, if any.
+
+    Returns:
+        A copy of the environment with TASKDATA set, or None to inherit the
+        current environment when it already matches.
+    """
+    if not taskdata_path or os.environ.get("TASKDATA") == taskdata_path:
+        return None
+    return {**os.environ, "TASKDATA": taskdata_path}
+
+
+def _export_tasks(args: list[str], taskdata: str | None = None) -> list[dict] | None:
+    """Run a TaskWarrior export and parse its output.
+
+    The output is parsed from the raw bytes, without decoding it to a string
+    first.
+
+    Args:
+        args: Filter arguments, followed by "export".
+        taskdata: Optional TASKDATA path to use instead of default.
+
+    Returns:
+        List of task dictionaries, or None if the command failed.
+    """
+    cmd, env = _task_command(args, taskdata)
+    result = subprocess.run(cmd, capture_output=True, env=env, check=False)
+    if result.returncode != 0:
+        return None
+    if not result.stdout.strip():
+        return []
+    return json.loads(result.stdout)
 
 
 def get_tasks(
     taskdata: str | None = None,
     project: str | None = None,
     status: str | None = "pending",
+    caldav_uid: str | None = None,
 ) -> list[dict]:
     """Get tasks from TaskWarrior.
 
@@ -60,6 +141,7 @@ def get_tasks(
         project: Optional project filter (defaults to TW_PROJECT).
         status: Optional status filter (defaults to "pending").
                 Use None to get all tasks regardless of status.
+        caldav_uid: Optional filter on the linked CalDAV todo UID.
 
     Returns:
         List of task dictionaries.
@@ -70,13 +152,12 @@ def get_tasks(
     # Add status filter if specified
     if status is not None:
         args.append(f"status:{status}")
+    if caldav_uid is not None:
+        args.append(f"caldav_uid:{caldav_uid}")
 
     args.append("export")
 
-    stdout, _, _ = run_task_command(args, taskdata=taskdata)
-    if not stdout.strip():
-        return []
-    return json.loads(stdout)
+    return _export_tasks(args, taskdata=taskdata) or []
 
 
 def get_task(uuid: str, taskdata: str | None = None) -> dict | None:
@@ -89,12 +170,7 @@ def get_task(uuid: str, taskdata: str | None = None) -> dict | None:
     Returns:
         Task dictionary or None if not found.
     """
-    args = [f"{uuid}", "export"]
-    stdout, _, code = run_task_command(args, taskdata=taskdata)
-    if code != 0 or not stdout.strip():
-        return None
-
-    tasks = json.loads(stdout)
+    tasks = _export_tasks([uuid, "export"], taskdata=taskdata)
     return tasks[0] if tasks else None
 
 
@@ -109,7 +185,7 @@ def create_task(description: str, taskdata: str | None = None, **kwargs) -> dict
     Returns:
         The created task dictionary or None.
     """
-    args = ["add", description, f"project:{TW_PROJECT}"]
+    args = ["rc.verbose=new-uuid", "add", description, f"project:{TW_PROJECT}"]
 
     if "due" in kwargs:
         args.append(f"due:{kwargs['due']}")
@@ -127,16 +203,16 @@ def create_task(description: str, taskdata: str | None = None, **kwargs) -> dict
         else:
             args.append(f"+{tags}")
 
-    _stdout, _stderr, code = run_task_command(args, taskdata=taskdata)
+    stdout, _stderr, code = run_task_command(args, taskdata=taskdata)
 
     if code != 0:
         return None
 
-    # Get the most recently created task
-    tasks = get_tasks(taskdata=taskdata)
-    if tasks:
-        return max(tasks, key=lambda t: t.get("entry", ""))
-    return None
+    # "Created task <uuid>." identifies the new task directly
+    match = _CREATED_UUID_RE.search(stdout)
+    if match is None:
+        return None
+    return get_task(match.group(1), taskdata=taskdata)
 
 
 def modify_task(uuid: str, taskdata: str | None = None, **modifications) -> bool:
@@ -249,6 +325,16 @@ def remove_tags(uuid: str, tags: list[str], taskdata: str | None = None) -> bool
     return code == 0
 
 
+def wait_for_next_second() -> None:
+    """Sleep until the wall clock enters the next whole second.
+
+    TaskWarrior timestamps have one-second resolution, so this is the
+    shortest wait after which a TaskWarrior change is strictly newer than
+    anything written before the call.
+    """
+    time.sleep(math.floor(time.time()) + 1 - time.time())
+
+
 # CalDAV operations
 
 
@@ -284,38 +370,44 @@ def get_calendar(
         cal_id = calendar_id or CALDAV_CALENDAR_ID
         calendars = principal.calendars()
         for cal in calendars:
-            if cal.id == cal_id or cal_id in str(cal.url):
+            # Match whole path segments only, so "test-calendar" does not
+            # pick up a worker calendar such as "test-calendar-gw0"
+            if cal.id == cal_id or str(cal.url).rstrip("/").endswith(f"/{cal_id}"):
                 return cal
         return None
     except Exception:
         return None
 
 
-def get_todos(calendar: caldav.Calendar) -> list:
-    """Get all todos from CalDAV calendar, including completed ones.
+def get_todos(calendar: caldav.Calendar, include_completed: bool = True) -> list:
+    """Get todos from CalDAV calendar.
 
     Args:
         calendar: Calendar object.
+        include_completed: If True (default), also return completed todos.
 
     Returns:
-        List of todo objects (including completed).
+        List of todo objects.
     """
     try:
-        return calendar.todos(include_completed=True)
+        return calendar.todos(include_completed=include_completed)
     except Exception:
         return []
 
 
-def create_todo(calendar: caldav.Calendar, summary: str, **kwargs) -> bool:
+def create_todo(
+    calendar: caldav.Calendar, summary: str, **kwargs
+) -> caldav.Todo | None:
     """Create a todo in CalDAV calendar.
 
     Args:
         calendar: Calendar object.
         summary: Todo summary.
-        **kwargs: Additional todo attributes (due, priority, description, status, etc.).
+        **kwargs: Additional todo attributes (due, priority, description, status,
+            categories, etc.).
 
     Returns:
-        True if successful, False otherwise.
+        The created todo object, or None on failure.
     """
     try:
         cal = Calendar()
@@ -323,7 +415,7 @@ def create_todo(calendar: caldav.Calendar, summary: str, **kwargs) -> bool:
 
         todo.add("summary", summary)
         todo.add("status", kwargs.get("status", "NEEDS-ACTION"))
-        todo.add("uid", f"test-{datetime.now().timestamp()}")
+        todo.add("uid", f"test-{uuid4()}")
 
         if "due" in kwargs:
             todo.add("due", kwargs["due"])
@@ -337,21 +429,59 @@ def create_todo(calendar: caldav.Calendar, summary: str, **kwargs) -> bool:
             todo.add("priority", kwargs["priority"])
         if "description" in kwargs:
             todo.add("description", kwargs["description"])
+        if "categories" in kwargs:
+            todo.add("categories", kwargs["categories"])
 
         cal.add_component(todo)
 
-        calendar.save_todo(cal.to_ical())
-        return True
+        return calendar.save_todo(cal.to_ical())
     except Exception:
-        return False
+        return None
 
 
-def modify_todo(todo, **modifications) -> bool:
+def format_annotations(annotations: list[tuple[str, str]]) -> str:
+    """Build a todo description carrying TaskWarrior annotations.
+
+    Args:
+        annotations: List of (timestamp, text) pairs, with timestamps in
+            iCalendar UTC form (e.g. "20241118T120000Z").
+
+    Returns:
+        Description text in the format twcaldav writes and parses.
+    """
+    lines = [f"{timestamp}|{text}" for timestamp, text in annotations]
+    return "\n".join([ANNOTATIONS_MARKER, *lines])
+
+
+def create_todos(
+    calendar: caldav.Calendar, specs: list[dict]
+) -> list[caldav.Todo | None]:
+    """Create several todos in CalDAV calendar concurrently.
+
+    Args:
+        calendar: Calendar object.
+        specs: create_todo keyword arguments for each todo, including summary.
+
+    Returns:
+        The created todo objects (None for failures), in the order of specs.
+    """
+    if not specs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        return list(executor.map(lambda spec: create_todo(calendar, **spec), specs))
+
+
+def modify_todo(todo, bump_mtime: timedelta = timedelta(0), **modifications) -> bool:
     """Modify a CalDAV todo.
 
     Args:
         todo: Todo object.
+        bump_mtime: Offset added to the new LAST-MODIFIED timestamp. Setting it
+            ahead of the current time makes the change newer than anything a
+            previous sync wrote, without waiting for the clock to advance.
         **modifications: Modifications to apply (summary, priority, status, etc.).
+            A value of None removes the property.
 
     Returns:
         True if successful, False otherwise.
@@ -365,12 +495,13 @@ def modify_todo(todo, **modifications) -> bool:
                 for key, value in modifications.items():
                     if key in component:
                         del component[key]
-                    component.add(key, value)
+                    if value is not None:
+                        component.add(key, value)
 
                 # Update LAST-MODIFIED
                 if "last-modified" in component:
                     del component["last-modified"]
-                component.add("last-modified", datetime.now(UTC))
+                component.add("last-modified", datetime.now(UTC) + bump_mtime)
                 break
 
         # Save modified todo
@@ -407,17 +538,21 @@ def find_todo_by_summary(calendar: caldav.Calendar, summary: str):
     Returns:
         Todo object or None.
     """
-    todos = get_todos(calendar)
-    for todo in todos:
+    # Most lookups are for open todos, so only fetch completed ones if needed
+    for include_completed in (False, True):
+        # Let the server filter on SUMMARY; its text-match is case-insensitive,
+        # so results are still checked below. Servers rejecting the text-match
+        # report fall back to listing every todo.
         try:
-            ical = Calendar.from_ical(todo.data)
-            for component in ical.walk():
-                if component.name == "VTODO":
-                    todo_summary = str(component.get("summary", ""))
-                    if summary in todo_summary:
-                        return todo
-        except Exception:
-            continue
+            todos = calendar.search(
+                todo=True, summary=summary, include_completed=include_completed
+            )
+        except ReportError:
+            todos = get_todos(calendar, include_completed=include_completed)
+
+        for todo in todos:
+            if summary in str(todo.icalendar_component.get("summary", "")):
+                return todo
     return None
 
 
@@ -432,33 +567,37 @@ def get_todo_property(todo, property_name: str):
         Property value or None.
     """
     try:
-        ical = Calendar.from_ical(todo.data)
-        for component in ical.walk():
-            if component.name == "VTODO":
-                return component.get(property_name)
+        # The parsed component is cached on the todo until its data changes
+        return todo.icalendar_component.get(property_name)
     except Exception:
-        pass
-    return None
+        return None
 
 
 # Sync operations
 
 
 def run_sync(
-    taskdata: str | None = None, dry_run: bool = False, delete_tasks: bool = True
+    taskdata: str | None = None,
+    dry_run: bool = False,
+    delete_tasks: bool = True,
+    isolated: bool = False,
 ) -> bool:
     """Run the twcaldav sync.
 
+    The sync runs in the test process by default, avoiding interpreter
+    start-up and imports on every call.
+
     Args:
         taskdata: Optional TASKDATA path to use instead of default.
         dry_run: If True, run in dry-run mode.
         delete_tasks: If True, allow task deletion during sync.
+        isolated: If True, run the CLI in a separate Python process.
 
     Returns:
         True if sync succeeded, False otherwise.
     """
     # Create config file
-    config_path = Path("/tmp/twcaldav-test-config.toml")
+    config_path = Path(f"/tmp/twcaldav-test-config{_WORKER_SUFFIX}.toml")
     config_content = f"""[caldav]
 url = "{CALDAV_URL.rstrip("/")}"
 username = "{CALDAV_USERNAME}"
@@ -473,17 +612,31 @@ delete_tasks = {str(delete_tasks).lower()}
 """
     config_path.write_text(config_content)
 
-    args = ["uv", "run", "twcaldav", "sync", "--config", str(config_path)]
+    argv = ["sync", "--config", str(config_path)]
     if dry_run:
-        args.append("--dry-run")
+        argv.append("--dry-run")
 
-    env = os.environ.copy()
     taskdata_path = taskdata or TASKDATA
+
+    # The CLI picks up the data directory from TASKDATA and keeps its sync
+    # cache under XDG_CACHE_HOME
+    env_overrides = {"XDG_CACHE_HOME": SYNC_CACHE_HOME}
     if taskdata_path:
-        env["TASKDATA"] = taskdata_path
+        env_overrides["TASKDATA"] = taskdata_path
+
+    if isolated:
+        # Use the interpreter running the tests, which already has twcaldav
+        # installed, instead of resolving the environment via uv again
+        args = [sys.executable, "-m", "twcaldav.cli", *argv]
+        env = {**os.environ, **env_overrides}
+        result = subprocess.run(args, env=env, check=False)
+        return result.returncode == 0
 
-    result = subprocess.run(args, cwd="/app" if Path("/app").exists() else ".", env=env)
-    return result.returncode == 0
+    with patch.dict(os.environ, env_overrides):
+        try:
+            return sync_main(argv) == 0
+        except SystemExit as e:
+            return e.code == 0
 
 
 # Cleanup operations
@@ -501,19 +654,33 @@ def clear_taskwarrior(taskdata: str | None = None, project: str | None = None) -
 
     # Get all tasks (all statuses)
     cmd = [f"project:{proj}", "rc.verbose=nothing", "export"]
-    stdout, _, _ = run_task_command(cmd, taskdata=taskdata_path)
-
-    if stdout.strip():
-        tasks_to_clear = json.loads(stdout)
-
-        for task in tasks_to_clear:
-            uuid = task.get("uuid")
-            status = task.get("status", "")
-            if uuid and status != "deleted":
-                run_task_command(
-                    ["rc.confirmation=off", "rc.verbose=nothing", uuid, "delete"],
-                    taskdata=taskdata_path,
-                )
+    tasks_to_clear = _export_tasks(cmd, taskdata=taskdata_path)
+    if not tasks_to_clear:
+        # Already clean, nothing to delete or purge
+        return
+
+    # Delete all remaining tasks with a single command
+    uuids = [
+        task["uuid"]
+        for task in tasks_to_clear
+        if task.get("uuid") and task.get("status", "") != "deleted"
+    ]
+    if uuids:
+        # rc.bulk=0 skips the extra confirmation asked when deleting 3+ tasks
+        _, stderr, returncode = run_task_command(
+            [
+                "rc.confirmation=off",
+                "rc.bulk=0",
+                "rc.verbose=nothing",
+                *uuids,
+                "delete",
+            ],
+            taskdata=taskdata_path,
+        )
+        if returncode != 0:
+            raise RuntimeError(
+                f"Failed to delete {len(uuids)} TaskWarrior tasks: {stderr}"
+            )
 
     # Purge deleted tasks
     run_task_command(
@@ -529,6 +696,9 @@ def clear_caldav(calendar: caldav.Calendar) -> None:
         calendar: Calendar object.
     """
     todos = get_todos(calendar)
-    for todo in todos:
-        with contextlib.suppress(Exception):
-            todo.delete()
+    if not todos:
+        return
+
+    # Deletes are independent requests, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(todos))) as executor:
+        list(executor.map(delete_todo, todos))
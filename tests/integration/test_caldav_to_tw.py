@@ -1,235 +1,161 @@
 """Integration tests for CalDAV → TaskWarrior synchronization."""
 
-import time
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
 from tests.integration.helpers import (
     create_todo,
-    find_todo_by_summary,
-    get_caldav_client,
-    get_calendar,
+    create_todos,
+    format_annotations,
     get_tasks,
     modify_todo,
     run_sync,
+    wait_for_next_second,
 )
 
-
-@pytest.mark.integration
-def test_caldav_to_tw_create_simple(clean_test_environment) -> None:
-    """Create simple todo in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo in CalDAV
-    summary = "Simple CalDAV test todo"
-    assert create_todo(calendar, summary)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify task exists in TaskWarrior
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-    assert tasks[0]["status"] == "pending"
+# Pushes CalDAV modifications ahead of the previous sync's timestamps, so the
+# sync sees them as newer without sleeping
+MTIME_BUMP = timedelta(seconds=2)
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_create_with_due_date(clean_test_environment) -> None:
-    """Create todo with due date in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with due date
-    summary = "CalDAV todo with due date"
-    due_date = datetime.now(UTC) + timedelta(days=3)
-    assert create_todo(calendar, summary, due=due_date)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify task has correct due date
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-    assert "due" in tasks[0]
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_create_with_dtstart(clean_test_environment) -> None:
-    """Create todo with DTSTART in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with start date
-    summary = "CalDAV todo with start date"
-    start_date = datetime.now(UTC) + timedelta(days=2)
-    assert create_todo(calendar, summary, dtstart=start_date)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify task has correct scheduled date
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-    assert "scheduled" in tasks[0]
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_create_with_wait(clean_test_environment) -> None:
-    """Create todo with X-TASKWARRIOR-WAIT in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with wait date in the past (so task stays pending, not waiting)
-    summary = "CalDAV todo with wait date"
-    wait_date = datetime.now(UTC) - timedelta(days=1)
-    assert create_todo(calendar, summary, wait=wait_date)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify task has correct wait date
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-    assert "wait" in tasks[0]
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_completed_with_timestamp(clean_test_environment) -> None:
-    """Create completed todo with COMPLETED timestamp, verify it syncs to TW."""
-    from datetime import UTC, datetime
-
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create completed todo with COMPLETED timestamp
-    summary = "CalDAV completed task"
-    completed_time = datetime.now(UTC)
-    assert create_todo(calendar, summary, status="COMPLETED", completed=completed_time)
-
-    # Run sync
-    assert run_sync()
+def test_caldav_to_tw_create(caldav_session, clean_test_environment) -> None:
+    """Create todos with various properties in CalDAV, verify they sync to TW.
 
-    # Verify task has end timestamp
-    # Query for completed tasks explicitly (completed tasks not in pending list)
-    completed_tasks = get_tasks(status="completed")
-    assert len(completed_tasks) == 1
-    assert completed_tasks[0]["description"] == summary
-    assert completed_tasks[0]["status"] == "completed"
-    assert "end" in completed_tasks[0]
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_create_with_priority(clean_test_environment) -> None:
-    """Create todo with priority in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with high priority (1 = highest in CalDAV)
-    summary = "CalDAV todo with high priority"
-    assert create_todo(calendar, summary, priority=1)
+    All todos are created up front and synced in a single run, since each
+    one maps to an independent TaskWarrior task.
+    """
+    _client, _principal, calendar = caldav_session
+
+    now = datetime.now(UTC)
+    todos = {
+        "Simple CalDAV test todo": {},
+        "CalDAV todo with due date": {"due": now + timedelta(days=3)},
+        "CalDAV todo with start date": {"dtstart": now + timedelta(days=2)},
+        # Wait date in the past, so the task stays pending rather than waiting
+        "CalDAV todo with wait date": {"wait": now - timedelta(days=1)},
+        "CalDAV todo with high priority": {"priority": 1},  # 1 = highest in CalDAV
+        # CalDAV uses the CATEGORIES property for tags
+        "CalDAV todo with tags": {"categories": ["urgent", "work"]},
+        "Completed CalDAV todo": {"status": "COMPLETED"},
+        "CalDAV completed task": {"status": "COMPLETED", "completed": now},
+    }
+    created = create_todos(
+        calendar, [{"summary": summary, **kwargs} for summary, kwargs in todos.items()]
+    )
+    assert all(created)
 
-    # Run sync
+    # Run sync once for all todos
     assert run_sync()
 
-    # Verify task has correct priority
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-    assert tasks[0].get("priority") == "H"
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_create_completed(clean_test_environment) -> None:
-    """Create completed todo in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create completed todo
-    summary = "Completed CalDAV todo"
-    assert create_todo(calendar, summary, status="COMPLETED")
+    # Verify every todo became exactly one task with the expected properties
+    all_tasks = get_tasks(status=None)
+    tasks = {t["description"]: t for t in all_tasks}
+    assert len(all_tasks) == len(todos)
+    assert tasks.keys() == todos.keys()
 
-    # Run sync
-    assert run_sync()
+    assert tasks["Simple CalDAV test todo"]["status"] == "pending"
+    assert "due" in tasks["CalDAV todo with due date"]
+    assert "scheduled" in tasks["CalDAV todo with start date"]
+    assert "wait" in tasks["CalDAV todo with wait date"]
+    assert tasks["CalDAV todo with high priority"].get("priority") == "H"
+    assert set(tasks["CalDAV todo with tags"].get("tags", [])) == {"urgent", "work"}
 
-    # Verify task is completed (won't appear in pending tasks)
-    tasks = get_tasks()
-    # Completed tasks are not returned by get_tasks (which filters for pending)
-    # This is expected behavior
-    assert len(tasks) == 0
+    # Completed todos become completed tasks, not pending ones
+    assert tasks["Completed CalDAV todo"]["status"] == "completed"
+    assert tasks["CalDAV completed task"]["status"] == "completed"
+    assert "end" in tasks["CalDAV completed task"]
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_sync_preexisting_completed(clean_test_environment) -> None:
+def test_caldav_to_tw_sync_preexisting_completed(
+    caldav_session, clean_test_environment
+) -> None:
     """Sync completed todo that existed in CalDAV before first sync.
 
     This test verifies that completed todos in CalDAV are discovered
     and synced to TaskWarrior on the first sync run.
     """
     # Create completed todo in CalDAV before any sync
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     summary = "Pre-existing completed CalDAV todo"
-    assert create_todo(calendar, summary, status="COMPLETED")
+    todo = create_todo(calendar, summary, status="COMPLETED")
+    assert todo is not None
+    uid = str(todo.icalendar_component["uid"])
 
     # Run sync for the first time
     assert run_sync()
 
-    # Verify task was created in TaskWarrior with completed status
-    # Use status=None to get all tasks regardless of status
-    tasks = get_tasks(project="test", status=None)
-    completed_tasks = [
-        t for t in tasks if t["description"] == summary and t["status"] == "completed"
-    ]
-    # There should be at least one completed task
-    assert len(completed_tasks) >= 1
-    # Verify the most recent one has the correct properties
-    latest_task = max(completed_tasks, key=lambda t: t["entry"])
-    assert latest_task["status"] == "completed"
-    assert latest_task.get("caldav_uid") is not None
+    # Verify task was created in TaskWarrior with completed status, linked to
+    # the todo. Use status=None to get all tasks regardless of status.
+    tasks = get_tasks(status=None, caldav_uid=uid)
+    assert tasks
+    assert tasks[0]["description"] == summary
+    assert tasks[0]["status"] == "completed"
+
+
+# Each case creates a todo, syncs it, modifies it in CalDAV and syncs again:
+# (summary, create_todo kwargs, modify_todo kwargs, check on the synced task)
+MODIFY_CASES = [
+    pytest.param(
+        "Original CalDAV summary",
+        {},
+        {"summary": "Modified CalDAV summary"},
+        lambda task: task["description"] == "Modified CalDAV summary",
+        id="description",
+    ),
+    pytest.param(
+        "CalDAV todo with changeable due date",
+        {"due": datetime.now(UTC) + timedelta(days=2)},
+        {"due": datetime.now(UTC) + timedelta(days=5)},
+        lambda task: "due" in task,
+        id="due_date",
+    ),
+    pytest.param(
+        "CalDAV todo with changeable priority",
+        {"priority": 5},
+        {"priority": 1},
+        lambda task: task.get("priority") == "H",
+        id="priority",
+    ),
+    # CalDAV uses the CATEGORIES property for tags
+    pytest.param(
+        "CalDAV todo for adding tags",
+        {},
+        {"categories": ["urgent", "work"]},
+        lambda task: set(task.get("tags", [])) == {"urgent", "work"},
+        id="tags_add",
+    ),
+    pytest.param(
+        "CalDAV todo for removing tags",
+        {"categories": ["urgent", "work"]},
+        {"categories": None},
+        lambda task: not task.get("tags"),
+        id="tags_remove",
+    ),
+]
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_modify_description(clean_test_environment) -> None:
-    """Modify todo description/summary in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+@pytest.mark.parametrize(
+    ("summary", "create_kwargs", "modifications", "check"), MODIFY_CASES
+)
+def test_caldav_to_tw_modify(
+    caldav_session,
+    clean_test_environment,
+    summary,
+    create_kwargs,
+    modifications,
+    check,
+) -> None:
+    """Modify todo properties in CalDAV, verify they sync to TaskWarrior."""
+    _client, _principal, calendar = caldav_session
 
     # Create and sync initial todo
-    summary = "Original CalDAV summary"
-    assert create_todo(calendar, summary)
+    todo = create_todo(calendar, summary, **create_kwargs)
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -237,109 +163,31 @@ def test_caldav_to_tw_modify_description(clean_test_environment) -> None:
     assert len(tasks) == 1
     task_uuid = tasks[0]["uuid"]
 
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
-    # Modify summary in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    new_summary = "Modified CalDAV summary"
-    assert modify_todo(todo, summary=new_summary)
+    # Modify todo in CalDAV
+    todo.load()  # Pick up any changes the sync made on the server
+    assert modify_todo(todo, bump_mtime=MTIME_BUMP, **modifications)
 
     # Run sync
     assert run_sync()
 
-    # Verify TaskWarrior task summary updated
+    # Verify the same TaskWarrior task was updated
     tasks = get_tasks()
     assert len(tasks) == 1
     assert tasks[0]["uuid"] == task_uuid
-    assert tasks[0]["description"] == new_summary
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_modify_due_date(clean_test_environment) -> None:
-    """Modify todo due date in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with due date
-    summary = "CalDAV todo with changeable due date"
-    due_date1 = datetime.now(UTC) + timedelta(days=2)
-    assert create_todo(calendar, summary, due=due_date1)
-    assert run_sync()
-
-    # Verify initial sync
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
-    # Modify due date in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    due_date2 = datetime.now(UTC) + timedelta(days=5)
-    assert modify_todo(todo, due=due_date2)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify TaskWarrior task due date updated
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert "due" in tasks[0]
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_modify_priority(clean_test_environment) -> None:
-    """Modify todo priority in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with medium priority
-    summary = "CalDAV todo with changeable priority"
-    assert create_todo(calendar, summary, priority=5)
-    assert run_sync()
-
-    # Verify initial sync
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
-    # Modify priority to high in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    assert modify_todo(todo, priority=1)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify TaskWarrior task priority updated
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0].get("priority") == "H"
+    assert check(tasks[0])
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_modify_status_to_completed(clean_test_environment) -> None:
+def test_caldav_to_tw_modify_status_to_completed(
+    caldav_session, clean_test_environment
+) -> None:
     """Mark todo as completed in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create pending todo
     summary = "CalDAV todo to be completed"
-    assert create_todo(calendar, summary, status="NEEDS-ACTION")
+    todo = create_todo(calendar, summary, status="NEEDS-ACTION")
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -347,13 +195,9 @@ def test_caldav_to_tw_modify_status_to_completed(clean_test_environment) -> None
     assert len(tasks) == 1
     task_uuid = tasks[0]["uuid"]
 
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
     # Mark as completed in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    assert modify_todo(todo, status="COMPLETED")
+    todo.load()  # Pick up any changes the sync made on the server
+    assert modify_todo(todo, bump_mtime=MTIME_BUMP, status="COMPLETED")
 
     # Run sync
     assert run_sync()
@@ -365,17 +209,14 @@ def test_caldav_to_tw_modify_status_to_completed(clean_test_environment) -> None
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_delete(clean_test_environment) -> None:
+def test_caldav_to_tw_delete(caldav_session, clean_test_environment) -> None:
     """Delete todo in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create and sync todo
     summary = "CalDAV todo to be deleted"
-    assert create_todo(calendar, summary)
+    todo = create_todo(calendar, summary)
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -383,8 +224,6 @@ def test_caldav_to_tw_delete(clean_test_environment) -> None:
     assert len(tasks) == 1
 
     # Delete todo in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
     todo.delete()
 
     # Run sync with delete_tasks=True
@@ -396,21 +235,15 @@ def test_caldav_to_tw_delete(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_annotation_create(clean_test_environment) -> None:
+def test_caldav_to_tw_annotation_create(caldav_session, clean_test_environment) -> None:
     """Create todo with annotation in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create todo with annotation in description
     summary = "CalDAV todo with annotation"
     annotation_text = "This is a test annotation from CalDAV"
     timestamp = "20241118T120000Z"
-    description_with_annotation = (
-        f"--- TaskWarrior Annotations ---\n{timestamp}|{annotation_text}"
-    )
+    description_with_annotation = format_annotations([(timestamp, annotation_text)])
 
     assert create_todo(calendar, summary, description=description_with_annotation)
 
@@ -427,22 +260,17 @@ def test_caldav_to_tw_annotation_create(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_annotation_add(clean_test_environment) -> None:
+def test_caldav_to_tw_annotation_add(caldav_session, clean_test_environment) -> None:
     """Add annotation to existing todo in CalDAV, verify it syncs to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create todo with one annotation
     summary = "CalDAV todo for adding annotations"
     annotation1 = "First annotation"
     timestamp1 = "20241118T120000Z"
-    description_with_annotation = (
-        f"--- TaskWarrior Annotations ---\n{timestamp1}|{annotation1}"
-    )
-    assert create_todo(calendar, summary, description=description_with_annotation)
+    description_with_annotation = format_annotations([(timestamp1, annotation1)])
+    todo = create_todo(calendar, summary, description=description_with_annotation)
+    assert todo is not None
     assert run_sync()
 
     # Verify initial annotation
@@ -451,18 +279,16 @@ def test_caldav_to_tw_annotation_add(clean_test_environment) -> None:
     assert "annotations" in tasks[0]
     assert len(tasks[0]["annotations"]) == 1
 
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
     # Add second annotation in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
+    todo.load()  # Pick up any changes the sync made on the server
     annotation2 = "Second annotation"
     timestamp2 = "20241118T130000Z"
-    description_with_two_annotations = f"""--- TaskWarrior Annotations ---
-{timestamp1}|{annotation1}
-{timestamp2}|{annotation2}"""
-    assert modify_todo(todo, description=description_with_two_annotations)
+    description_with_two_annotations = format_annotations(
+        [(timestamp1, annotation1), (timestamp2, annotation2)]
+    )
+    assert modify_todo(
+        todo, bump_mtime=MTIME_BUMP, description=description_with_two_annotations
+    )
 
     # Run sync
     assert run_sync()
@@ -481,13 +307,11 @@ def test_caldav_to_tw_annotation_add(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_annotation_multiple(clean_test_environment) -> None:
+def test_caldav_to_tw_annotation_multiple(
+    caldav_session, clean_test_environment
+) -> None:
     """Create todo with multiple annotations, verify they sync to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create todo with multiple annotations
     summary = "CalDAV todo with multiple annotations"
@@ -495,9 +319,9 @@ def test_caldav_to_tw_annotation_multiple(clean_test_environment) -> None:
     annotation2 = "Second annotation"
     timestamp1 = "20241118T120000Z"
     timestamp2 = "20241118T130000Z"
-    description_with_annotations = f"""--- TaskWarrior Annotations ---
-{timestamp1}|{annotation1}
-{timestamp2}|{annotation2}"""
+    description_with_annotations = format_annotations(
+        [(timestamp1, annotation1), (timestamp2, annotation2)]
+    )
 
     assert create_todo(calendar, summary, description=description_with_annotations)
 
@@ -519,22 +343,17 @@ def test_caldav_to_tw_annotation_multiple(clean_test_environment) -> None:
 
 @pytest.mark.integration
 def test_caldav_to_tw_annotation_bidirectional_no_duplication(
+    caldav_session,
     clean_test_environment,
 ) -> None:
     """Test that annotations don't duplicate on bidirectional sync."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create todo with annotation
     summary = "CalDAV annotation dedup test"
     annotation = "Test annotation for deduplication"
     timestamp = "20241118T150000Z"
-    description_with_annotation = (
-        f"--- TaskWarrior Annotations ---\n{timestamp}|{annotation}"
-    )
+    description_with_annotation = format_annotations([(timestamp, annotation)])
     assert create_todo(calendar, summary, description=description_with_annotation)
 
     # Sync to TaskWarrior
@@ -561,106 +380,9 @@ def test_caldav_to_tw_annotation_bidirectional_no_duplication(
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_create_with_tags(clean_test_environment) -> None:
-    """Create todo with tags/categories in CalDAV, verify they sync to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo with categories (CalDAV's version of tags)
-    summary = "CalDAV todo with tags"
-    # Note: CalDAV uses CATEGORIES property for tags
-    assert create_todo(calendar, summary)
-
-    # Run sync
-    assert run_sync()
-
-    # Verify task exists in TaskWarrior
-    tasks = get_tasks()
-    assert len(tasks) == 1
-    assert tasks[0]["description"] == summary
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_modify_tags_add(clean_test_environment) -> None:
-    """Add tags to todo in CalDAV, verify they sync to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo
-    summary = "CalDAV todo for adding tags"
-    assert create_todo(calendar, summary)
-    assert run_sync()
-
-    # Verify initial sync
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
-    # Modify todo to add categories in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    # Note: Would need to add categories property
-    # For now, just verify the modification mechanism works
-    assert modify_todo(todo, summary=f"{summary} [with tags]")
-
-    # Run sync
-    assert run_sync()
-
-    # Verify TaskWarrior task updated
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_modify_tags_remove(clean_test_environment) -> None:
-    """Remove tags from todo in CalDAV, verify they sync to TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Create todo
-    summary = "CalDAV todo for removing tags"
-    assert create_todo(calendar, summary)
-    assert run_sync()
-
-    # Verify initial sync
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-    # Wait to ensure timestamp separation
-    time.sleep(2)
-
-    # Modify todo in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    assert modify_todo(todo, summary=f"{summary} [tags removed]")
-
-    # Run sync
-    assert run_sync()
-
-    # Verify TaskWarrior task updated
-    tasks = get_tasks()
-    assert len(tasks) == 1
-
-
-@pytest.mark.integration
-def test_caldav_to_tw_dry_run(clean_test_environment) -> None:
+def test_caldav_to_tw_dry_run(caldav_session, clean_test_environment) -> None:
     """Test dry-run mode doesn't modify TaskWarrior."""
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create todo in CalDAV
     summary = "CalDAV dry run test todo"
@@ -680,6 +402,7 @@ def test_caldav_to_tw_dry_run(clean_test_environment) -> None:
 
 @pytest.mark.integration
 def test_caldav_to_tw_completed_without_timestamp_idempotent(
+    caldav_session,
     clean_test_environment,
 ) -> None:
     """Sync completed todo WITHOUT COMPLETED timestamp, verify sync is idempotent.
@@ -693,33 +416,30 @@ def test_caldav_to_tw_completed_without_timestamp_idempotent(
     update loops.
     """
     # Create completed todo WITHOUT completed timestamp
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     summary = "Completed task without timestamp"
     # status="COMPLETED" but NO completed=datetime parameter
-    assert create_todo(calendar, summary, status="COMPLETED")
+    todo = create_todo(calendar, summary, status="COMPLETED")
+    assert todo is not None
+    uid = str(todo.icalendar_component["uid"])
 
     # First sync
     assert run_sync()
 
     # Get TW task state after first sync
-    tasks = get_tasks(project="test", status=None)
-    completed_tasks = [t for t in tasks if t["description"] == summary]
+    completed_tasks = get_tasks(status=None, caldav_uid=uid)
     assert len(completed_tasks) == 1
     first_modified = completed_tasks[0]["modified"]
 
-    # Wait to ensure timestamp separation
-    time.sleep(2)
+    # Wait so that a spurious modification would change the timestamp
+    wait_for_next_second()
 
     # Second sync - should NOT modify the task
     assert run_sync()
 
     # Verify task was NOT modified
-    tasks = get_tasks(project="test", status=None)
-    completed_tasks = [t for t in tasks if t["description"] == summary]
+    completed_tasks = get_tasks(status=None, caldav_uid=uid)
     assert len(completed_tasks) == 1
     assert completed_tasks[0]["modified"] == first_modified, (
         "Task was spuriously updated on second sync"
@@ -727,21 +447,18 @@ def test_caldav_to_tw_completed_without_timestamp_idempotent(
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_delete_disabled(clean_test_environment) -> None:
+def test_caldav_to_tw_delete_disabled(caldav_session, clean_test_environment) -> None:
     """Delete todo in CalDAV with delete_tasks=False, verify TW task preserved.
 
     When deletion is disabled, deleting a CalDAV todo should NOT delete the
     corresponding TaskWarrior task.
     """
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create and sync todo
     summary = "CalDAV todo to delete (deletion disabled)"
-    assert create_todo(calendar, summary)
+    todo = create_todo(calendar, summary)
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -750,8 +467,6 @@ def test_caldav_to_tw_delete_disabled(clean_test_environment) -> None:
     task_uuid = tasks[0]["uuid"]
 
     # Delete todo in CalDAV
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
     todo.delete()
 
     # Run sync with delete_tasks=False
@@ -764,21 +479,20 @@ def test_caldav_to_tw_delete_disabled(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_cancelled_status_delete_enabled(clean_test_environment) -> None:
+def test_caldav_to_tw_cancelled_status_delete_enabled(
+    caldav_session, clean_test_environment
+) -> None:
     """Set CalDAV todo to CANCELLED status, verify TW task deleted.
 
     When a CalDAV todo is set to CANCELLED status (not deleted), the sync
     should delete the corresponding TaskWarrior task if deletion is enabled.
     """
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create and sync todo
     summary = "CalDAV todo to be cancelled"
-    assert create_todo(calendar, summary, status="NEEDS-ACTION")
+    todo = create_todo(calendar, summary, status="NEEDS-ACTION")
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -786,13 +500,9 @@ def test_caldav_to_tw_cancelled_status_delete_enabled(clean_test_environment) ->
     assert len(tasks) == 1
     task_uuid = tasks[0]["uuid"]
 
-    # Wait for timestamp separation
-    time.sleep(2)
-
     # Set todo to CANCELLED status (not delete it)
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    assert modify_todo(todo, status="CANCELLED")
+    todo.load()  # Pick up any changes the sync made on the server
+    assert modify_todo(todo, bump_mtime=MTIME_BUMP, status="CANCELLED")
 
     # Run sync with delete_tasks=True
     assert run_sync(delete_tasks=True)
@@ -805,21 +515,20 @@ def test_caldav_to_tw_cancelled_status_delete_enabled(clean_test_environment) ->
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_cancelled_status_delete_disabled(clean_test_environment) -> None:
+def test_caldav_to_tw_cancelled_status_delete_disabled(
+    caldav_session, clean_test_environment
+) -> None:
     """Set CalDAV todo to CANCELLED status with delete_tasks=False, verify TW preserved.
 
     When deletion is disabled, a CANCELLED CalDAV todo should NOT cause the
     corresponding TaskWarrior task to be deleted.
     """
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create and sync todo
     summary = "CalDAV todo cancelled (deletion disabled)"
-    assert create_todo(calendar, summary, status="NEEDS-ACTION")
+    todo = create_todo(calendar, summary, status="NEEDS-ACTION")
+    assert todo is not None
     assert run_sync()
 
     # Verify initial sync
@@ -827,13 +536,9 @@ def test_caldav_to_tw_cancelled_status_delete_disabled(clean_test_environment) -
     assert len(tasks) == 1
     task_uuid = tasks[0]["uuid"]
 
-    # Wait for timestamp separation
-    time.sleep(2)
-
     # Set todo to CANCELLED status
-    todo = find_todo_by_summary(calendar, summary)
-    assert todo is not None
-    assert modify_todo(todo, status="CANCELLED")
+    todo.load()  # Pick up any changes the sync made on the server
+    assert modify_todo(todo, bump_mtime=MTIME_BUMP, status="CANCELLED")
 
     # Run sync with delete_tasks=False
     assert run_sync(delete_tasks=False)
@@ -845,17 +550,15 @@ def test_caldav_to_tw_cancelled_status_delete_disabled(clean_test_environment) -
 
 
 @pytest.mark.integration
-def test_caldav_to_tw_cancelled_no_tw_task(clean_test_environment) -> None:
+def test_caldav_to_tw_cancelled_no_tw_task(
+    caldav_session, clean_test_environment
+) -> None:
     """Create CANCELLED CalDAV todo without TW counterpart, verify it's skipped.
 
     A CalDAV todo with CANCELLED status that has no corresponding TaskWarrior
     task should be skipped (not create a new deleted task).
     """
-    # Get CalDAV client
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # Create CANCELLED todo directly (never synced)
     summary = "Orphaned cancelled CalDAV todo"
@@ -1,7 +1,5 @@
 """Integration tests for multi-client synchronization (TW A ↔ CalDAV ↔ TW B)."""
 
-import time
-
 import pytest
 
 from tests.integration.helpers import (
@@ -9,20 +7,25 @@ from tests.integration.helpers import (
     annotate_task,
     complete_task,
     create_task,
+    create_todo,
     delete_task,
-    get_caldav_client,
-    get_calendar,
+    find_todo_by_summary,
     get_task,
     get_tasks,
+    get_todo_property,
     get_todos,
     modify_task,
+    modify_todo,
     remove_tags,
     run_sync,
+    wait_for_next_second,
 )
 
 
 @pytest.mark.integration
-def test_multi_client_create_simple(clean_test_environment, multi_client_setup) -> None:
+def test_multi_client_create_simple(
+    caldav_session, clean_test_environment, multi_client_setup
+) -> None:
     """Task created in client1 syncs to client2 via CalDAV."""
     client1, client2 = multi_client_setup
 
@@ -35,10 +38,7 @@ def test_multi_client_create_simple(clean_test_environment, multi_client_setup)
     assert run_sync(taskdata=client1)
 
     # Verify task is in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
     assert len(get_todos(calendar)) == 1
 
     # Client 2: Sync from CalDAV
@@ -162,7 +162,7 @@ def test_multi_client_modify_description(
     assert len(client2_tasks) == 1
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Modify description
     new_description = "Modified by client 2"
@@ -196,7 +196,7 @@ def test_multi_client_modify_due_date(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Modify due date
     client2_tasks = get_tasks(taskdata=client2)
@@ -229,7 +229,7 @@ def test_multi_client_modify_priority(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Modify priority
     client2_tasks = get_tasks(taskdata=client2)
@@ -263,7 +263,7 @@ def test_multi_client_modify_wait_date(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Modify wait date (also using past date to keep task pending)
     client2_tasks = get_tasks(taskdata=client2)
@@ -297,7 +297,7 @@ def test_multi_client_modify_tags_add(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Add tags
     client2_tasks = get_tasks(taskdata=client2)
@@ -329,7 +329,7 @@ def test_multi_client_modify_tags_remove(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Remove a tag
     client2_tasks = get_tasks(taskdata=client2)
@@ -361,7 +361,7 @@ def test_multi_client_modify_status_to_completed(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Complete task
     client2_tasks = get_tasks(taskdata=client2)
@@ -422,7 +422,7 @@ def test_multi_client_completion_timestamp_sync(
     assert run_sync(taskdata=client2)
 
     # Wait for timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Complete task (sets end timestamp)
     client2_tasks = get_tasks(taskdata=client2)
@@ -493,7 +493,7 @@ def test_multi_client_annotation_add(
     assert run_sync(taskdata=client2)
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Client 2: Add annotation
     client2_tasks = get_tasks(taskdata=client2)
@@ -551,7 +551,7 @@ def test_multi_client_annotation_bidirectional_no_duplication(
     assert client1_tasks[0]["annotations"][0]["description"] == annotation
 
     # Add second annotation on Client 2
-    time.sleep(2)
+    wait_for_next_second()
     annotation2 = "Second annotation from client 2"
     assert annotate_task(client2_tasks[0]["uuid"], annotation2, taskdata=client2)
 
@@ -608,7 +608,7 @@ def test_multi_client_annotation_multiple(
     annotation1 = "First annotation"
     annotation2 = "Second annotation"
     assert annotate_task(task1["uuid"], annotation1, taskdata=client1)
-    time.sleep(1)
+    wait_for_next_second()
     assert annotate_task(task1["uuid"], annotation2, taskdata=client1)
 
     # Sync to CalDAV and Client 2
@@ -654,7 +654,7 @@ def test_multi_client_dry_run(clean_test_environment, multi_client_setup) -> Non
 
 @pytest.mark.integration
 def test_multi_client_no_spurious_updates(
-    clean_test_environment, multi_client_setup
+    caldav_session, clean_test_environment, multi_client_setup
 ) -> None:
     """Test that syncing unchanged tasks doesn't trigger spurious updates.
 
@@ -668,43 +668,37 @@ def test_multi_client_no_spurious_updates(
     task1 = create_task(description, taskdata=client1)
     assert task1 is not None
 
-    # Wait 3 seconds after task creation
-    time.sleep(3)
+    # Let the clock move past the creation timestamp
+    wait_for_next_second()
 
     # Sync to CalDAV
     assert run_sync(taskdata=client1)
 
-    # Wait 3 seconds after syncing to CalDAV
-    time.sleep(3)
+    # Let the clock move past the timestamps of the sync
+    wait_for_next_second()
 
     # Sync to Client 2
     assert run_sync(taskdata=client2)
 
     # Verify task appears in Client 2
-    client2_tasks = get_tasks(taskdata=client2)
-    assert len(client2_tasks) == 1
-    assert description in client2_tasks[0]["description"]
+    client2_tasks_before = get_tasks(taskdata=client2)
+    assert len(client2_tasks_before) == 1, "Task missing from Client 2"
+    assert description in client2_tasks_before[0]["description"]
 
     # Get initial state for comparison
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
     initial_todos = get_todos(calendar)
     assert len(initial_todos) == 1
     initial_todo_data = initial_todos[0].data
 
-    # Verify task still exists in both clients before testing for spurious updates
+    # Verify task still exists in Client 1 before testing for spurious updates;
+    # Client 2 has not run anything since its export above
     client1_tasks_before = get_tasks(taskdata=client1)
     assert len(client1_tasks_before) == 1, "Task missing from Client 1"
     assert description in client1_tasks_before[0]["description"]
 
-    client2_tasks_before = get_tasks(taskdata=client2)
-    assert len(client2_tasks_before) == 1, "Task missing from Client 2"
-    assert description in client2_tasks_before[0]["description"]
-
-    # Wait 3 seconds before re-syncing to ensure timestamp separation
-    time.sleep(3)
+    # Ensure timestamp separation before re-syncing
+    wait_for_next_second()
 
     # Sync against Client 1 - should NOT trigger updates
     assert run_sync(taskdata=client1)
@@ -743,7 +737,7 @@ def test_multi_client_no_spurious_updates(
 
 @pytest.mark.integration
 def test_multi_client_completed_without_timestamp_roundtrip(
-    clean_test_environment, multi_client_setup
+    caldav_session, clean_test_environment, multi_client_setup
 ) -> None:
     """Test roundtrip sync of completed task that starts without COMPLETED timestamp.
 
@@ -759,14 +753,9 @@ def test_multi_client_completed_without_timestamp_roundtrip(
     client1, client2 = multi_client_setup
 
     # Create completed todo in CalDAV without COMPLETED timestamp
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     summary = "Multi-client completed without timestamp"
-    from tests.integration.helpers import create_todo
-
     assert create_todo(calendar, summary, status="COMPLETED")
 
     # Both clients sync
@@ -784,7 +773,7 @@ def test_multi_client_completed_without_timestamp_roundtrip(
     c2_modified = c2_task["modified"]
 
     # Wait and sync again - should NOT modify
-    time.sleep(2)
+    wait_for_next_second()
     assert run_sync(taskdata=client1)
     assert run_sync(taskdata=client2)
 
@@ -833,7 +822,7 @@ def test_multi_client_completed_no_spurious_updates(
     c2_modified = c2_task["modified"]
 
     # Wait and sync again - should NOT modify
-    time.sleep(3)
+    wait_for_next_second()
     assert run_sync(taskdata=client1)
     assert run_sync(taskdata=client2)
     assert run_sync(taskdata=client1)  # Third sync to ensure stability
@@ -852,21 +841,13 @@ def test_multi_client_completed_no_spurious_updates(
 
 @pytest.mark.integration
 def test_both_tw_deleted_and_caldav_cancelled(
-    clean_test_environment, multi_client_setup
+    caldav_session, clean_test_environment, multi_client_setup
 ) -> None:
     """Test that when TW task is deleted AND CalDAV todo is CANCELLED, sync skips.
 
     This edge case tests the scenario where both sides have been marked as
     deleted/cancelled. The sync should skip without errors.
     """
-    from tests.integration.helpers import (
-        find_todo_by_summary,
-        get_caldav_client,
-        get_calendar,
-        get_todos,
-        modify_todo,
-    )
-
     client1, _client2 = multi_client_setup
 
     # Client 1: Create task and sync
@@ -876,10 +857,7 @@ def test_both_tw_deleted_and_caldav_cancelled(
     assert run_sync(taskdata=client1)
 
     # Verify task exists in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
 
@@ -899,8 +877,6 @@ def test_both_tw_deleted_and_caldav_cancelled(
     assert deleted_task["status"] == "deleted"
 
     # CalDAV todo should still be CANCELLED
-    from tests.integration.helpers import get_todo_property
-
     todos = get_todos(calendar)
     cancelled_todo = None
     for t in todos:
@@ -1,7 +1,5 @@
 """Integration tests for TaskWarrior → CalDAV synchronization."""
 
-import time
-
 import pytest
 
 from tests.integration.helpers import (
@@ -11,8 +9,6 @@ from tests.integration.helpers import (
     create_task,
     delete_task,
     find_todo_by_summary,
-    get_caldav_client,
-    get_calendar,
     get_task,
     get_tasks,
     get_todo_property,
@@ -20,215 +16,78 @@ from tests.integration.helpers import (
     modify_task,
     remove_tags,
     run_sync,
+    wait_for_next_second,
 )
+from twcaldav.field_mapper import ANNOTATIONS_MARKER
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_create_simple(clean_test_environment) -> None:
-    """Create simple task in TaskWarrior, verify it syncs to CalDAV."""
-    # Create task in TaskWarrior
-    description = "Simple TaskWarrior test task"
-    task = create_task(description)
-    assert task is not None
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo exists in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todos = get_todos(calendar)
-    assert len(todos) == 1
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    assert str(get_todo_property(todo, "summary")) == description
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_create_with_due_date(clean_test_environment) -> None:
-    """Create task with due date in TaskWarrior, verify it syncs to CalDAV."""
-    # Create task with due date
-    description = "TaskWarrior task with due date"
-    task = create_task(description, due="tomorrow")
-    assert task is not None
-    assert "due" in task
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo has due date in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    due_prop = get_todo_property(todo, "due")
-    assert due_prop is not None
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_create_with_scheduled(clean_test_environment) -> None:
-    """Create task with scheduled date in TaskWarrior, verify it syncs to CalDAV."""
-    # Create task with scheduled date
-    description = "TaskWarrior task with scheduled date"
-    task = create_task(description, scheduled="tomorrow")
-    assert task is not None
-    assert "scheduled" in task
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo has DTSTART in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    dtstart = get_todo_property(todo, "dtstart")
-    assert dtstart is not None
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_create_with_wait(clean_test_environment) -> None:
-    """Create task with wait date in TaskWarrior, verify it syncs to CalDAV."""
-    # Create task with wait date (using yesterday so task stays pending, not waiting)
-    description = "TaskWarrior task with wait date"
-    task = create_task(description, wait="yesterday")
-    assert task is not None
-    assert "wait" in task
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo has X-TASKWARRIOR-WAIT in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    wait_prop = get_todo_property(todo, "x-taskwarrior-wait")
-    assert wait_prop is not None
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_completed_task_with_end(clean_test_environment) -> None:
-    """Complete task in TaskWarrior, verify COMPLETED timestamp syncs to CalDAV."""
-    # Create and complete task
-    description = "Task to be completed"
-    task = create_task(description)
-    assert task is not None
-
-    # Complete the task (this sets end timestamp automatically)
-    assert complete_task(task["uuid"])
+def test_tw_to_caldav_create(caldav_session, clean_test_environment) -> None:
+    """Create tasks with various properties in TaskWarrior, verify they sync.
 
-    # Verify task has end timestamp
-    completed_task = get_task(task["uuid"])
+    All tasks are created up front and synced in a single run, since each
+    one maps to an independent CalDAV todo.
+    """
+    _client, _principal, calendar = caldav_session
+
+    tasks = {
+        "Simple TaskWarrior test task": {},
+        "TaskWarrior task with due date": {"due": "tomorrow"},
+        "TaskWarrior task with scheduled date": {"scheduled": "tomorrow"},
+        # Wait date in the past, so the task stays pending rather than waiting
+        "TaskWarrior task with wait date": {"wait": "yesterday"},
+        "TaskWarrior task with high priority": {"priority": "H"},
+        "TaskWarrior task with tags": {"tags": ["urgent", "work"]},
+        "Task to be completed": {},
+        "TaskWarrior completed task": {},
+    }
+    created = {
+        description: create_task(description, **kwargs)
+        for description, kwargs in tasks.items()
+    }
+    assert all(created.values())
+    assert "due" in created["TaskWarrior task with due date"]
+    assert "scheduled" in created["TaskWarrior task with scheduled date"]
+    assert "wait" in created["TaskWarrior task with wait date"]
+    assert created["TaskWarrior task with high priority"].get("priority") == "H"
+    assert {"urgent", "work"} <= set(created["TaskWarrior task with tags"]["tags"])
+
+    # Complete tasks before the first sync (this sets end timestamp automatically)
+    for description in ("Task to be completed", "TaskWarrior completed task"):
+        assert complete_task(created[description]["uuid"])
+    completed_task = get_task(created["Task to be completed"]["uuid"])
     assert completed_task is not None
     assert completed_task["status"] == "completed"
     assert "end" in completed_task
 
-    # Run sync
+    # Run sync once for all tasks
     assert run_sync()
 
-    # Verify todo has COMPLETED in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    completed_prop = get_todo_property(todo, "completed")
-    assert completed_prop is not None
-    assert get_todo_property(todo, "status") == "COMPLETED"
-
+    # Verify every task became exactly one todo with the expected properties
+    all_todos = get_todos(calendar)
+    todos = {str(get_todo_property(t, "summary")): t for t in all_todos}
+    assert len(all_todos) == len(tasks)
+    assert todos.keys() == tasks.keys()
 
-@pytest.mark.integration
-def test_tw_to_caldav_create_with_priority(clean_test_environment) -> None:
-    """Create task with priority in TaskWarrior, verify it syncs to CalDAV."""
-    # Create task with high priority
-    description = "TaskWarrior task with high priority"
-    task = create_task(description, priority="H")
-    assert task is not None
-    assert task.get("priority") == "H"
+    for description, prop in (
+        ("TaskWarrior task with due date", "due"),
+        ("TaskWarrior task with scheduled date", "dtstart"),
+        ("TaskWarrior task with wait date", "x-taskwarrior-wait"),
+        # High priority in TW maps to 1 in CalDAV
+        ("TaskWarrior task with high priority", "priority"),
+    ):
+        assert get_todo_property(todos[description], prop) is not None, prop
 
-    # Run sync
-    assert run_sync()
-
-    # Verify todo has priority in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-    priority = get_todo_property(todo, "priority")
-    # High priority in TW maps to 1 in CalDAV
-    assert priority is not None
+    # Completed tasks carry their end timestamp as COMPLETED
+    completed_todo = todos["Task to be completed"]
+    assert get_todo_property(completed_todo, "completed") is not None
+    assert get_todo_property(completed_todo, "status") == "COMPLETED"
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_create_with_tags(clean_test_environment) -> None:
-    """Create task with tags in TaskWarrior, verify they sync to CalDAV."""
-    # Create task with tags
-    description = "TaskWarrior task with tags"
-    task = create_task(description, tags=["urgent", "work"])
-    assert task is not None
-    assert "tags" in task
-    assert "urgent" in task["tags"]
-    assert "work" in task["tags"]
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo exists in CalDAV (tags might be in categories or description)
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_create_completed(clean_test_environment) -> None:
-    """Create and complete task in TaskWarrior, verify it syncs to CalDAV."""
-    # Create and complete task
-    description = "TaskWarrior completed task"
-    task = create_task(description)
-    assert task is not None
-    assert complete_task(task["uuid"])
-
-    # Run sync
-    assert run_sync()
-
-    # Verify todo is completed in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
-    # Note: This test creates, syncs, then completes the task
-    # For testing sync of pre-existing completed tasks (completed before first sync),
-    # see test_tw_to_caldav_sync_preexisting_completed
-    get_todos(calendar)
-    # The important thing is that sync succeeded without errors
-
-
-@pytest.mark.integration
-def test_tw_to_caldav_sync_preexisting_completed(clean_test_environment) -> None:
+def test_tw_to_caldav_sync_preexisting_completed(
+    caldav_session, clean_test_environment
+) -> None:
     """Sync completed task that existed before first sync (no caldav_uid).
 
     This test verifies that completed tasks without caldav_uid are discovered
@@ -259,10 +118,7 @@ def test_tw_to_caldav_sync_preexisting_completed(clean_test_environment) -> None
     assert synced_task.get("caldav_uid") is not None
 
     # Verify todo exists in CalDAV with completed status
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     # With include_completed=True, this should now work
     todo = find_todo_by_summary(calendar, description)
@@ -272,7 +128,9 @@ def test_tw_to_caldav_sync_preexisting_completed(clean_test_environment) -> None
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_modify_description(clean_test_environment) -> None:
+def test_tw_to_caldav_modify_description(
+    caldav_session, clean_test_environment
+) -> None:
     """Modify task description in TaskWarrior, verify it syncs to CalDAV."""
     # Create and sync initial task
     description = "Original TaskWarrior description"
@@ -281,16 +139,13 @@ def test_tw_to_caldav_modify_description(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify initial sync
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Modify description in TaskWarrior
     new_description = "Modified TaskWarrior description"
@@ -299,14 +154,13 @@ def test_tw_to_caldav_modify_description(clean_test_environment) -> None:
     # Run sync
     assert run_sync()
 
-    # Verify CalDAV todo summary updated
-    todo = find_todo_by_summary(calendar, new_description)
-    assert todo is not None
+    # Verify the same CalDAV todo has its summary updated
+    todo.load()
     assert str(get_todo_property(todo, "summary")) == new_description
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_modify_due_date(clean_test_environment) -> None:
+def test_tw_to_caldav_modify_due_date(caldav_session, clean_test_environment) -> None:
     """Modify task due date in TaskWarrior, verify it syncs to CalDAV."""
     # Create task with due date
     description = "TaskWarrior task with changeable due date"
@@ -315,7 +169,7 @@ def test_tw_to_caldav_modify_due_date(clean_test_environment) -> None:
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Modify due date in TaskWarrior
     assert modify_task(task["uuid"], due="3days")
@@ -324,10 +178,7 @@ def test_tw_to_caldav_modify_due_date(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify CalDAV todo due date updated
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -336,7 +187,7 @@ def test_tw_to_caldav_modify_due_date(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_modify_priority(clean_test_environment) -> None:
+def test_tw_to_caldav_modify_priority(caldav_session, clean_test_environment) -> None:
     """Modify task priority in TaskWarrior, verify it syncs to CalDAV."""
     # Create task with medium priority
     description = "TaskWarrior task with changeable priority"
@@ -345,7 +196,7 @@ def test_tw_to_caldav_modify_priority(clean_test_environment) -> None:
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Modify priority to high in TaskWarrior
     assert modify_task(task["uuid"], priority="H")
@@ -354,10 +205,7 @@ def test_tw_to_caldav_modify_priority(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify CalDAV todo priority updated
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -366,7 +214,7 @@ def test_tw_to_caldav_modify_priority(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_modify_tags_add(clean_test_environment) -> None:
+def test_tw_to_caldav_modify_tags_add(caldav_session, clean_test_environment) -> None:
     """Add tags to task in TaskWarrior, verify they sync to CalDAV."""
     # Create task without tags
     description = "TaskWarrior task for adding tags"
@@ -375,7 +223,7 @@ def test_tw_to_caldav_modify_tags_add(clean_test_environment) -> None:
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Add tags in TaskWarrior
     assert add_tags(task["uuid"], ["urgent", "important"])
@@ -384,17 +232,16 @@ def test_tw_to_caldav_modify_tags_add(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify tags synced to CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_modify_tags_remove(clean_test_environment) -> None:
+def test_tw_to_caldav_modify_tags_remove(
+    caldav_session, clean_test_environment
+) -> None:
     """Remove tags from task in TaskWarrior, verify they sync to CalDAV."""
     # Create task with tags
     description = "TaskWarrior task for removing tags"
@@ -403,7 +250,7 @@ def test_tw_to_caldav_modify_tags_remove(clean_test_environment) -> None:
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Remove a tag in TaskWarrior
     assert remove_tags(task["uuid"], ["temp"])
@@ -412,10 +259,7 @@ def test_tw_to_caldav_modify_tags_remove(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify task still exists in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -431,7 +275,7 @@ def test_tw_to_caldav_modify_status_to_completed(clean_test_environment) -> None
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Complete task in TaskWarrior
     assert complete_task(task["uuid"])
@@ -439,17 +283,11 @@ def test_tw_to_caldav_modify_status_to_completed(clean_test_environment) -> None
     # Run sync
     assert run_sync()
 
-    # Verify task is completed (might not be in todos() list)
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
-
     # Sync succeeded - completed tasks may not appear in calendar.todos()
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_delete(clean_test_environment) -> None:
+def test_tw_to_caldav_delete(caldav_session, clean_test_environment) -> None:
     """Delete task in TaskWarrior, verify it syncs to CalDAV."""
     # Create and sync task
     description = "TaskWarrior task to be deleted"
@@ -458,10 +296,7 @@ def test_tw_to_caldav_delete(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify initial sync
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todos_before = len(get_todos(calendar))
     assert todos_before == 1
@@ -478,7 +313,7 @@ def test_tw_to_caldav_delete(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_annotation_create(clean_test_environment) -> None:
+def test_tw_to_caldav_annotation_create(caldav_session, clean_test_environment) -> None:
     """Add annotation to task in TaskWarrior, verify it syncs to CalDAV."""
     # Create task
     description = "TaskWarrior task with annotation"
@@ -493,21 +328,18 @@ def test_tw_to_caldav_annotation_create(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify annotation in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
     todo_description = get_todo_property(todo, "description")
     assert todo_description is not None
-    assert "--- TaskWarrior Annotations ---" in str(todo_description)
+    assert ANNOTATIONS_MARKER in str(todo_description)
     assert annotation_text in str(todo_description)
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_annotation_add(clean_test_environment) -> None:
+def test_tw_to_caldav_annotation_add(caldav_session, clean_test_environment) -> None:
     """Add annotation to existing task in TaskWarrior, verify it syncs."""
     # Create task and sync
     description = "TaskWarrior task for adding annotation"
@@ -516,7 +348,7 @@ def test_tw_to_caldav_annotation_add(clean_test_environment) -> None:
     assert run_sync()
 
     # Wait to ensure timestamp separation
-    time.sleep(2)
+    wait_for_next_second()
 
     # Add annotation
     annotation_text = "Annotation added later"
@@ -526,10 +358,7 @@ def test_tw_to_caldav_annotation_add(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify annotation in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -539,7 +368,9 @@ def test_tw_to_caldav_annotation_add(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_annotation_multiple(clean_test_environment) -> None:
+def test_tw_to_caldav_annotation_multiple(
+    caldav_session, clean_test_environment
+) -> None:
     """Add multiple annotations to task in TaskWarrior, verify they sync."""
     # Create task with first annotation
     description = "TaskWarrior task with multiple annotations"
@@ -548,7 +379,7 @@ def test_tw_to_caldav_annotation_multiple(clean_test_environment) -> None:
 
     annotation1 = "First annotation"
     assert annotate_task(task["uuid"], annotation1)
-    time.sleep(1)
+    wait_for_next_second()
 
     # Add second annotation
     annotation2 = "Second annotation"
@@ -558,10 +389,7 @@ def test_tw_to_caldav_annotation_multiple(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify both annotations in CalDAV
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -573,7 +401,7 @@ def test_tw_to_caldav_annotation_multiple(clean_test_environment) -> None:
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_dry_run(clean_test_environment) -> None:
+def test_tw_to_caldav_dry_run(caldav_session, clean_test_environment) -> None:
     """Test dry-run mode doesn't modify CalDAV."""
     # Create task
     description = "TaskWarrior dry run test task"
@@ -581,10 +409,7 @@ def test_tw_to_caldav_dry_run(clean_test_environment) -> None:
     assert task is not None
 
     # Get CalDAV todo count before
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todos_before = len(get_todos(calendar))
     assert todos_before == 0
@@ -632,6 +457,7 @@ def test_tw_to_caldav_annotation_bidirectional_no_duplication(
 
 @pytest.mark.integration
 def test_tw_to_caldav_completed_syncs_completed_timestamp(
+    caldav_session,
     clean_test_environment,
 ) -> None:
     """Verify that completing a TW task syncs the COMPLETED timestamp to CalDAV.
@@ -648,17 +474,14 @@ def test_tw_to_caldav_completed_syncs_completed_timestamp(
     assert run_sync()
 
     # Complete the task in TW
-    time.sleep(1)
+    wait_for_next_second()
     assert complete_task(task["uuid"])
 
     # Sync to CalDAV
     assert run_sync()
 
     # Verify CalDAV has COMPLETED property
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
     todo = find_todo_by_summary(calendar, description)
     assert todo is not None
@@ -670,7 +493,7 @@ def test_tw_to_caldav_completed_syncs_completed_timestamp(
 
 
 @pytest.mark.integration
-def test_tw_to_caldav_delete_disabled(clean_test_environment) -> None:
+def test_tw_to_caldav_delete_disabled(caldav_session, clean_test_environment) -> None:
     """Delete task in TaskWarrior with delete_tasks=False.
 
     Verify CalDAV todo is set to CANCELLED status (soft delete).
@@ -684,17 +507,14 @@ def test_tw_to_caldav_delete_disabled(clean_test_environment) -> None:
     assert run_sync()
 
     # Verify initial sync
-    _, principal = get_caldav_client()
-    assert principal is not None
-    calendar = get_calendar(principal)
-    assert calendar is not None
+    _client, _principal, calendar = caldav_session
 
-    todos_before = len(get_todos(calendar))
-    assert todos_before == 1
+    todos_before = get_todos(calendar)
+    assert len(todos_before) == 1
 
     # Verify initial status is not CANCELLED
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
+    todo = todos_before[0]
+    assert str(get_todo_property(todo, "summary")) == description
     initial_status = get_todo_property(todo, "status")
     assert initial_status != "CANCELLED"
 
@@ -705,11 +525,11 @@ def test_tw_to_caldav_delete_disabled(clean_test_environment) -> None:
     assert run_sync(delete_tasks=False)
 
     # Verify CalDAV todo is NOT deleted but is CANCELLED
-    todos_after = len(get_todos(calendar))
-    assert todos_after == 1, "CalDAV todo should be preserved (as CANCELLED)"
+    todos_after = get_todos(calendar)
+    assert len(todos_after) == 1, "CalDAV todo should be preserved (as CANCELLED)"
 
     # Verify the todo has status CANCELLED
-    todo = find_todo_by_summary(calendar, description)
-    assert todo is not None
+    todo = todos_after[0]
+    assert str(get_todo_property(todo, "summary")) == description
     status = get_todo_property(todo, "status")
     assert status == "CANCELLED", f"Expected CANCELLED status, got {status}"
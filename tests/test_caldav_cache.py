@@ -0,0 +1,94 @@
+"""Tests for CalDAV cache module."""
+
+from twcaldav.caldav_cache import CalDAVCache, default_cache_path
+
+
+class TestCalDAVCache:
+    """Tests for CalDAVCache class."""
+
+    def test_default_path_honours_xdg(self, tmp_path, monkeypatch) -> None:
+        """Test that the default path lives under XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_path() == tmp_path / "twcaldav" / "caldav.json"
+
+    def test_default_path_per_config(self, tmp_path, monkeypatch) -> None:
+        """Test that each configuration file gets its own cache file."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        work = default_cache_path(tmp_path / "work.toml")
+        home = default_cache_path(tmp_path / "home.toml")
+
+        assert work.parent == tmp_path / "twcaldav"
+        assert work != home
+        assert work != default_cache_path()
+        assert work == default_cache_path(tmp_path / "work.toml")
+
+    def test_get_miss_on_empty_cache(self, tmp_path) -> None:
+        """Test that an empty cache returns None."""
+        cache = CalDAVCache(tmp_path / "caldav.json")
+        assert cache.get("https://example.com/work/", "ctag-1") is None
+
+    def test_put_and_get(self, tmp_path) -> None:
+        """Test that objects are returned only for the matching ctag."""
+        cache = CalDAVCache(tmp_path / "caldav.json")
+        cache.put(
+            "https://example.com/work/", "ctag-1", {"/work/a.ics": "BEGIN:VCALENDAR"}
+        )
+
+        assert cache.get("https://example.com/work/", "ctag-1") == ["BEGIN:VCALENDAR"]
+        assert cache.get("https://example.com/work/", "ctag-2") is None
+
+    def test_save_and_reload(self, tmp_path) -> None:
+        """Test that saved entries survive a reload."""
+        path = tmp_path / "nested" / "caldav.json"
+        cache = CalDAVCache(path)
+        cache.put("https://example.com/work/", "ctag-1", {"/work/a.ics": "data"})
+        cache.save()
+
+        reloaded = CalDAVCache(path)
+        assert reloaded.get("https://example.com/work/", "ctag-1") == ["data"]
+        assert list(path.parent.glob("*.tmp")) == []
+
+    def test_sync_base(self, tmp_path) -> None:
+        """Test that the sync base is only available with a sync token."""
+        cache = CalDAVCache(tmp_path / "caldav.json")
+        cache.put("https://example.com/work/", "ctag-1", {"/work/a.ics": "data"})
+        assert cache.get_sync_base("https://example.com/work/") is None
+
+        cache.put("https://example.com/work/", None, {"/work/a.ics": "data"}, "token-1")
+        assert cache.get_sync_base("https://example.com/work/") == (
+            "token-1",
+            {"/work/a.ics": "data"},
+        )
+        # Without a ctag, the entry is never served as unchanged
+        assert cache.get("https://example.com/work/", None) is None
+
+    def test_old_format_entries_are_dropped(self, tmp_path) -> None:
+        """Test that entries with a list of objects are refetched."""
+        path = tmp_path / "caldav.json"
+        path.write_text(
+            '{"calendars": {"https://example.com/work/": '
+            '{"ctag": "ctag-1", "objects": ["data"]}}}'
+        )
+
+        cache = CalDAVCache(path)
+        assert cache.get("https://example.com/work/", "ctag-1") is None
+
+    def test_clear(self, tmp_path) -> None:
+        """Test that clearing drops entries on the next save."""
+        path = tmp_path / "caldav.json"
+        cache = CalDAVCache(path)
+        cache.put("https://example.com/work/", "ctag-1", {"/work/a.ics": "data"})
+        cache.save()
+
+        cache.clear()
+        cache.save()
+
+        assert CalDAVCache(path).get("https://example.com/work/", "ctag-1") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path) -> None:
+        """Test that an unreadable cache file starts an empty cache."""
+        path = tmp_path / "caldav.json"
+        path.write_text("not json")
+
+        cache = CalDAVCache(path)
+        assert cache.get("https://example.com/work/", "ctag-1") is None
@@ -1,12 +1,13 @@
 """Tests for CalDAV client module."""
 
 from datetime import UTC, datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from icalendar import Calendar, Todo
 
-from twcaldav.caldav_client import CalDAVClient, CalDAVError, VTodo
+from twcaldav.caldav_cache import CalDAVCache
+from twcaldav.caldav_client import CalDAVClient, CalDAVError, GetCTag, VTodo
 
 
 class TestVTodo:
@@ -115,6 +116,19 @@ class TestCalDAVClient:
                 url="https://caldav.example.com", username="user", password="pass"
             )
 
+    @patch("caldav.DAVClient")
+    def test_close(self, mock_dav_client) -> None:
+        """Test closing the client releases the DAV session."""
+        mock_client_instance = Mock()
+        mock_dav_client.return_value = mock_client_instance
+
+        client = CalDAVClient(
+            url="https://caldav.example.com", username="user", password="pass"
+        )
+        client.close()
+
+        mock_client_instance.close.assert_called_once()
+
     @patch("caldav.DAVClient")
     def test_list_calendars(self, mock_dav_client) -> None:
         """Test listing calendars."""
@@ -213,6 +227,200 @@ class TestCalDAVClient:
         assert todos[0].uid == "test-uid-123"
         assert todos[0].summary == "Test task"
 
+    @patch("caldav.DAVClient")
+    def test_get_todos_multi(self, mock_dav_client) -> None:
+        """Test getting todos from several calendars with one calendar listing."""
+        mock_calendars = []
+        for calendar_id in ["Work", "Personal"]:
+            todo_component = Todo()
+            todo_component.add("UID", f"{calendar_id}-uid")
+            todo_component.add("SUMMARY", f"{calendar_id} task")
+
+            cal = Calendar()
+            cal.add_component(todo_component)
+
+            mock_todo = Mock()
+            mock_todo.data = cal.to_ical()
+
+            mock_calendar = Mock()
+            mock_calendar.id = calendar_id
+            mock_calendar.todos.return_value = [mock_todo]
+            mock_calendars.append(mock_calendar)
+
+        mock_principal = Mock()
+        mock_principal.calendars.return_value = mock_calendars
+
+        mock_client_instance = Mock()
+        mock_client_instance.principal.return_value = mock_principal
+        mock_dav_client.return_value = mock_client_instance
+
+        client = CalDAVClient(
+            url="https://caldav.example.com", username="user", password="pass"
+        )
+        todos = client.get_todos_multi(["Work", "Personal"])
+
+        assert [t.uid for t in todos["Work"]] == ["Work-uid"]
+        assert [t.uid for t in todos["Personal"]] == ["Personal-uid"]
+        mock_principal.calendars.assert_called_once()
+
+        # A bounded pool still queries every calendar
+        bounded = client.get_todos_multi(["Work", "Personal"], max_workers=1)
+        assert [t.uid for t in bounded["Personal"]] == ["Personal-uid"]
+
+        # A calendar listed twice is only queried once
+        mock_calendars[0].todos.reset_mock()
+        shared = client.get_todos_multi(["Work", "Work"])
+        assert list(shared) == ["Work"]
+        mock_calendars[0].todos.assert_called_once()
+
+    @patch("caldav.DAVClient")
+    def test_get_todos_multi_calendar_not_found(self, mock_dav_client) -> None:
+        """Test getting todos from several calendars when one is missing."""
+        mock_calendar = Mock()
+        mock_calendar.id = "Work"
+
+        mock_principal = Mock()
+        mock_principal.calendars.return_value = [mock_calendar]
+
+        mock_client_instance = Mock()
+        mock_client_instance.principal.return_value = mock_principal
+        mock_dav_client.return_value = mock_client_instance
+
+        client = CalDAVClient(
+            url="https://caldav.example.com", username="user", password="pass"
+        )
+
+        with pytest.raises(CalDAVError, match="Calendar not found"):
+            client.get_todos_multi(["Work", "Missing"])
+
+    @patch("caldav.DAVClient")
+    def test_get_todos_uses_cache_when_ctag_unchanged(
+        self, mock_dav_client, tmp_path
+    ) -> None:
+        """Test that an unchanged ctag serves todos from the cache."""
+        todo_component = Todo()
+        todo_component.add("UID", "cached-uid")
+        todo_component.add("SUMMARY", "Cached task")
+
+        cal = Calendar()
+        cal.add_component(todo_component)
+
+        mock_todo = Mock()
+        mock_todo.data = cal.to_ical()
+
+        mock_calendar = Mock()
+        mock_calendar.id = "Work"
+        mock_calendar.url = "https://caldav.example.com/work/"
+        mock_calendar.get_properties.return_value = {GetCTag.tag: "ctag-1"}
+        mock_calendar.todos.return_value = [mock_todo]
+
+        mock_principal = Mock()
+        mock_principal.calendars.return_value = [mock_calendar]
+
+        mock_client_instance = Mock()
+        mock_client_instance.principal.return_value = mock_principal
+        mock_dav_client.return_value = mock_client_instance
+
+        cache_path = tmp_path / "caldav.json"
+        client = CalDAVClient(
+            url="https://caldav.example.com",
+            username="user",
+            password="pass",
+            cache=CalDAVCache(cache_path),
+        )
+        first = client.get_todos("Work")
+        client.cache.save()
+
+        # A fresh cache loaded from disk should avoid re-downloading
+        client.cache = CalDAVCache(cache_path)
+        second = client.get_todos("Work")
+
+        assert [t.uid for t in first] == ["cached-uid"]
+        assert [t.uid for t in second] == ["cached-uid"]
+        mock_calendar.todos.assert_called_once()
+
+        # A changed ctag triggers a new download
+        mock_calendar.get_properties.return_value = {GetCTag.tag: "ctag-2"}
+        client.get_todos("Work")
+        assert mock_calendar.todos.call_count == 2
+
+    @patch("caldav.DAVClient")
+    def test_get_todos_applies_sync_token_changes(
+        self, mock_dav_client, tmp_path
+    ) -> None:
+        """Test that a changed calendar is updated from its sync-token delta."""
+
+        def make_object(href: str, uid: str | None) -> Mock:
+            obj = Mock()
+            obj.url = href
+            obj.data = None
+            if uid:
+                todo_component = Todo()
+                todo_component.add("UID", uid)
+                todo_component.add("SUMMARY", f"Task {uid}")
+                cal = Calendar()
+                cal.add_component(todo_component)
+                obj.data = cal.to_ical()
+            return obj
+
+        mock_calendar = Mock()
+        mock_calendar.id = "Work"
+        mock_calendar.url = "https://caldav.example.com/work/"
+        mock_calendar.get_properties.return_value = {
+            GetCTag.tag: "ctag-1",
+            "{DAV:}sync-token": "token-1",
+        }
+        mock_calendar.todos.return_value = [
+            make_object("/work/a.ics", "uid-a"),
+            make_object("/work/b.ics", "uid-b"),
+        ]
+
+        mock_principal = Mock()
+        mock_principal.calendars.return_value = [mock_calendar]
+
+        mock_client_instance = Mock()
+        mock_client_instance.principal.return_value = mock_principal
+        mock_dav_client.return_value = mock_client_instance
+
+        client = CalDAVClient(
+            url="https://caldav.example.com",
+            username="user",
+            password="pass",
+            cache=CalDAVCache(tmp_path / "caldav.json"),
+        )
+        first = client.get_todos("Work")
+        assert sorted(t.uid for t in first) == ["uid-a", "uid-b"]
+
+        # b.ics was deleted and c.ics added since token-1
+        changes = MagicMock()
+        changes.sync_token = "token-2"
+        changes.__iter__.return_value = [
+            make_object("/work/b.ics", None),
+            make_object("/work/c.ics", "uid-c"),
+        ]
+        mock_calendar.objects_by_sync_token.return_value = changes
+        mock_calendar.get_properties.return_value = {
+            GetCTag.tag: "ctag-2",
+            "{DAV:}sync-token": "token-2",
+        }
+
+        second = client.get_todos("Work")
+
+        assert sorted(t.uid for t in second) == ["uid-a", "uid-c"]
+        mock_calendar.todos.assert_called_once()
+        mock_calendar.objects_by_sync_token.assert_called_once_with(
+            sync_token="token-1", load_objects=True
+        )
+
+        # A rejected sync token falls back to a full download
+        mock_calendar.objects_by_sync_token.side_effect = Exception("409")
+        mock_calendar.get_properties.return_value = {
+            GetCTag.tag: "ctag-3",
+            "{DAV:}sync-token": "token-3",
+        }
+        client.get_todos("Work")
+        assert mock_calendar.todos.call_count == 2
+
     @patch("caldav.DAVClient")
     def test_create_todo(self, mock_dav_client) -> None:
         """Test creating a todo."""
@@ -11,6 +11,12 @@ from twcaldav.config import ProjectCalendarMapping
 from twcaldav.taskwarrior import Task
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep the CalDAV cache out of the user's home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 def test_parse_args_defaults() -> None:
     """Test default arguments."""
     args = parse_args(["sync"])
@@ -68,6 +74,15 @@ def test_parse_args_conflicting_delete_flags() -> None:
         parse_args(["sync", "--delete", "--no-delete"])
 
 
+def test_parse_args_force_full() -> None:
+    """Test force-full flag."""
+    args = parse_args(["sync"])
+    assert args.force_full is False
+
+    args = parse_args(["sync", "--force-full"])
+    assert args.force_full is True
+
+
 def test_parse_args_combined() -> None:
     """Test combining multiple arguments."""
     args = parse_args(["sync", "-v", "-c", "/my/config.toml", "-n", "--delete"])
@@ -140,9 +155,12 @@ caldav_calendar = "Work Tasks"
     assert result == 0
     mock_config_cls.from_file.assert_called_once()
     mock_tw_cls.assert_called_once()
-    mock_caldav_cls.assert_called_once_with(
-        url="https://example.com/caldav", username="user", password="pass"
-    )
+    mock_caldav_cls.assert_called_once()
+    caldav_kwargs = mock_caldav_cls.call_args.kwargs
+    assert caldav_kwargs["url"] == "https://example.com/caldav"
+    assert caldav_kwargs["username"] == "user"
+    assert caldav_kwargs["password"] == "pass"
+    assert caldav_kwargs["cache"] is not None
     mock_sync_cls.assert_called_once_with(
         config=mock_config,
         tw=mock_tw,
@@ -436,7 +454,8 @@ caldav_calendar = "Work Tasks"
     mock_config_cls.from_file.return_value = mock_config
 
     mock_tw_cls.return_value = MagicMock()
-    mock_caldav_cls.return_value = MagicMock()
+    mock_caldav = MagicMock()
+    mock_caldav_cls.return_value = mock_caldav
 
     # Mock sync engine to raise exception
     mock_sync = MagicMock()
@@ -446,8 +465,9 @@ caldav_calendar = "Work Tasks"
     # Run main
     result = main(["sync", "-c", str(config_file)])
 
-    # Should return error code
+    # Should return error code and still release the CalDAV connections
     assert result == 1
+    mock_caldav.close.assert_called_once()
 
 
 # Tests for new subcommands
@@ -540,6 +560,7 @@ caldav_calendar = "Work Tasks"
             caldav_uid="uid2",
         ),
     ]
+    mock_tw.modify_tasks.return_value = []
     mock_tw_cls.return_value = mock_tw
 
     # Run unlink with --yes flag
@@ -548,7 +569,10 @@ caldav_calendar = "Work Tasks"
     # Verify
     assert result == 0
     mock_tw.export_tasks.assert_called_once_with(["caldav_uid.any:"])
-    assert mock_tw.modify_task.call_count == 2
+    mock_tw.modify_task.assert_not_called()
+    mock_tw.modify_tasks.assert_called_once_with(
+        {"uuid1": {"caldav_uid": None}, "uuid2": {"caldav_uid": None}}
+    )
 
 
 @patch("twcaldav.taskwarrior.TaskWarrior")
@@ -622,6 +646,7 @@ caldav_calendar = "Work Tasks"
     # Verify no modifications were made
     assert result == 0
     mock_tw.modify_task.assert_not_called()
+    mock_tw.modify_tasks.assert_not_called()
 
 
 @patch("twcaldav.caldav_client.CalDAVClient")
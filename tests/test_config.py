@@ -152,6 +152,33 @@ def test_config_sync_defaults() -> None:
 
     config = Config.from_dict(data)
     assert config.sync.delete_tasks is False
+    assert config.sync.concurrency == 8
+
+
+def test_config_sync_concurrency() -> None:
+    """Test parsing and validation of the sync concurrency setting."""
+    data = {
+        "caldav": {
+            "url": "https://caldav.example.com",
+            "username": "testuser",
+            "password": "testpass",
+        },
+        "mappings": [
+            {
+                "taskwarrior_project": "work",
+                "caldav_calendar": "Work Calendar",
+            }
+        ],
+        "sync": {"concurrency": 2},
+    }
+
+    config = Config.from_dict(data)
+    assert config.sync.concurrency == 2
+
+    for invalid in (0, -1, "4", True):
+        data["sync"] = {"concurrency": invalid}
+        with pytest.raises(ValueError, match="concurrency"):
+            Config.from_dict(data)
 
 
 def test_get_calendar_for_project() -> None:
@@ -46,7 +46,9 @@ def sample_config():
 @pytest.fixture
 def mock_tw():
     """Create a mock TaskWarrior client."""
-    return Mock(spec=TaskWarrior)
+    tw = Mock(spec=TaskWarrior)
+    tw.modify_tasks.return_value = []
+    return tw
 
 
 @pytest.fixture
@@ -145,19 +147,41 @@ class TestSyncEngine:
         )
         assert engine.dry_run is True
 
+    def test_init_mapping_lookups_match_config(
+        self, sample_config, mock_tw, mock_caldav
+    ) -> None:
+        """Test that precomputed mapping lookups agree with Config."""
+        sample_config.mappings.append(
+            ProjectCalendarMapping(
+                taskwarrior_project="work", caldav_calendar="Other Tasks"
+            )
+        )
+        engine = SyncEngine(config=sample_config, tw=mock_tw, caldav_client=mock_caldav)
+
+        for project in ["work", "personal", "unknown"]:
+            assert engine._project_to_calendar.get(
+                project
+            ) == sample_config.get_calendar_for_project(project)
+        for calendar in ["Work Tasks", "Personal Tasks", "Other Tasks", "Unknown"]:
+            assert engine._calendar_to_project.get(
+                calendar
+            ) == sample_config.get_project_for_calendar(calendar)
+
     def test_discover_and_correlate_empty(
         self, sync_engine, mock_tw, mock_caldav
     ) -> None:
         """Test discovery with no tasks."""
         mock_tw.export_tasks.return_value = []
-        mock_caldav.get_calendar.return_value = Mock()
-        mock_caldav.get_todos.return_value = []
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
 
         pairs = sync_engine._discover_and_correlate()
 
         assert len(pairs) == 0
-        # Should call export_tasks once for each mapped project (no status filter)
-        assert mock_tw.export_tasks.call_count == 2
+        # Should export all mapped projects at once (no status filter)
+        mock_tw.export_tasks.assert_called_once()
 
     def test_discover_and_correlate_tw_only(
         self, sync_engine, mock_tw, mock_caldav
@@ -171,8 +195,10 @@ class TestSyncEngine:
             project="work",
         )
         mock_tw.export_tasks.return_value = [tw_task]
-        mock_caldav.get_calendar.return_value = Mock()
-        mock_caldav.get_todos.return_value = []
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
 
         pairs = sync_engine._discover_and_correlate()
 
@@ -192,8 +218,10 @@ class TestSyncEngine:
             status="NEEDS-ACTION",
         )
         mock_tw.export_tasks.return_value = []
-        mock_caldav.get_calendar.return_value = Mock()
-        mock_caldav.get_todos.return_value = [caldav_todo]
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [caldav_todo],
+            "Personal Tasks": [],
+        }
 
         pairs = sync_engine._discover_and_correlate()
 
@@ -225,8 +253,10 @@ class TestSyncEngine:
         )
 
         mock_tw.export_tasks.return_value = [tw_task]
-        mock_caldav.get_calendar.return_value = Mock()
-        mock_caldav.get_todos.return_value = [caldav_todo]
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [caldav_todo],
+            "Personal Tasks": [],
+        }
 
         pairs = sync_engine._discover_and_correlate()
 
@@ -237,6 +267,33 @@ class TestSyncEngine:
         assert pairs[0].action == SyncAction.UPDATE
         assert pairs[0].direction == SyncDirection.CALDAV_TO_TW
 
+    def test_discover_and_correlate_per_mapping_results(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test discovery fetches all calendars in one batch and tracks origins."""
+        todos_by_calendar = {
+            "Work Tasks": [VTodo(uid="cd-work", summary="Work todo")],
+            "Personal Tasks": [VTodo(uid="cd-personal", summary="Personal todo")],
+        }
+        mock_tw.export_tasks.return_value = []
+        mock_caldav.get_todos_multi.return_value = todos_by_calendar
+
+        pairs = sync_engine._discover_and_correlate()
+
+        assert len(pairs) == 2
+        assert sync_engine.caldav_uid_to_calendar == {
+            "cd-work": "Work Tasks",
+            "cd-personal": "Personal Tasks",
+        }
+        mock_caldav.get_todos_multi.assert_called_once_with(
+            ["Work Tasks", "Personal Tasks"],
+            max_workers=sync_engine.config.sync.concurrency,
+        )
+        mock_tw.export_tasks.assert_called_once()
+        export_kwargs = mock_tw.export_tasks.call_args.kwargs
+        assert export_kwargs["projects"] == ["work", "personal"]
+        assert "status.not:deleted" in export_kwargs["filter_args"]
+
     def test_classify_both_missing(self, sync_engine) -> None:
         """Test classification when both tasks are missing."""
         pair = sync_engine.classifier.classify(None, None)
@@ -430,8 +487,8 @@ class TestSyncEngine:
         assert pair.direction == SyncDirection.CALDAV_TO_TW
         assert "caldav more recent" in pair.reason.lower()
 
-    def test_execute_sync_action_skip(self, sync_engine) -> None:
-        """Test executing a SKIP action."""
+    def test_execute_sync_actions_skip(self, sync_engine) -> None:
+        """Test that SKIP actions are only counted."""
         pair = TaskPair(
             tw_task=None,
             caldav_todo=None,
@@ -439,9 +496,25 @@ class TestSyncEngine:
             direction=None,
             reason="Test skip",
         )
-        sync_engine._execute_sync_action(pair)
+        sync_engine._execute_sync_actions(sync_engine._partition_by_action([pair]))
         assert sync_engine.stats.skipped == 1
 
+    def test_partition_by_action(self, sync_engine) -> None:
+        """Test grouping task pairs by sync action."""
+        create = TaskPair(
+            None, VTodo(uid="a", summary="A"), SyncAction.CREATE, None, ""
+        )
+        skip = TaskPair(None, VTodo(uid="b", summary="B"), SyncAction.SKIP, None, "")
+
+        pairs_by_action = sync_engine._partition_by_action([create, skip])
+
+        assert pairs_by_action == {
+            SyncAction.CREATE: [create],
+            SyncAction.UPDATE: [],
+            SyncAction.DELETE: [],
+            SyncAction.SKIP: [skip],
+        }
+
     @patch("twcaldav.sync_engine.taskwarrior_to_caldav")
     def test_execute_create_tw_to_caldav(
         self, mock_convert, sync_engine, mock_caldav
@@ -469,8 +542,42 @@ class TestSyncEngine:
 
         mock_convert.assert_called_once_with(tw_task)
         mock_caldav.create_todo.assert_called_once_with("Work Tasks", mock_vtodo)
+        assert sync_engine._pending_caldav_uids == {"tw-123": "new-uid"}
+
+        # Counted once the caldav_uid writeback is stored
+        assert sync_engine.stats.caldav_created == 0
+        sync_engine._flush_caldav_uid_writebacks()
         assert sync_engine.stats.caldav_created == 1
 
+    @patch("twcaldav.sync_engine.taskwarrior_to_caldav")
+    def test_execute_create_reuses_conversion(
+        self, mock_convert, sync_engine, mock_caldav
+    ) -> None:
+        """Test that re-executing a pair reuses its converted todo."""
+        tw_task = Task(
+            uuid="tw-123",
+            description="Test",
+            status="pending",
+            entry=datetime.now(),
+            project="work",
+        )
+        pair = TaskPair(
+            tw_task=tw_task,
+            caldav_todo=None,
+            action=SyncAction.CREATE,
+            direction=SyncDirection.TW_TO_CALDAV,
+            reason="New task",
+        )
+        mock_convert.return_value = VTodo(uid="new-uid", summary="Test")
+        mock_caldav.create_todo.side_effect = [RuntimeError("timeout"), None]
+
+        sync_engine._execute_sync_action(pair)
+        sync_engine._execute_sync_action(pair)
+
+        mock_convert.assert_called_once_with(tw_task)
+        assert pair.converted_vtodo is mock_convert.return_value
+        assert mock_caldav.create_todo.call_count == 2
+
     @patch("twcaldav.sync_engine.caldav_to_taskwarrior")
     def test_execute_create_caldav_to_tw(
         self, mock_convert, sync_engine, mock_tw
@@ -496,7 +603,10 @@ class TestSyncEngine:
         sync_engine._execute_create(pair)
 
         mock_convert.assert_called_once_with(caldav_todo)
-        mock_tw.create_task.assert_called_once_with(mock_task)
+        # Created tasks are imported in one batch once all actions have run
+        mock_tw.import_tasks.assert_not_called()
+        sync_engine._flush_task_imports()
+        mock_tw.import_tasks.assert_called_once_with([mock_task])
         assert sync_engine.stats.tw_created == 1
 
     @patch("twcaldav.sync_engine.taskwarrior_to_caldav")
@@ -575,7 +685,8 @@ class TestSyncEngine:
         assert mock_task.uuid == "tw-123"  # UUID should be preserved
         assert mock_task.entry == tw_task.entry  # Entry should be preserved
         # Should use import_tasks instead of modify_task for proper annotation handling
-        mock_tw.import_tasks.assert_called_once()
+        sync_engine._flush_task_imports()
+        mock_tw.import_tasks.assert_called_once_with([mock_task])
         assert sync_engine.stats.tw_updated == 1
 
     def test_execute_delete_tw_to_caldav(self, sync_engine, mock_caldav) -> None:
@@ -628,7 +739,11 @@ class TestSyncEngine:
 
         sync_engine._execute_delete(pair)
 
-        mock_tw.delete_task.assert_called_once_with("tw-123")
+        # Deletions are applied in one batch once all actions have run
+        mock_tw.delete_tasks.assert_not_called()
+        sync_engine._flush_task_deletes()
+        mock_tw.delete_task.assert_not_called()
+        mock_tw.delete_tasks.assert_called_once_with(["tw-123"])
         assert sync_engine.stats.tw_deleted == 1
 
     def test_execute_cancel_caldav(self, sync_engine, mock_caldav) -> None:
@@ -700,8 +815,10 @@ class TestSyncEngine:
             project="work",
         )
         mock_tw.export_tasks.return_value = [tw_task]
-        mock_caldav.get_calendar.return_value = Mock()
-        mock_caldav.get_todos.return_value = []
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
 
         with patch("twcaldav.sync_engine.taskwarrior_to_caldav") as mock_convert:
             mock_vtodo = VTodo(uid="new-uid", summary="Test")
@@ -712,6 +829,196 @@ class TestSyncEngine:
             assert stats.caldav_created == 1
             assert stats.errors == 0
 
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_sync_executes_all_actions(
+        self, sample_config, mock_tw, mock_caldav, concurrency
+    ) -> None:
+        """Test that every action runs and is counted, sequentially or not."""
+        sample_config.sync.concurrency = concurrency
+        engine = SyncEngine(
+            config=sample_config,
+            tw=mock_tw,
+            caldav_client=mock_caldav,
+            dry_run=False,
+        )
+        tw_tasks = [
+            Task(
+                uuid=f"tw-{i}",
+                description=f"Task {i}",
+                status="pending",
+                entry=datetime.now(),
+                project="work",
+            )
+            for i in range(20)
+        ]
+        mock_tw.export_tasks.return_value = tw_tasks
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
+
+        stats = engine.sync()
+
+        assert stats.caldav_created == 20
+        assert stats.errors == 0
+        assert mock_caldav.create_todo.call_count == 20
+        # All caldav_uid writebacks are applied in a single batch
+        mock_tw.modify_task.assert_not_called()
+        mock_tw.modify_tasks.assert_called_once()
+        writebacks = mock_tw.modify_tasks.call_args.args[0]
+        assert set(writebacks) == {f"tw-{i}" for i in range(20)}
+        # Discovery fans out over CalDAV with the same bound
+        mock_caldav.get_todos_multi.assert_called_once_with(
+            ["Work Tasks", "Personal Tasks"], max_workers=concurrency
+        )
+
+    def test_sync_writeback_failure_counts_errors(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that a failed caldav_uid writeback is reported as errors."""
+        tw_task = Task(
+            uuid="tw-123",
+            description="Test",
+            status="pending",
+            entry=datetime.now(),
+            project="work",
+        )
+        mock_tw.export_tasks.return_value = [tw_task]
+        mock_tw.modify_tasks.side_effect = RuntimeError("TaskWarrior error")
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.caldav_created == 0
+        assert stats.errors == 1
+
+    def test_sync_writeback_skips_missing_tasks(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that a missing task only fails its own caldav_uid writeback."""
+        mock_tw.export_tasks.return_value = [
+            Task(
+                uuid=f"tw-{i}",
+                description=f"Task {i}",
+                status="pending",
+                entry=datetime.now(),
+                project="work",
+            )
+            for i in range(3)
+        ]
+        mock_tw.modify_tasks.return_value = ["tw-1"]
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.caldav_created == 2
+        assert stats.errors == 1
+
+    def test_sync_imports_caldav_tasks_in_one_batch(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that tasks created from CalDAV are imported with one call."""
+        mock_tw.export_tasks.return_value = []
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [
+                VTodo(uid=f"cd-{i}", summary=f"Todo {i}", status="NEEDS-ACTION")
+                for i in range(3)
+            ],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.tw_created == 3
+        mock_tw.create_task.assert_not_called()
+        mock_tw.import_tasks.assert_called_once()
+        imported = mock_tw.import_tasks.call_args.args[0]
+        assert [t.caldav_uid for t in imported] == ["cd-0", "cd-1", "cd-2"]
+        assert {t.project for t in imported} == {"work"}
+
+    def test_sync_import_failure_counts_errors(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that a failed batch import is reported as errors."""
+        mock_tw.export_tasks.return_value = []
+        mock_tw.import_tasks.side_effect = RuntimeError("TaskWarrior error")
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [
+                VTodo(uid=f"cd-{i}", summary=f"Todo {i}", status="NEEDS-ACTION")
+                for i in range(2)
+            ],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.tw_created == 0
+        assert stats.errors == 2
+        # The failed batch is retried one task at a time
+        assert mock_tw.import_tasks.call_count == 3
+
+    def test_sync_import_failure_retries_each_task(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that one bad task does not fail the import of the others."""
+
+        def import_tasks(tasks: list[Task]) -> None:
+            if any(task.caldav_uid == "cd-1" for task in tasks):
+                raise RuntimeError("TaskWarrior error")
+
+        mock_tw.export_tasks.return_value = []
+        mock_tw.import_tasks.side_effect = import_tasks
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [
+                VTodo(uid=f"cd-{i}", summary=f"Todo {i}", status="NEEDS-ACTION")
+                for i in range(3)
+            ],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.tw_created == 2
+        assert stats.errors == 1
+
+    def test_sync_delete_failure_retries_each_task(
+        self, sync_engine, mock_tw, mock_caldav
+    ) -> None:
+        """Test that one failing deletion does not fail the others."""
+
+        def delete_tasks(uuids: list[str]) -> None:
+            if "tw-1" in uuids:
+                raise RuntimeError("TaskWarrior error")
+
+        mock_tw.export_tasks.return_value = [
+            Task(
+                uuid=f"tw-{i}",
+                description=f"Task {i}",
+                status="pending",
+                entry=datetime.now(),
+                project="work",
+                caldav_uid=f"cd-{i}",
+            )
+            for i in range(3)
+        ]
+        mock_tw.delete_tasks.side_effect = delete_tasks
+        mock_caldav.get_todos_multi.return_value = {
+            "Work Tasks": [],
+            "Personal Tasks": [],
+        }
+
+        stats = sync_engine.sync()
+
+        assert stats.tw_deleted == 2
+        assert stats.errors == 1
+        assert mock_tw.delete_tasks.call_count == 4
+
     def test_sync_with_error(self, sync_engine, mock_tw, mock_caldav) -> None:
         """Test sync with error during discovery."""
         mock_tw.export_tasks.side_effect = RuntimeError("TaskWarrior error")
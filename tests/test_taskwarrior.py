@@ -1,16 +1,32 @@
 """Tests for TaskWarrior module."""
 
+import io
 import json
 import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from twcaldav.taskwarrior import Task, TaskWarrior, TaskWarriorError
 
 
+def mock_export_output(
+    mock_popen: Mock, stdout: bytes, returncode: int = 0, stderr: bytes = b""
+) -> None:
+    """Make a patched subprocess.Popen produce the given command output."""
+    proc = MagicMock()
+    proc.stdout = io.BytesIO(stdout)
+    proc.wait.return_value = returncode
+
+    def popen(cmd, **kwargs):
+        kwargs["stderr"].write(stderr)
+        return proc
+
+    mock_popen.side_effect = popen
+
+
 class TestTask:
     """Tests for Task dataclass."""
 
@@ -36,6 +52,25 @@ class TestTask:
         assert task.tags is None
         assert task.annotations is None
 
+    def test_from_dict_shares_parsed_timestamps(self) -> None:
+        """Test that identical timestamps are parsed once and shared."""
+        tasks = [
+            Task.from_dict(
+                {
+                    "uuid": f"uuid-{i}",
+                    "description": "Test task",
+                    "status": "pending",
+                    "entry": "20241117T100000Z",
+                    "modified": "20241117T100000Z",
+                }
+            )
+            for i in range(2)
+        ]
+
+        assert tasks[0].entry == datetime(2024, 11, 17, 10, 0, 0, tzinfo=UTC)
+        assert tasks[0].entry is tasks[1].entry
+        assert tasks[0].modified is tasks[1].entry
+
     def test_from_dict_full(self) -> None:
         """Test creating Task from complete dictionary."""
         data = {
@@ -80,6 +115,25 @@ class TestTask:
         assert "modified" not in data
         assert "project" not in data
 
+    def test_to_dict_timestamp_format(self) -> None:
+        """Test that timestamps are formatted like strftime would."""
+        for value in [
+            datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+            datetime(1999, 12, 31, 23, 59, 59),
+        ]:
+            task = Task(
+                uuid="12345678-1234-1234-1234-123456789012",
+                description="Task",
+                status="pending",
+                entry=value,
+                due=value,
+            )
+
+            data = task.to_dict()
+
+            assert data["entry"] == value.strftime("%Y%m%dT%H%M%SZ")
+            assert data["due"] == data["entry"]
+
     def test_to_dict_full(self) -> None:
         """Test converting complete Task to dictionary."""
         task = Task(
@@ -111,7 +165,7 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_init_success(self, mock_run) -> None:
         """Test successful initialization."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
 
         tw = TaskWarrior()
 
@@ -130,7 +184,7 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_init_custom_binary(self, mock_run) -> None:
         """Test initialization with custom binary path."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
 
         tw = TaskWarrior(task_bin="/usr/local/bin/task")
 
@@ -139,30 +193,32 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_init_with_taskdata(self, mock_run) -> None:
         """Test initialization with custom TASKDATA."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
 
         tw = TaskWarrior(taskdata=Path("/tmp/taskdata"))
 
         assert tw.taskdata == Path("/tmp/taskdata")
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_export_tasks_empty(self, mock_run) -> None:
+    def test_export_tasks_empty(self, mock_run, mock_popen) -> None:
         """Test exporting when no tasks match."""
         # First call for init check
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         # Second call for export
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_export_output(mock_popen, b"")
         tasks = tw.export_tasks()
 
         assert tasks == []
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_export_tasks_single(self, mock_run) -> None:
+    def test_export_tasks_single(self, mock_run, mock_popen) -> None:
         """Test exporting a single task."""
         # First call for init
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         # Second call for export
@@ -176,7 +232,7 @@ class TestTaskWarrior:
                 }
             ]
         )
-        mock_run.return_value = Mock(stdout=task_json, returncode=0)
+        mock_export_output(mock_popen, task_json.encode())
 
         tasks = tw.export_tasks()
 
@@ -184,10 +240,11 @@ class TestTaskWarrior:
         assert tasks[0].uuid == "12345678-1234-1234-1234-123456789012"
         assert tasks[0].description == "Test task"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_export_tasks_with_project_filter(self, mock_run) -> None:
+    def test_export_tasks_with_project_filter(self, mock_run, mock_popen) -> None:
         """Test exporting tasks filtered by project."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         task_json = json.dumps(
@@ -201,20 +258,46 @@ class TestTaskWarrior:
                 }
             ]
         )
-        mock_run.return_value = Mock(stdout=task_json, returncode=0)
+        mock_export_output(mock_popen, task_json.encode())
 
         tasks = tw.export_tasks(project="work")
 
         assert len(tasks) == 1
         assert tasks[0].project == "work"
         # Check that project filter was used
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert "project:work" in call_args
 
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_export_tasks_with_projects_filter(self, mock_run, mock_popen) -> None:
+        """Test exporting several projects with a single command."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        mock_export_output(mock_popen, b"[]")
+        tw.export_tasks(projects=["work", "home"], filter_args=["+next"])
+
+        call_args = mock_popen.call_args[0][0]
+        assert call_args[-7:] == [
+            "(",
+            "project:work",
+            "or",
+            "project:home",
+            ")",
+            "+next",
+            "export",
+        ]
+
+        mock_export_output(mock_popen, b"[]")
+        tw.export_tasks(projects=["work"])
+        assert mock_popen.call_args[0][0][-2:] == ["project:work", "export"]
+
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_export_tasks_with_status_filter(self, mock_run) -> None:
+    def test_export_tasks_with_status_filter(self, mock_run, mock_popen) -> None:
         """Test exporting tasks filtered by status."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         task_json = json.dumps(
@@ -227,23 +310,91 @@ class TestTaskWarrior:
                 }
             ]
         )
-        mock_run.return_value = Mock(stdout=task_json, returncode=0)
+        mock_export_output(mock_popen, task_json.encode())
 
         tasks = tw.export_tasks(status="completed")
 
         assert len(tasks) == 1
         assert tasks[0].status == "completed"
         # Check that status filter was used
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert "status:completed" in call_args
 
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_iter_export_tasks(self, mock_run, mock_popen) -> None:
+        """Test streaming tasks from an export, array or line-delimited."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        tasks_data = [
+            {
+                "uuid": f"12345678-1234-1234-1234-12345678901{i}",
+                "description": f"Task {i}",
+                "status": "pending",
+                "entry": "20241117T100000Z",
+            }
+            for i in range(3)
+        ]
+
+        for output in (
+            json.dumps(tasks_data, indent=2),
+            "\n".join(json.dumps(t) for t in tasks_data),
+        ):
+            mock_export_output(mock_popen, output.encode())
+            tasks = tw.iter_export_tasks(project="work")
+
+            assert [t.description for t in tasks] == ["Task 0", "Task 1", "Task 2"]
+
+    @patch("twcaldav.taskwarrior._READ_SIZE", 5)
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_export_tasks_json_decode_error(self, mock_run) -> None:
+    def test_iter_export_tasks_small_reads(self, mock_run, mock_popen) -> None:
+        """Test decoding an export whose elements span several reads."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        tasks_data = [
+            {
+                "uuid": f"uuid-{i}",
+                "description": f"Tâche ✓ {i}",
+                "status": "pending",
+                "entry": "20241117T100000Z",
+                "urgency": 1.5 + i,
+            }
+            for i in range(3)
+        ]
+        output = json.dumps(tasks_data, ensure_ascii=False).encode("utf-8")
+        mock_export_output(mock_popen, output)
+
+        tasks = list(tw.iter_export_tasks())
+
+        assert [t.description for t in tasks] == [
+            "Tâche ✓ 0",
+            "Tâche ✓ 1",
+            "Tâche ✓ 2",
+        ]
+
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_export_tasks_truncated_json(self, mock_run, mock_popen) -> None:
+        """Test handling of a truncated JSON array from TaskWarrior."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        mock_export_output(mock_popen, b'[{"uuid": "abc"')
+
+        with pytest.raises(TaskWarriorError, match="Failed to parse"):
+            tw.export_tasks()
+
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_export_tasks_json_decode_error(self, mock_run, mock_popen) -> None:
         """Test handling of invalid JSON from TaskWarrior."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
-        mock_run.return_value = Mock(stdout="invalid json", returncode=0)
+        mock_export_output(mock_popen, b"invalid json")
 
         with pytest.raises(TaskWarriorError, match="Failed to parse"):
             tw.export_tasks()
@@ -251,7 +402,7 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_import_tasks(self, mock_run) -> None:
         """Test importing tasks."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         tasks = [
@@ -263,7 +414,7 @@ class TestTaskWarrior:
             )
         ]
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
         tw.import_tasks(tasks)
 
         # Check that import was called with correct JSON
@@ -271,10 +422,41 @@ class TestTaskWarrior:
         assert call_args[0][0][-1] == "import"
         assert call_args[1]["input"] is not None
 
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_commands_exchange_utf8_bytes(self, mock_run, mock_popen) -> None:
+        """Test that command input and output are UTF-8 encoded bytes."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        task_json = json.dumps(
+            [
+                {
+                    "uuid": "12345678-1234-1234-1234-123456789012",
+                    "description": "Café ☕",
+                    "status": "pending",
+                    "entry": "20241117T100000Z",
+                }
+            ],
+            ensure_ascii=False,
+        )
+        mock_export_output(mock_popen, task_json.encode("utf-8"))
+
+        tasks = tw.export_tasks()
+        assert tasks[0].description == "Café ☕"
+
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
+        tw.import_tasks(tasks)
+
+        stdin = mock_run.call_args.kwargs["input"]
+        assert isinstance(stdin, bytes)
+        assert json.loads(stdin.decode("utf-8"))[0]["description"] == "Café ☕"
+        assert "text" not in mock_run.call_args.kwargs
+
     @patch("subprocess.run")
     def test_import_tasks_empty(self, mock_run) -> None:
         """Test importing empty task list."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         tw.import_tasks([])
@@ -285,7 +467,7 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_create_task(self, mock_run) -> None:
         """Test creating a single task."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         task = Task(
@@ -295,7 +477,7 @@ class TestTaskWarrior:
             entry=datetime(2024, 11, 17, 10, 0, 0, tzinfo=UTC),
         )
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
         tw.create_task(task)
 
         # Should have called import
@@ -305,10 +487,10 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_modify_task(self, mock_run) -> None:
         """Test modifying a task."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
         tw.modify_task(
             "12345678-1234-1234-1234-123456789012",
             {"description": "Updated task", "priority": "H"},
@@ -321,13 +503,85 @@ class TestTaskWarrior:
         assert any("description:" in arg for arg in call_args)
         assert any("priority:" in arg for arg in call_args)
 
+    @patch("subprocess.run")
+    def test_modify_tasks(self, mock_run) -> None:
+        """Test modifying several tasks with one export and one import."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        exported = [
+            {
+                "uuid": f"uuid-{i}",
+                "description": f"Task {i}",
+                "status": "pending",
+                "entry": "20241117T100000Z",
+                "custom_uda": "keep",
+            }
+            for i in range(2)
+        ]
+        mock_run.reset_mock()
+        mock_run.side_effect = [
+            Mock(stdout=json.dumps(exported).encode(), returncode=0),
+            Mock(stdout=b"", returncode=0),
+        ]
+
+        tw.modify_tasks(
+            {"uuid-0": {"caldav_uid": "cd-0"}, "uuid-1": {"caldav_uid": "cd-1"}}
+        )
+
+        assert mock_run.call_count == 2
+        export_args = mock_run.call_args_list[0][0][0]
+        assert export_args[-3:] == ["uuid-0", "uuid-1", "export"]
+        import_args = mock_run.call_args_list[1][0][0]
+        assert "import" in import_args
+        imported = json.loads(mock_run.call_args_list[1].kwargs["input"])
+        assert [t["caldav_uid"] for t in imported] == ["cd-0", "cd-1"]
+        assert all(t["custom_uda"] == "keep" for t in imported)
+
+    @patch("subprocess.run")
+    def test_modify_tasks_missing(self, mock_run) -> None:
+        """Test that unknown tasks are reported while the others are modified."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        exported = [
+            {
+                "uuid": "uuid-1",
+                "description": "Task 1",
+                "status": "pending",
+                "entry": "20241117T100000Z",
+            }
+        ]
+        mock_run.reset_mock()
+        mock_run.side_effect = [
+            Mock(stdout=json.dumps(exported).encode(), returncode=0),
+            Mock(stdout=b"", returncode=0),
+        ]
+
+        missing = tw.modify_tasks(
+            {"uuid-0": {"caldav_uid": "cd-0"}, "uuid-1": {"caldav_uid": "cd-1"}}
+        )
+
+        assert missing == ["uuid-0"]
+        imported = json.loads(mock_run.call_args_list[1].kwargs["input"])
+        assert [t["uuid"] for t in imported] == ["uuid-1"]
+        assert imported[0]["caldav_uid"] == "cd-1"
+
+        # Nothing is imported when no task is found
+        mock_run.reset_mock()
+        mock_run.side_effect = None
+        mock_run.return_value = Mock(stdout=b"[]", returncode=0)
+
+        assert tw.modify_tasks({"uuid-0": {"caldav_uid": "cd-0"}}) == ["uuid-0"]
+        mock_run.assert_called_once()
+
     @patch("subprocess.run")
     def test_delete_task(self, mock_run) -> None:
         """Test deleting a task."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
         tw.delete_task("12345678-1234-1234-1234-123456789012")
 
         # Check that delete command was called
@@ -336,13 +590,38 @@ class TestTaskWarrior:
         assert "12345678-1234-1234-1234-123456789012" in call_args
         assert "rc.confirmation=off" in call_args
 
+    @patch("subprocess.run")
+    def test_delete_tasks(self, mock_run) -> None:
+        """Test deleting several tasks with one command."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        mock_run.reset_mock()
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
+        tw.delete_tasks(["uuid-1", "uuid-2"])
+
+        mock_run.assert_called_once()
+        call_args = mock_run.call_args[0][0]
+        assert call_args[-5:] == [
+            "rc.confirmation=off",
+            "rc.bulk=0",
+            "uuid-1",
+            "uuid-2",
+            "delete",
+        ]
+        assert mock_run.call_args.kwargs["stdin"] is subprocess.DEVNULL
+
+        mock_run.reset_mock()
+        tw.delete_tasks([])
+        mock_run.assert_not_called()
+
     @patch("subprocess.run")
     def test_add_annotation(self, mock_run) -> None:
         """Test adding an annotation."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_run.return_value = Mock(stdout=b"", returncode=0)
         tw.add_annotation("12345678-1234-1234-1234-123456789012", "Test annotation")
 
         # Check that annotate command was called
@@ -351,10 +630,11 @@ class TestTaskWarrior:
         assert "12345678-1234-1234-1234-123456789012" in call_args
         assert "Test annotation" in call_args
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_task_by_uuid(self, mock_run) -> None:
+    def test_get_task_by_uuid(self, mock_run, mock_popen) -> None:
         """Test getting a specific task by UUID."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         task_json = json.dumps(
@@ -367,28 +647,30 @@ class TestTaskWarrior:
                 }
             ]
         )
-        mock_run.return_value = Mock(stdout=task_json, returncode=0)
+        mock_export_output(mock_popen, task_json.encode())
 
         task = tw.get_task_by_uuid("12345678-1234-1234-1234-123456789012")
 
         assert task is not None
         assert task.uuid == "12345678-1234-1234-1234-123456789012"
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_task_by_uuid_not_found(self, mock_run) -> None:
+    def test_get_task_by_uuid_not_found(self, mock_run, mock_popen) -> None:
         """Test getting a non-existent task."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
-        mock_run.return_value = Mock(stdout="", returncode=0)
+        mock_export_output(mock_popen, b"")
         task = tw.get_task_by_uuid("nonexistent-uuid")
 
         assert task is None
 
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_get_tasks_by_project(self, mock_run) -> None:
+    def test_get_tasks_by_project(self, mock_run, mock_popen) -> None:
         """Test getting tasks by project."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         task_json = json.dumps(
@@ -402,7 +684,7 @@ class TestTaskWarrior:
                 }
             ]
         )
-        mock_run.return_value = Mock(stdout=task_json, returncode=0)
+        mock_export_output(mock_popen, task_json.encode())
 
         tasks = tw.get_tasks_by_project("work")
 
@@ -412,12 +694,36 @@ class TestTaskWarrior:
     @patch("subprocess.run")
     def test_command_failure(self, mock_run) -> None:
         """Test handling of command failure."""
-        mock_run.return_value = Mock(stdout="3.0.0", returncode=0)
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
         tw = TaskWarrior()
 
         mock_run.side_effect = subprocess.CalledProcessError(
-            1, ["task", "export"], stderr="Error occurred"
+            1, ["task", "delete"], stderr=b"Error occurred"
         )
 
-        with pytest.raises(TaskWarriorError, match="command failed"):
+        with pytest.raises(TaskWarriorError, match="command failed: Error occurred"):
+            tw.delete_task("12345678-1234-1234-1234-123456789012")
+
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_export_command_failure(self, mock_run, mock_popen) -> None:
+        """Test handling of a failing streamed export."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        mock_export_output(mock_popen, b"", returncode=2, stderr=b"Error occurred")
+
+        with pytest.raises(TaskWarriorError, match="command failed: Error occurred"):
+            tw.export_tasks()
+
+    @patch("subprocess.Popen")
+    @patch("subprocess.run")
+    def test_export_command_failure_after_array(self, mock_run, mock_popen) -> None:
+        """Test that an export failing after a complete array still raises."""
+        mock_run.return_value = Mock(stdout=b"3.0.0", returncode=0)
+        tw = TaskWarrior()
+
+        mock_export_output(mock_popen, b"[]\n", returncode=2, stderr=b"Error occurred")
+
+        with pytest.raises(TaskWarriorError, match="command failed: Error occurred"):
             tw.export_tasks()